@@ -1,31 +1,13 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from dataclasses import dataclass
+from tkinter import ttk, messagebox
+from datetime import date
+from pathlib import Path
 from typing import List
 import os
 
-
-@dataclass
-class Empleado:
-    nombre: str
-    apellidos: str
-    cargo: str
-    genero: str
-    salario_dia: float
-    dias_trabajados: int
-    otros_ingresos: float
-    pagos_salud: float
-    aporte_pension: float
-
-    def salario_mensual(self) -> float:
-        """
-        Salario mensual = (días trabajados * sueldo por día)
-                          + otros ingresos
-                          - pagos por salud
-                          - aporte pensiones
-        """
-        return (self.dias_trabajados * self.salario_dia) + \
-               self.otros_ingresos - self.pagos_salud - self.aporte_pension
+import instrumentacion
+from ejecutor import EjecutorTareas
+from nomina import Empleado, HistorialNomina, escribir_nomina, total_nomina
 
 
 class NominaApp(tk.Tk):
@@ -36,6 +18,10 @@ class NominaApp(tk.Tk):
         self.geometry("600x400")
 
         self.empleados: List[Empleado] = []
+        self.ejecutor = EjecutorTareas(self)
+        # Cada período guardado queda como instantánea inmutable en esta carpeta
+        self.historial = HistorialNomina(Path("historial_nomina"))
+        self.protocol("WM_DELETE_WINDOW", self.cerrar)
 
         # Barra de menús
         barra_menu = tk.Menu(self)
@@ -47,6 +33,13 @@ class NominaApp(tk.Tk):
         menu_opciones.add_command(label="Guardar archivo",
                                   command=self.guardar_archivo_nomina)
         barra_menu.add_cascade(label="Opciones", menu=menu_opciones)
+
+        menu_periodos = tk.Menu(barra_menu, tearoff=0)
+        menu_periodos.add_command(label="Guardar período…", command=self.guardar_periodo)
+        menu_periodos.add_command(label="Cargar período…", command=self.cargar_periodo)
+        menu_periodos.add_command(label="Comparar períodos…", command=self.comparar_periodos)
+        menu_periodos.add_command(label="Tendencia del costo", command=self.tendencia_costo)
+        barra_menu.add_cascade(label="Períodos", menu=menu_periodos)
         self.config(menu=barra_menu)
 
         # Mensaje principal
@@ -166,7 +159,7 @@ class NominaApp(tk.Tk):
                 cargo=cargo,
                 genero=genero,
                 salario_dia=salario_dia,
-                dias_trabajados=dias_trajados,
+                dias_trabajados=dias_trabajados,
                 otros_ingresos=otros_ingresos,
                 pagos_salud=salud,
                 aporte_pension=pension
@@ -212,19 +205,17 @@ class NominaApp(tk.Tk):
         tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        total_nomina = 0.0
         for emp in self.empleados:
-            salario = emp.salario_mensual()
-            total_nomina += salario
             tree.insert("", tk.END, values=(
                 emp.nombre,
                 emp.apellidos,
                 emp.cargo,
                 emp.genero,
-                f"{salario:.2f}"
+                f"{emp.salario_mensual():.2f}"
             ))
 
-        lbl_total = tk.Label(win, text=f"Total de la nómina: {total_nomina:.2f}",
+        total = total_nomina(self.empleados)   # medido como "nomina.total"
+        lbl_total = tk.Label(win, text=f"Total de la nómina: {total:.2f}",
                              font=("Arial", 12), pady=10)
         lbl_total.pack(side="bottom", fill="x")
 
@@ -234,6 +225,8 @@ class NominaApp(tk.Tk):
             messagebox.showinfo("Información", "No hay empleados para guardar.")
             return
 
+        from tkinter import filedialog  # se carga solo al guardar
+
         carpeta = filedialog.askdirectory(
             title="Seleccione la carpeta donde guardar Nómina.txt"
         )
@@ -242,37 +235,141 @@ class NominaApp(tk.Tk):
 
         ruta_archivo = os.path.join(carpeta, "Nomina.txt")
 
-        try:
-            total_nomina = 0.0
-            with open(ruta_archivo, "w", encoding="utf-8") as f:
-                f.write("NÓMINA DE EMPLEADOS\n")
-                f.write("===================\n\n")
-
-                for i, emp in enumerate(self.empleados, start=1):
-                    salario = emp.salario_mensual()
-                    total_nomina += salario
-                    f.write(f"Empleado {i}:\n")
-                    f.write(f"  Nombre: {emp.nombre}\n")
-                    f.write(f"  Apellidos: {emp.apellidos}\n")
-                    f.write(f"  Cargo: {emp.cargo}\n")
-                    f.write(f"  Género: {emp.genero}\n")
-                    f.write(f"  Salario por día: {emp.salario_dia:.2f}\n")
-                    f.write(f"  Días trabajados: {emp.dias_trabajados}\n")
-                    f.write(f"  Otros ingresos: {emp.otros_ingresos:.2f}\n")
-                    f.write(f"  Pagos por salud: {emp.pagos_salud:.2f}\n")
-                    f.write(f"  Aporte pensiones: {emp.aporte_pension:.2f}\n")
-                    f.write(f"  Salario mensual: {salario:.2f}\n")
-                    f.write("\n")
-
-                f.write("===================\n")
-                f.write(f"TOTAL NÓMINA: {total_nomina:.2f}\n")
-
-            messagebox.showinfo("Éxito", f"Nómina guardada en:\n{ruta_archivo}")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Ocurrió un error al guardar el archivo:\n{e}")
+        # Se escribe en segundo plano una copia de la lista; guardar dos veces
+        # seguidas en la misma ruta se une a la escritura en curso.
+        self.ejecutor.enviar(
+            escribir_nomina, list(self.empleados), ruta_archivo,
+            clave=("nomina", ruta_archivo),
+            al_terminar=lambda _: messagebox.showinfo(
+                "Éxito", f"Nómina guardada en:\n{ruta_archivo}"),
+            al_fallar=lambda e: messagebox.showerror(
+                "Error", f"Ocurrió un error al guardar el archivo:\n{e}"),
+        )
+
+    # ----------------- HISTORIAL DE PERÍODOS -----------------
+    def _pedir_periodo(self, titulo: str, inicial: str):
+        from tkinter import simpledialog  # se carga solo al pedir el período
+
+        return simpledialog.askstring(titulo, "Período (AAAA-MM):",
+                                      initialvalue=inicial, parent=self)
+
+    def _error_periodo(self, error: BaseException):
+        messagebox.showerror("Error", str(error))
+
+    def guardar_periodo(self):
+        if not self.empleados:
+            messagebox.showinfo("Información", "No hay empleados para guardar.")
+            return
+        periodo = self._pedir_periodo("Guardar período", f"{date.today():%Y-%m}")
+        if not periodo:
+            return
+        # Los ids se asignan aquí (hilo de Tk); el archivo se escribe en segundo plano
+        self.historial.asignar_ids(self.empleados)
+        self.ejecutor.enviar(
+            self.historial.guardar, periodo, list(self.empleados),
+            clave=("periodo", periodo),
+            al_terminar=lambda p: messagebox.showinfo(
+                "Éxito", f"Período {p.periodo} guardado ({p.filas} empleados)."),
+            al_fallar=self._error_periodo,
+        )
+
+    def cargar_periodo(self):
+        periodos = self.historial.periodos()
+        if not periodos:
+            messagebox.showinfo("Información", "No hay períodos guardados.")
+            return
+        periodo = self._pedir_periodo("Cargar período", periodos[-1])
+        if not periodo:
+            return
+
+        def al_terminar(empleados):
+            self.empleados = empleados
+            messagebox.showinfo("Éxito", f"{len(empleados)} empleados cargados de {periodo}.")
+
+        self.ejecutor.enviar(self.historial.cargar, periodo, clave=("cargar", periodo),
+                             al_terminar=al_terminar, al_fallar=self._error_periodo)
+
+    def comparar_periodos(self):
+        periodos = self.historial.periodos()
+        if len(periodos) < 2:
+            messagebox.showinfo("Información", "Se necesitan al menos dos períodos guardados.")
+            return
+        desde = self._pedir_periodo("Comparar desde", periodos[-2])
+        hasta = desde and self._pedir_periodo("Comparar hasta", periodos[-1])
+        if not hasta:
+            return
+
+        def comparar():
+            diferencia = self.historial.comparar(desde, hasta)
+            mayores = diferencia.mayores(500)
+            nombres = self.historial.nombres(diferencia.hasta, [m[0] for m in mayores])
+            return diferencia, mayores, nombres
+
+        self.ejecutor.enviar(comparar, clave=("comparar", desde, hasta),
+                             al_terminar=lambda r: self._mostrar_comparacion(*r),
+                             al_fallar=self._error_periodo)
+
+    def _mostrar_comparacion(self, diferencia, mayores, nombres):
+        win = tk.Toplevel(self)
+        win.title(f"Nómina {diferencia.desde} → {diferencia.hasta}")
+        win.geometry("760x420")
+
+        tk.Label(win, text=diferencia.texto_resumen(), wraplength=740,
+                 justify="left", pady=6).pack(side="top", fill="x")
+
+        columns = ("id", "nombre", "antes", "despues", "cambio")
+        tree = ttk.Treeview(win, columns=columns, show="headings")
+        for col, texto, ancho in [("id", "Id", 60), ("nombre", "Empleado", 220),
+                                  ("antes", diferencia.desde, 140),
+                                  ("despues", diferencia.hasta, 140),
+                                  ("cambio", "Cambio", 120)]:
+            tree.heading(col, text=texto)
+            tree.column(col, width=ancho, anchor="w" if col == "nombre" else "e")
+
+        scrollbar = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        for id_, antes, despues, cambio in mayores:
+            tree.insert("", tk.END, values=(id_, nombres[id_], f"{antes:.2f}",
+                                            f"{despues:.2f}", f"{cambio:+.2f}"))
+
+    def tendencia_costo(self):
+        if not self.historial.periodos():
+            messagebox.showinfo("Información", "No hay períodos guardados.")
+            return
+        self.ejecutor.enviar(self.historial.tendencia, clave="tendencia",
+                             al_terminar=self._mostrar_tendencia,
+                             al_fallar=self._error_periodo)
+
+    def _mostrar_tendencia(self, tendencia):
+        win = tk.Toplevel(self)
+        win.title("Tendencia del costo de nómina")
+        win.geometry("480x400")
+
+        columns = ("periodo", "total", "variacion")
+        tree = ttk.Treeview(win, columns=columns, show="headings")
+        tree.heading("periodo", text="Período")
+        tree.heading("total", text="Costo total")
+        tree.heading("variacion", text="Variación")
+        tree.column("periodo", width=100)
+        tree.column("total", width=180, anchor="e")
+        tree.column("variacion", width=160, anchor="e")
+        tree.pack(fill="both", expand=True)
+
+        anterior = None
+        for periodo, total in tendencia:
+            variacion = "" if anterior is None else f"{total - anterior:+.2f}"
+            tree.insert("", tk.END, values=(periodo, f"{total:.2f}", variacion))
+            anterior = total
+
+    def cerrar(self):
+        self.ejecutor.cerrar(cancelar=False)   # termina de escribir Nomina.txt
+        self.destroy()
 
 
 if __name__ == "__main__":
+    instrumentacion.configurar_desde_entorno()
     app = NominaApp()
     app.mainloop()
@@ -1,12 +1,19 @@
 import tkinter as tk
-from tkinter import messagebox
-from tkcalendar import DateEntry  # pip install tkcalendar
+from tkinter import messagebox, ttk
+from pathlib import Path
+
+from agenda import AgendaContactos, crear_contacto
 
 
 class AgendaApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, ruta_agenda: Path = Path("agenda.db")):
         super().__init__()
 
+        # Almacenamiento persistente; la Listbox es solo una vista
+        self.agenda = AgendaContactos(ruta_agenda)
+        self.ids_visibles = []
+        self.protocol("WM_DELETE_WINDOW", self.cerrar)
+
         self.title("Agenda de contactos")
         self.geometry("500x500")
 
@@ -33,7 +40,9 @@ class AgendaApp(tk.Tk):
         tk.Entry(frame, textvariable=self.apellidos_var).grid(row=fila, column=1, sticky="we")
         fila += 1
 
-        # Fecha de nacimiento (DatePicker)
+        # Fecha de nacimiento (DatePicker); tkcalendar se carga al abrir la ventana
+        from tkcalendar import DateEntry  # pip install tkcalendar
+
         tk.Label(frame, text="Fecha de nacimiento:").grid(row=fila, column=0, sticky="e", pady=5)
         self.fecha_nacimiento = DateEntry(frame, date_pattern="dd/mm/yyyy")
         self.fecha_nacimiento.grid(row=fila, column=1, sticky="we")
@@ -64,9 +73,75 @@ class AgendaApp(tk.Tk):
         tk.Label(self, text="Contactos agregados:", font=("Arial", 12))\
             .pack(anchor="w", padx=10)
 
+        # ---- BÚSQUEDA ----
+        frame_buscar = tk.Frame(self, padx=10)
+        frame_buscar.pack(fill="x")
+
+        self.criterio_var = tk.StringVar(value="Nombre")
+        self.buscar_var = tk.StringVar()
+        ttk.Combobox(frame_buscar, textvariable=self.criterio_var, width=16, state="readonly",
+                     values=("Nombre", "Mes de cumpleaños", "Dominio de correo"))\
+            .pack(side="left")
+        tk.Entry(frame_buscar, textvariable=self.buscar_var).pack(side="left", fill="x",
+                                                                 expand=True, padx=5)
+        tk.Button(frame_buscar, text="Buscar", command=self.buscar).pack(side="left")
+        tk.Button(frame_buscar, text="Todos", command=self.mostrar_todos).pack(side="left", padx=(5, 0))
+        tk.Button(frame_buscar, text="Cumpleaños (30 días)",
+                  command=self.mostrar_cumpleanos).pack(side="left", padx=(5, 0))
+
         self.lista = tk.Listbox(self, height=12)
         self.lista.pack(fill="both", expand=True, padx=10, pady=10)
 
+        self.mostrar_todos()
+
+    # ---- VISTA SOBRE EL ALMACENAMIENTO ----
+    def _mostrar(self, contactos):
+        self.lista.delete(0, tk.END)
+        self.ids_visibles = [c.id for c in contactos]
+        if contactos:
+            # Una sola inserción para toda la lista (rápido con muchos contactos)
+            self.lista.insert(tk.END, *(c.texto_lista() for c in contactos))
+
+    def mostrar_todos(self):
+        self.buscar_var.set("")
+        self._vista = lambda: self._mostrar(self.agenda.todos())
+        self._vista()
+
+    def buscar(self):
+        texto = self.buscar_var.get().strip()
+        if not texto:
+            self.mostrar_todos()
+            return
+        criterio = self.criterio_var.get()
+        try:
+            if criterio == "Mes de cumpleaños":
+                if not texto.isdigit():
+                    raise ValueError("El mes debe ser un número entre 1 y 12.")
+                filtro = {"mes_cumpleanos": int(texto)}
+            elif criterio == "Dominio de correo":
+                filtro = {"dominio": texto}
+            else:
+                filtro = {"nombre": texto}
+            contactos = self.agenda.buscar(**filtro)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self._vista = lambda: self._mostrar(self.agenda.buscar(**filtro))
+        self._mostrar(contactos)
+
+    def mostrar_cumpleanos(self):
+        self._vista = self.mostrar_cumpleanos
+        proximos = self.agenda.proximos_cumpleanos(30)
+        self.lista.delete(0, tk.END)
+        self.ids_visibles = [c.id for _, c in proximos]
+        if proximos:
+            self.lista.insert(tk.END, *(f"{fecha.strftime('%d/%m')} → {c.texto_lista()}"
+                                        for fecha, c in proximos))
+
+    def cerrar(self):
+        self.agenda.cerrar()
+        self.destroy()
+
     def agregar_contacto(self):
         nombres = self.nombres_var.get().strip()
         apellidos = self.apellidos_var.get().strip()
@@ -75,16 +150,17 @@ class AgendaApp(tk.Tk):
         telefono = self.telefono_var.get().strip()
         correo = self.correo_var.get().strip()
 
-        # Validación: todos obligatorios
-        if not (nombres and apellidos and fecha and direccion and telefono and correo):
-            messagebox.showerror("Error", "Todos los campos son obligatorios.")
+        # Validación: todos obligatorios y fecha válida
+        try:
+            contacto = crear_contacto(nombres, apellidos, fecha, direccion, telefono, correo)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
             return
 
-        # Texto que se muestra en la lista
-        contacto = f"{nombres} {apellidos} | {fecha} | {telefono} | {correo}"
-
-        # Insertar en Listbox
-        self.lista.insert(tk.END, contacto)
+        # Guardar en la agenda y volver a consultar la vista actual (todos,
+        # búsqueda o cumpleaños): el contacto solo aparece si le corresponde
+        self.agenda.agregar(contacto)
+        self._vista()
 
         # Limpiar campos (dejo la fecha igual, puedes cambiarlo si quieres)
         self.nombres_var.set("")
@@ -0,0 +1,357 @@
+# agenda.py
+# Modelo y almacenamiento persistente de la agenda de contactos (sin Tkinter).
+
+import argparse
+import random
+import sqlite3
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fechas import parsear_fecha
+
+
+# -------------------- MODELO --------------------
+
+@dataclass(slots=True)
+class Contacto:
+    nombres: str
+    apellidos: str
+    fecha_nacimiento: date
+    direccion: str
+    telefono: str
+    correo: str
+    id: Optional[int] = None
+
+    @property
+    def dominio(self) -> str:
+        """Dominio del correo en minúsculas ('' si no tiene '@')."""
+        return self.correo.rpartition("@")[2].lower() if "@" in self.correo else ""
+
+    def texto_lista(self) -> str:
+        """Texto que se muestra en la lista de la agenda."""
+        return (f"{self.nombres} {self.apellidos} | "
+                f"{self.fecha_nacimiento.strftime('%d/%m/%Y')} | "
+                f"{self.telefono} | {self.correo}")
+
+
+def crear_contacto(nombres: str, apellidos: str, fecha: str, direccion: str,
+                   telefono: str, correo: str) -> Contacto:
+    """Valida los datos del formulario y construye un Contacto."""
+    campos = [c.strip() for c in (nombres, apellidos, fecha, direccion, telefono, correo)]
+    if not all(campos):
+        raise ValueError("Todos los campos son obligatorios.")
+    nacimiento = parsear_fecha(campos[2])
+    if nacimiento is None:
+        raise ValueError("La fecha debe tener formato dd/mm/aaaa y ser válida.")
+    return Contacto(campos[0], campos[1], nacimiento, campos[3], campos[4], campos[5])
+
+
+# -------------------- ÍNDICE DE CUMPLEAÑOS --------------------
+
+def _bisiesto(anio: int) -> bool:
+    return anio % 4 == 0 and (anio % 100 != 0 or anio % 400 == 0)
+
+
+def clave_cumpleanos(mes: int, dia: int) -> int:
+    """Día del año (1 – 366) de (mes, día) en un calendario bisiesto."""
+    return date(2000, mes, dia).timetuple().tm_yday
+
+
+_CLAVE_29_FEB = clave_cumpleanos(2, 29)
+
+
+def fecha_celebracion(clave: int, anio: int) -> date:
+    """
+    Fecha en que se celebra un cumpleaños con esa clave en 'anio'.
+    Los nacidos el 29 de febrero lo celebran el 28 en años no bisiestos.
+    """
+    if clave == _CLAVE_29_FEB and not _bisiesto(anio):
+        return date(anio, 2, 28)
+    dia_2000 = date(2000, 1, 1) + timedelta(days=clave - 1)
+    return date(anio, dia_2000.month, dia_2000.day)
+
+
+class IndiceCumpleanos:
+    """
+    Índice ordenado por clave de cumpleaños (mes, día) → ids de contacto.
+
+    Las consultas por rango usan búsqueda binaria: O(log n + k), donde k es
+    la cantidad de resultados.
+    """
+    def __init__(self, pares: Iterable[Tuple[int, int]] = ()):
+        # 'pares' (clave, id) ya ordenados por clave, p. ej. desde el índice SQL
+        self._claves = array("H")
+        self._ids: List[int] = []
+        for clave, id_ in pares:
+            self._claves.append(clave)
+            self._ids.append(id_)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def agregar(self, id_: int, nacimiento: date) -> None:
+        clave = clave_cumpleanos(nacimiento.month, nacimiento.day)
+        pos = bisect_right(self._claves, clave)
+        self._claves.insert(pos, clave)
+        self._ids.insert(pos, id_)
+
+    def _rango(self, clave_ini: int, clave_fin: int) -> Tuple[int, int]:
+        return (bisect_left(self._claves, clave_ini),
+                bisect_right(self._claves, clave_fin))
+
+    def proximos(self, desde: date, dias: int) -> List[Tuple[date, int]]:
+        """
+        Cumpleaños que se celebran entre 'desde' y 'desde + dias - 1'
+        (ambos incluidos), en orden de fecha. Cruza fin de año sin problema.
+        """
+        resultado: List[Tuple[date, int]] = []
+        if dias <= 0:
+            return resultado
+        fin = desde + timedelta(days=dias - 1)
+        inicio = desde
+        while inicio <= fin:
+            # Tramo dentro de un mismo año calendario
+            tramo_fin = min(fin, date(inicio.year, 12, 31))
+            clave_ini = clave_cumpleanos(inicio.month, inicio.day)
+            clave_fin = clave_cumpleanos(tramo_fin.month, tramo_fin.day)
+            if not _bisiesto(inicio.year) and tramo_fin == date(inicio.year, 2, 28):
+                clave_fin = _CLAVE_29_FEB      # el 29/02 se celebra el 28/02
+            a, b = self._rango(clave_ini, clave_fin)
+            clave_previa, fecha = -1, None
+            for i in range(a, b):
+                if self._claves[i] != clave_previa:
+                    clave_previa = self._claves[i]
+                    fecha = fecha_celebracion(clave_previa, inicio.year)
+                resultado.append((fecha, self._ids[i]))
+            inicio = tramo_fin + timedelta(days=1)
+        return resultado
+
+    def calendario(self, anio: int) -> Dict[date, List[int]]:
+        """Calendario completo de cumpleaños de 'anio' en un solo recorrido ordenado."""
+        cal: Dict[date, List[int]] = {}
+        clave_previa, fecha = -1, None
+        for clave, id_ in zip(self._claves, self._ids):
+            if clave != clave_previa:
+                clave_previa, fecha = clave, fecha_celebracion(clave, anio)
+            cal.setdefault(fecha, []).append(id_)
+        return cal
+
+
+# -------------------- ALMACENAMIENTO --------------------
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS contactos (
+    id               INTEGER PRIMARY KEY,
+    nombres          TEXT NOT NULL,
+    apellidos        TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL,          -- ISO aaaa-mm-dd
+    direccion        TEXT NOT NULL,
+    telefono         TEXT NOT NULL,
+    correo           TEXT NOT NULL,
+    nombres_busqueda   TEXT NOT NULL,        -- en minúsculas, para buscar por prefijo
+    apellidos_busqueda TEXT NOT NULL,
+    mes              INTEGER NOT NULL,
+    dia              INTEGER NOT NULL,
+    dominio          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_contactos_nombres   ON contactos (nombres_busqueda);
+CREATE INDEX IF NOT EXISTS ix_contactos_apellidos ON contactos (apellidos_busqueda);
+CREATE INDEX IF NOT EXISTS ix_contactos_cumple    ON contactos (mes, dia);
+CREATE INDEX IF NOT EXISTS ix_contactos_dominio   ON contactos (dominio);
+"""
+
+_COLUMNAS = "id, nombres, apellidos, fecha_nacimiento, direccion, telefono, correo"
+_INSERTAR = (
+    "INSERT INTO contactos (nombres, apellidos, fecha_nacimiento, direccion, telefono, "
+    "correo, nombres_busqueda, apellidos_busqueda, mes, dia, dominio) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _fila(c: Contacto) -> Tuple:
+    return (c.nombres, c.apellidos, c.fecha_nacimiento.isoformat(), c.direccion,
+            c.telefono, c.correo, c.nombres.lower(), c.apellidos.lower(),
+            c.fecha_nacimiento.month, c.fecha_nacimiento.day, c.dominio)
+
+
+def _contacto(fila: Tuple) -> Contacto:
+    id_, nombres, apellidos, fecha, direccion, telefono, correo = fila
+    return Contacto(nombres, apellidos, date.fromisoformat(fecha), direccion,
+                    telefono, correo, id_)
+
+
+class AgendaContactos:
+    """
+    Agenda persistente en un archivo SQLite con índices por nombre,
+    apellido, día de cumpleaños (mes, día) y dominio del correo.
+    """
+    def __init__(self, ruta: Path = Path("agenda.db")):
+        self.ruta = Path(ruta)
+        self._con = sqlite3.connect(str(self.ruta))
+        self._con.executescript(_ESQUEMA)
+        self._cumpleanos: Optional[IndiceCumpleanos] = None   # se construye al usarlo
+
+    def cerrar(self) -> None:
+        self._con.close()
+
+    def __len__(self) -> int:
+        return self._con.execute("SELECT COUNT(*) FROM contactos").fetchone()[0]
+
+    # --------- escritura ---------
+
+    def agregar(self, contacto: Contacto) -> Contacto:
+        with self._con:
+            cur = self._con.execute(_INSERTAR, _fila(contacto))
+        contacto.id = cur.lastrowid
+        if self._cumpleanos is not None:
+            self._cumpleanos.agregar(contacto.id, contacto.fecha_nacimiento)
+        return contacto
+
+    def agregar_varios(self, contactos: Iterable[Contacto]) -> int:
+        """Inserta muchos contactos en una sola transacción."""
+        with self._con:
+            cur = self._con.executemany(_INSERTAR, (_fila(c) for c in contactos))
+        self._cumpleanos = None          # se reconstruye (ordenado) en la próxima consulta
+        return cur.rowcount
+
+    # --------- lectura ---------
+
+    def todos(self) -> List[Contacto]:
+        """Carga completa en orden de inserción (una sola consulta)."""
+        filas = self._con.execute(f"SELECT {_COLUMNAS} FROM contactos ORDER BY id")
+        return [_contacto(f) for f in filas]
+
+    def buscar(self, nombre: Optional[str] = None, mes_cumpleanos: Optional[int] = None,
+               dominio: Optional[str] = None, limite: Optional[int] = None) -> List[Contacto]:
+        """
+        Filtra por prefijo de nombres o apellidos, mes de cumpleaños y/o
+        dominio del correo. Todos los filtros usan índices.
+        """
+        condiciones, params = [], []
+        if nombre:
+            prefijo = nombre.strip().lower()
+            condiciones.append(
+                "((nombres_busqueda >= ? AND nombres_busqueda < ?) "
+                "OR (apellidos_busqueda >= ? AND apellidos_busqueda < ?))")
+            params += [prefijo, prefijo + "\uffff"] * 2
+        if mes_cumpleanos is not None:
+            if not 1 <= mes_cumpleanos <= 12:
+                raise ValueError("El mes debe estar entre 1 y 12.")
+            condiciones.append("mes = ?")
+            params.append(mes_cumpleanos)
+        if dominio:
+            condiciones.append("dominio = ?")
+            params.append(dominio.strip().lstrip("@").lower())
+
+        sql = f"SELECT {_COLUMNAS} FROM contactos"
+        if condiciones:
+            sql += " WHERE " + " AND ".join(condiciones)
+        sql += " ORDER BY id"
+        if limite is not None:
+            sql += " LIMIT ?"
+            params.append(limite)
+        return [_contacto(f) for f in self._con.execute(sql, params)]
+
+    def _indice_cumpleanos(self) -> IndiceCumpleanos:
+        if self._cumpleanos is None:
+            # El índice (mes, dia) de SQLite entrega las filas ya ordenadas
+            filas = self._con.execute(
+                "SELECT mes, dia, id FROM contactos ORDER BY mes, dia, id")
+            self._cumpleanos = IndiceCumpleanos(
+                (clave_cumpleanos(mes, dia), id_) for mes, dia, id_ in filas)
+        return self._cumpleanos
+
+    def _por_ids(self, ids: List[int]) -> Dict[int, Contacto]:
+        contactos: Dict[int, Contacto] = {}
+        for i in range(0, len(ids), 500):
+            lote = ids[i:i + 500]
+            marcas = ", ".join("?" * len(lote))
+            for f in self._con.execute(
+                    f"SELECT {_COLUMNAS} FROM contactos WHERE id IN ({marcas})", lote):
+                contactos[f[0]] = _contacto(f)
+        return contactos
+
+    def proximos_cumpleanos(self, dias: int = 30,
+                            desde: Optional[date] = None) -> List[Tuple[date, Contacto]]:
+        """Quién cumple años en los próximos 'dias' (incluye hoy)."""
+        pares = self._indice_cumpleanos().proximos(desde or date.today(), dias)
+        contactos = self._por_ids([id_ for _, id_ in pares])
+        return [(fecha, contactos[id_]) for fecha, id_ in pares]
+
+    def calendario_cumpleanos(self, anio: int) -> Dict[date, List[int]]:
+        """Ids de contacto por fecha de celebración durante 'anio'."""
+        return self._indice_cumpleanos().calendario(anio)
+
+
+# -------------------- BENCHMARK --------------------
+
+def benchmark_cumpleanos(n: int = 1_000_000, dias: int = 30,
+                         semilla: int = 0) -> Dict[str, float]:
+    """Índice de cumpleaños contra un recorrido lineal con n contactos."""
+    rng = random.Random(semilla)
+    nacimientos = [date(1950, 1, 1) + timedelta(days=rng.randrange(60 * 365))
+                   for _ in range(n)]
+    tiempos: Dict[str, float] = {}
+
+    t0 = time.perf_counter()
+    pares = sorted((clave_cumpleanos(f.month, f.day), i)
+                   for i, f in enumerate(nacimientos))
+    indice = IndiceCumpleanos(pares)
+    tiempos["construir"] = time.perf_counter() - t0
+
+    desde = date(2025, 12, 20)           # cruza fin de año
+    t0 = time.perf_counter()
+    encontrados = indice.proximos(desde, dias)
+    tiempos["proximos_indice"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    lineal = [i for i, f in enumerate(nacimientos)
+              if 0 <= (fecha_celebracion(clave_cumpleanos(f.month, f.day),
+                                         desde.year) - desde).days < dias
+              or 0 <= (fecha_celebracion(clave_cumpleanos(f.month, f.day),
+                                         desde.year + 1) - desde).days < dias]
+    tiempos["proximos_lineal"] = time.perf_counter() - t0
+    assert len(lineal) == len(encontrados)
+
+    t0 = time.perf_counter()
+    indice.calendario(2025)
+    tiempos["calendario_anual"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        indice.agregar(n, nacimientos[0])
+    tiempos["agregar_x1000"] = time.perf_counter() - t0
+    return tiempos
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Agenda de contactos (sin interfaz).")
+    parser.add_argument("--agenda", default="agenda.db", help="archivo de la agenda")
+    parser.add_argument("--cumpleanos", type=int, metavar="DIAS",
+                        help="listar cumpleaños de los próximos DIAS días")
+    parser.add_argument("--bench-cumpleanos", type=int, metavar="N",
+                        help="benchmark del índice de cumpleaños con N contactos")
+    args = parser.parse_args(argv)
+
+    if args.bench_cumpleanos:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("agenda_cumpleanos", n=args.bench_cumpleanos)
+        return
+    if args.cumpleanos is None:
+        parser.error("indique --cumpleanos DIAS o --bench-cumpleanos N")
+
+    agenda = AgendaContactos(Path(args.agenda))
+    try:
+        for fecha, c in agenda.proximos_cumpleanos(args.cumpleanos):
+            print(f"{fecha.strftime('%d/%m/%Y')}  {c.texto_lista()}")
+    finally:
+        agenda.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# arranque.py
+# Benchmark de arranque en frío: mide con 'python -X importtime' cuánto tarda
+# en importarse cada punto de entrada (GUI) y cada modelo sin interfaz.
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+CARPETA = Path(__file__).resolve().parent
+
+# Puntos de entrada con interfaz: se ejecutan sin __main__ (no abren ventana)
+ENTRADAS = [
+    "EJERCICIO01.py",
+    "EJERCICIO02.PY",
+    "EJERCICIO03.py",
+    "Ejercicioact6.py",
+    "ejercicio1.py",
+    "ejercicio2.py",
+    "leer_archivo.py",
+]
+
+# Modelos que deben importarse sin cargar Tkinter
+MODELOS = ["nomina", "hotel", "contactos", "figuras", "lector", "notas", "agenda", "ejecutor",
+           "duplicados"]
+
+_MARCA = "@@arranque"
+
+
+def _codigo(objetivo: str) -> str:
+    if objetivo in MODELOS:
+        carga = f"import {objetivo}"
+    else:
+        carga = f"import runpy; runpy.run_path({objetivo!r}, run_name='__arranque__')"
+    return (
+        f"import sys; sys.stderr.write('{_MARCA}\\n'); sys.stderr.flush(); {carga}; "
+        f"sys.stderr.write('{_MARCA} tk=%d\\n' % ('tkinter' in sys.modules))"
+    )
+
+
+def medir(objetivo: str) -> Dict:
+    """
+    Ejecuta un intérprete nuevo que importa 'objetivo' con -X importtime.
+    Devuelve el tiempo total de importación (µs), el tiempo de pared del
+    proceso (s), si se cargó tkinter y los módulos más pesados.
+    """
+    inicio = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _codigo(objetivo)],
+        cwd=CARPETA, capture_output=True, text=True,
+    )
+    pared = time.perf_counter() - inicio
+    if proc.returncode != 0:
+        ultima = proc.stderr.strip().splitlines()[-1:] or [""]
+        return {"error": ultima[0]}
+
+    total_us = 0
+    modulos: List[tuple] = []
+    con_tk = False
+    dentro = False
+    for linea in proc.stderr.splitlines():
+        if linea.startswith(_MARCA):
+            if dentro:
+                con_tk = linea.endswith("tk=1")
+            dentro = not dentro
+            continue
+        if not dentro or not linea.startswith("import time:"):
+            continue
+        try:
+            _, propio, acumulado, nombre = (p.strip() for p in
+                                            linea.replace("import time:", "|", 1).split("|"))
+            propio, acumulado = int(propio), int(acumulado)
+        except ValueError:
+            continue                      # encabezado de la tabla
+        crudo = linea.rsplit("|", 1)[1]
+        if not crudo.startswith("  ") and nombre != "runpy":
+            total_us += acumulado         # solo importaciones de primer nivel
+        modulos.append((propio, nombre))
+
+    modulos.sort(reverse=True)
+    return {
+        "importacion_ms": total_us / 1000.0,
+        "proceso_s": pared,
+        "carga_tkinter": con_tk,
+        "mas_pesados": [f"{n} ({us / 1000.0:.1f} ms)" for us, n in modulos[:5]],
+    }
+
+
+def ejecutar(objetivos: List[str], repeticiones: int = 5) -> Dict[str, Dict]:
+    """Mide cada objetivo varias veces y guarda la mediana."""
+    resultados: Dict[str, Dict] = {}
+    for objetivo in objetivos:
+        medidas = [medir(objetivo) for _ in range(repeticiones)]
+        if any("error" in m for m in medidas):
+            resultados[objetivo] = next(m for m in medidas if "error" in m)
+            continue
+        resultados[objetivo] = {
+            "importacion_ms": statistics.median(m["importacion_ms"] for m in medidas),
+            "proceso_s": statistics.median(m["proceso_s"] for m in medidas),
+            "carga_tkinter": medidas[0]["carga_tkinter"],
+            "mas_pesados": medidas[0]["mas_pesados"],
+        }
+    return resultados
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque en frío por módulo.")
+    parser.add_argument("objetivos", nargs="*", help="módulos o archivos (por defecto todos)")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--json", help="guardar resultados en este archivo JSON")
+    args = parser.parse_args(argv)
+
+    objetivos = args.objetivos or ENTRADAS + MODELOS
+    resultados = ejecutar(objetivos, args.repeticiones)
+
+    fallos = 0
+    for objetivo, r in resultados.items():
+        if "error" in r:
+            print(f"{objetivo:>18}: ERROR {r['error']}")
+            fallos += 1
+            continue
+        aviso = ""
+        if objetivo in MODELOS and r["carga_tkinter"]:
+            aviso = "  <-- el modelo carga tkinter"
+            fallos += 1
+        print(f"{objetivo:>18}: importación {r['importacion_ms']:7.1f} ms | "
+              f"proceso {r['proceso_s'] * 1000:7.1f} ms | "
+              f"tkinter {'sí' if r['carga_tkinter'] else 'no'}{aviso}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(resultados, indent=2, ensure_ascii=False),
+                                   encoding="utf-8")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,490 @@
+# benchmarks.py
+# Benchmarks de los caminos críticos de cada módulo con datos sintéticos
+# reproducibles. Emite JSON y, si se pide, compara contra una línea base.
+#
+# La línea base es local (no se versiona): cada quien la guarda en su
+# máquina antes de un cambio y compara después. Se comparan cocientes
+# respecto al caso 'calibracion' (Python puro, medido en la misma corrida),
+# no segundos, para que una máquina más cargada no parezca una regresión.
+#
+#   python benchmarks.py                          # tamaños 10³, 10⁴, 10⁵
+#   python benchmarks.py --tamanos 1000 1000000   # hasta 10⁶
+#   python benchmarks.py --guardar-base           # guarda benchmarks_base.json
+#   python benchmarks.py --base benchmarks_base.json --json resultados.json
+#
+# Los informes son mediciones largas de un módulo (antes/después, MB/s,
+# precisión) que no entran en la línea base:
+#
+#   python benchmarks.py --informe nomina_historial --parametro empleados=100000
+
+import argparse
+import ast
+import heapq
+import inspect
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import agenda
+import contactos
+import duplicados
+import figuras
+import lector
+import nomina
+import notas
+from contactos import ContactBook, Persona, RegistroCambios
+from duplicados import deduplicar, generar_registros
+from ejecutor import EjecutorTareas
+from figuras import FIGURAS, calcular_lote, generar_dimensiones
+from hotel import Hotel
+from lector import LeerArchivo, indexar_carpeta
+from nomina import Empleado, HistorialNomina, escribir_nomina, total_nomina
+from notas import AcumuladorNotas, generar_notas, resumir_notas
+
+
+BASE_POR_DEFECTO = Path(__file__).resolve().parent / "benchmarks_base.json"
+TAMANOS_POR_DEFECTO = [1_000, 10_000, 100_000]
+UMBRAL_POR_DEFECTO = 0.25        # 25 % más lento que la base = regresión
+PISO_RUIDO_S = 0.002             # diferencias menores se ignoran
+CALIBRACION = "calibracion"      # caso de referencia para los cocientes
+
+# Cada caso recibe (n, semilla, carpeta temporal) y devuelve los segundos
+# del camino crítico, sin contar la preparación de datos.
+CASOS: Dict[str, Callable[[int, int, Path], float]] = {}
+
+
+def caso(nombre: str):
+    def registrar(funcion):
+        CASOS[nombre] = funcion
+        return funcion
+    return registrar
+
+
+def _cronometrar(funcion, *args) -> float:
+    t0 = time.perf_counter()
+    funcion(*args)
+    return time.perf_counter() - t0
+
+
+# ================== GENERADORES SINTÉTICOS ==================
+
+def generar_personas(n: int, semilla: int = 0) -> List[Persona]:
+    rng = random.Random(semilla)
+    return [Persona(f"Contacto {i}", str(3_000_000_000 + i),
+                    f"c{i}@dominio{rng.randrange(100)}.com") for i in range(n)]
+
+
+def generar_empleados(n: int, semilla: int = 0) -> List[Empleado]:
+    rng = random.Random(semilla)
+    cargos = ["Directivo", "Estratégico", "Operativo"]
+    generos = ["Masculino", "Femenino"]
+    return [Empleado(nombre=f"Nombre{i}", apellidos=f"Apellido{i}",
+                     cargo=rng.choice(cargos), genero=rng.choice(generos),
+                     salario_dia=round(rng.uniform(40_000, 400_000), 2),
+                     dias_trabajados=rng.randint(1, 31),
+                     otros_ingresos=round(rng.uniform(0, 500_000), 2),
+                     pagos_salud=round(rng.uniform(0, 200_000), 2),
+                     aporte_pension=round(rng.uniform(0, 200_000), 2))
+            for i in range(n)]
+
+
+def generar_archivo_texto(ruta: Path, n: int, semilla: int = 0) -> None:
+    """Archivo de n líneas con texto UTF-8 (incluye tildes)."""
+    rng = random.Random(semilla)
+    palabras = ["línea", "archivo", "lectura", "prueba", "dato", "niño", "acción"]
+    with ruta.open("w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(f"{i} " + " ".join(rng.choice(palabras) for _ in range(8)) + "\n")
+
+
+# ================== CASOS ==================
+
+@caso(CALIBRACION)
+def _calibracion(n: int, semilla: int, carpeta: Path) -> float:
+    # Bucle de Python puro proporcional a n (aritmética y dict, sin reservar
+    # memoria); no toca ningún módulo del proyecto, así que sus cambios no lo afectan
+    t0 = time.perf_counter()
+    cubetas: Dict[int, float] = {}
+    for i in range(n):
+        x = (i * 2654435761 + semilla) % 1000003 / 1000003.0
+        cubetas[i & 127] = cubetas.get(i & 127, 0.0) + x * x
+    return time.perf_counter() - t0
+
+
+@caso("contactos_crud")
+def _contactos_crud(n: int, semilla: int, carpeta: Path) -> float:
+    book = ContactBook(str(carpeta / "contactos.txt"))
+    book._save_contacts(generar_personas(n, semilla))
+    nuevo = str(2_000_000_000 + n)
+    t0 = time.perf_counter()
+    book.crear_contacto("Nuevo", nuevo, "nuevo@dominio.com")
+    book.listar_contactos()
+    book.actualizar_contacto(nuevo, "Cambiado", "", "cambiado@dominio.com")
+    book.borrar_contacto(nuevo)
+    return time.perf_counter() - t0
+
+
+@caso("contactos_cambios_desde")
+def _contactos_cambios_desde(n: int, semilla: int, carpeta: Path) -> float:
+    # bitácora de n eventos; un consumidor pide los últimos 10
+    ruta = carpeta / f"cambios_{n}.txt.cambios"
+    ruta.unlink(missing_ok=True)
+    registro = RegistroCambios(ruta)
+    for p in generar_personas(n, semilla):
+        registro.registrar("crear", None, p)
+    return _cronometrar(registro.desde, n - 10)
+
+
+@caso("duplicados_deduplicar")
+def _duplicados(n: int, semilla: int, carpeta: Path) -> float:
+    # n registros de archivo.txt y la agenda con ~30 % de copias alteradas
+    registros, _ = generar_registros(n, semilla=semilla)
+    return _cronometrar(deduplicar, registros, 1)
+
+
+@caso("nomina_total")
+def _nomina_total(n: int, semilla: int, carpeta: Path) -> float:
+    return _cronometrar(total_nomina, generar_empleados(n, semilla))
+
+
+@caso("nomina_escribir")
+def _nomina_escribir(n: int, semilla: int, carpeta: Path) -> float:
+    return _cronometrar(escribir_nomina, generar_empleados(n, semilla),
+                        str(carpeta / "Nomina.txt"))
+
+
+@caso("nomina_comparar_periodos")
+def _nomina_comparar(n: int, semilla: int, carpeta: Path) -> float:
+    # dos instantáneas de n empleados; 10 % con aumento en el segundo mes
+    historial = HistorialNomina(carpeta / f"historial_{n}")
+    if not historial.periodos():
+        empleados = generar_empleados(n, semilla)
+        historial.asignar_ids(empleados)
+        historial.guardar("2025-03", empleados)
+        for e in empleados[::10]:
+            e.salario_dia += 1_000
+        historial.guardar("2025-04", empleados)
+    return _cronometrar(historial.comparar, "2025-03", "2025-04")
+
+
+@caso("hotel_obtener_habitacion")
+def _hotel_obtener(n: int, semilla: int, carpeta: Path) -> float:
+    # Hotel de n habitaciones, 100 búsquedas al azar
+    hotel = Hotel(n)
+    rng = random.Random(semilla)
+    numeros = [rng.randint(1, n) for _ in range(100)]
+    t0 = time.perf_counter()
+    for numero in numeros:
+        hotel.obtener_habitacion(numero)
+    return time.perf_counter() - t0
+
+
+@caso("hotel_ingreso_salida")
+def _hotel_ingreso_salida(n: int, semilla: int, carpeta: Path) -> float:
+    # n ciclos ingreso → cobro → salida sobre el hotel estándar de 10 habitaciones
+    hotel = Hotel()
+    rng = random.Random(semilla)
+    inicio = date(2025, 1, 1)
+    ciclos = [(rng.randint(1, 10), inicio + timedelta(days=rng.randrange(365)),
+               rng.randint(1, 30)) for _ in range(n)]
+    t0 = time.perf_counter()
+    for numero, ingreso, noches in ciclos:
+        hab = hotel.obtener_habitacion(numero)
+        hab.ocupar("Nombre", "Apellido", "123", ingreso)
+        hab.calcular_estadia(ingreso + timedelta(days=noches))
+        hab.liberar()
+    return time.perf_counter() - t0
+
+
+@caso("lector_leer_todo")
+def _lector_leer_todo(n: int, semilla: int, carpeta: Path) -> float:
+    ruta = carpeta / "texto.txt"
+    generar_archivo_texto(ruta, n, semilla)
+    return _cronometrar(LeerArchivo(ruta).leer_todo)
+
+
+@caso("lector_indexar_carpeta")
+def _lector_indexar_carpeta(n: int, semilla: int, carpeta: Path) -> float:
+    # n líneas repartidas en 100 archivos
+    for i in range(100):
+        generar_archivo_texto(carpeta / f"log_{i:03d}.txt", max(1, n // 100), semilla + i)
+    return _cronometrar(indexar_carpeta, carpeta)
+
+
+@caso("notas_resumen")
+def _notas_resumen(n: int, semilla: int, carpeta: Path) -> float:
+    return _cronometrar(resumir_notas, generar_notas(n, semilla))
+
+
+@caso("notas_acumulador")
+def _notas_acumulador(n: int, semilla: int, carpeta: Path) -> float:
+    return _cronometrar(AcumuladorNotas().agregar_varios, generar_notas(n, semilla))
+
+
+@caso("figuras_objetos")
+def _figuras_objetos(n: int, semilla: int, carpeta: Path) -> float:
+    total = 0.0
+    for tipo, cls in FIGURAS.items():
+        columnas = generar_dimensiones(tipo, n, semilla)
+        datos = [columnas[c] for c in cls.CAMPOS]
+        t0 = time.perf_counter()
+        for dims in zip(*datos):
+            fig = cls(*dims)
+            fig.volumen()
+            fig.superficie()
+        total += time.perf_counter() - t0
+    return total
+
+
+@caso("figuras_lote")
+def _figuras_lote(n: int, semilla: int, carpeta: Path) -> float:
+    total = 0.0
+    for tipo in FIGURAS:
+        columnas = generar_dimensiones(tipo, n, semilla)
+        total += _cronometrar(calcular_lote, tipo, columnas)
+    return total
+
+
+class _BucleSinPantalla:
+    """
+    Sustituto mínimo del bucle de eventos de Tk (after/after_cancel en un
+    solo hilo) para medir su latencia sin abrir una ventana.
+    """
+    def __init__(self):
+        self._agenda: List[tuple] = []
+        self._siguiente = 0
+
+    def after(self, ms: int, funcion) -> int:
+        self._siguiente += 1
+        heapq.heappush(self._agenda, (time.perf_counter() + ms / 1000.0,
+                                      self._siguiente, funcion))
+        return self._siguiente
+
+    def after_cancel(self, ident: int) -> None:
+        self._agenda = [e for e in self._agenda if e[1] != ident]
+        heapq.heapify(self._agenda)
+
+    def correr(self, hasta: Callable[[], bool]) -> None:
+        while self._agenda and not hasta():
+            vence, _, funcion = self._agenda[0]
+            espera = vence - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            heapq.heappop(self._agenda)
+            funcion()
+
+
+@caso("ejecutor_latencia_bucle")
+def _ejecutor_latencia(n: int, semilla: int, carpeta: Path) -> float:
+    # Peor retraso de un tic de 10 ms del bucle de eventos mientras se leen
+    # n líneas con leer_todo en el EjecutorTareas (la interfaz no debe congelarse)
+    ruta = carpeta / "texto.txt"
+    generar_archivo_texto(ruta, n, semilla)
+    bucle = _BucleSinPantalla()
+    ejecutor = EjecutorTareas(bucle, hilos=1)
+    retrasos: List[float] = []
+    resultado: List[str] = []
+
+    def programar_tic():
+        esperado = time.perf_counter() + 0.010
+        bucle.after(10, lambda: tic(esperado))
+
+    def tic(esperado: float):
+        retrasos.append(time.perf_counter() - esperado)
+        programar_tic()
+
+    programar_tic()
+    ejecutor.enviar(LeerArchivo(ruta).leer_todo, con_control=True,
+                    al_terminar=resultado.append, al_fallar=resultado.append)
+    bucle.correr(lambda: bool(resultado))
+    ejecutor.cerrar()
+    return max(retrasos, default=0.0)
+
+
+# ================== INFORMES ==================
+
+# Cada informe recibe parámetros por nombre (todos con valor por defecto) y
+# devuelve {medida: valor}; los valores pueden ser diccionarios anidados.
+INFORMES: Dict[str, Callable[..., Dict]] = {
+    "agenda_cumpleanos": agenda.benchmark_cumpleanos,
+    "contactos_sincronizacion": contactos.benchmark_sincronizacion,
+    "duplicados": duplicados.benchmark,
+    "figuras_lote": figuras.benchmark,
+    "lector_carpeta": lector.benchmark_carpeta,
+    "nomina_historial": nomina.benchmark_historial,
+    "notas_resumen": notas.benchmark,
+    "notas_grupos": notas.benchmark_grupos,
+}
+
+
+def _parametro(texto: str):
+    """'clave=valor' -> (clave, valor); el valor se interpreta como literal de Python."""
+    clave, sep, valor = texto.partition("=")
+    if not sep or not clave:
+        raise argparse.ArgumentTypeError(f"use CLAVE=VALOR (se recibió {texto!r})")
+    try:
+        return clave, ast.literal_eval(valor)
+    except (ValueError, SyntaxError):
+        return clave, valor
+
+
+def ejecutar_informe(nombre: str, **parametros) -> None:
+    """Ejecuta un informe de INFORMES y lo imprime (lo usan también los --bench de cada módulo)."""
+    imprimir_informe(INFORMES[nombre](**parametros))
+
+
+def imprimir_informe(resultados: Dict, sangria: int = 0) -> None:
+    ancho = max((len(nombre) for nombre in resultados), default=0)
+    for nombre, valor in resultados.items():
+        if isinstance(valor, dict):
+            print(f"{' ' * sangria}{nombre}:")
+            imprimir_informe(valor, sangria + 2)
+        elif isinstance(valor, float):
+            print(f"{' ' * sangria}{nombre:>{ancho}}: {valor:.4f}")
+        else:
+            print(f"{' ' * sangria}{nombre:>{ancho}}: {valor}")
+
+
+# ================== EJECUCIÓN Y COMPARACIÓN ==================
+
+def ejecutar(casos: List[str], tamanos: List[int], repeticiones: int = 3,
+             semilla: int = 0) -> Dict:
+    """
+    Mide los casos (siempre junto con 'calibracion', al principio y al final)
+    y agrega a cada medida 'relativo': su mínimo dividido por el mínimo de
+    la calibración del mismo n. Los mínimos son menos sensibles a
+    interrupciones del sistema que las medianas.
+    """
+    casos = [CALIBRACION] + [c for c in casos if c != CALIBRACION] + [CALIBRACION]
+    muestras: Dict[str, Dict[str, List[float]]] = {}
+    for nombre in casos:
+        # Corrida sin medir: importaciones perezosas (NumPy) y cachés del
+        # sistema no deben contar como tiempo del caso.
+        with tempfile.TemporaryDirectory() as tmp:
+            CASOS[nombre](tamanos[0], semilla, Path(tmp))
+        for n in tamanos:
+            tiempos = muestras.setdefault(nombre, {}).setdefault(str(n), [])
+            for _ in range(repeticiones):
+                with tempfile.TemporaryDirectory() as tmp:
+                    tiempos.append(CASOS[nombre](n, semilla, Path(tmp)))
+            print(f"{nombre:>26} n={n:<9} {statistics.median(tiempos) * 1000:10.2f} ms",
+                  file=sys.stderr)
+
+    calibracion = {n: min(tiempos) for n, tiempos in muestras[CALIBRACION].items()}
+    resultados = {
+        nombre: {n: {"mediana_s": statistics.median(tiempos),
+                     "min_s": min(tiempos),
+                     "relativo": min(tiempos) / calibracion[n]}
+                 for n, tiempos in por_tamano.items()}
+        for nombre, por_tamano in muestras.items()
+    }
+    try:
+        import numpy
+        version_numpy: Optional[str] = numpy.__version__
+    except ImportError:
+        version_numpy = None
+    return {
+        "meta": {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "numpy": version_numpy,
+            "semilla": semilla,
+            "repeticiones": repeticiones,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(actual: Dict, base: Dict, umbral: float = UMBRAL_POR_DEFECTO) -> List[str]:
+    """
+    Lista de regresiones: casos cuyo cociente respecto a la calibración
+    supera el de la base en más de 'umbral'. El piso de ruido se aplica al
+    tiempo esperado en esta máquina (cociente de la base × calibración actual).
+    """
+    regresiones = []
+    for nombre, por_tamano in actual["resultados"].items():
+        if nombre == CALIBRACION:
+            continue
+        for n, medida in por_tamano.items():
+            previa = base.get("resultados", {}).get(nombre, {}).get(n)
+            if previa is None or "relativo" not in previa:
+                continue
+            antes, ahora = previa["relativo"], medida["relativo"]
+            esperado_s = antes * actual["resultados"][CALIBRACION][n]["min_s"]
+            if medida["min_s"] - esperado_s > PISO_RUIDO_S and ahora > antes * (1 + umbral):
+                regresiones.append(f"{nombre} n={n}: {antes:.3f} -> {ahora:.3f} × calibración "
+                                   f"(+{(ahora / antes - 1) * 100:.0f} %)")
+    return regresiones
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos críticos.")
+    parser.add_argument("casos", nargs="*", help=f"casos a ejecutar: {', '.join(CASOS)}")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS_POR_DEFECTO)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--json", help="guardar resultados en este archivo")
+    parser.add_argument("--base",
+                        help="comparar contra esta línea base local "
+                             f"(--guardar-base la escribe; por defecto en {BASE_POR_DEFECTO.name})")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_POR_DEFECTO,
+                        help="tolerancia relativa antes de marcar regresión")
+    parser.add_argument("--guardar-base", action="store_true",
+                        help="escribir los resultados como línea base local")
+    parser.add_argument("--informe", choices=sorted(INFORMES),
+                        help="ejecutar un informe de módulo en vez de los casos")
+    parser.add_argument("--parametro", type=_parametro, action="append", default=[],
+                        metavar="CLAVE=VALOR", help="parámetro del informe (repetible)")
+    args = parser.parse_args(argv)
+
+    if args.informe:
+        informe = INFORMES[args.informe]
+        parametros = dict(args.parametro)
+        try:
+            inspect.signature(informe).bind(**parametros)
+        except TypeError as e:
+            parser.error(f"parámetros de {args.informe}: {e}")
+        ejecutar_informe(args.informe, **parametros)
+        return 0
+
+    desconocidos = [c for c in args.casos if c not in CASOS]
+    if desconocidos:
+        parser.error(f"casos desconocidos: {', '.join(desconocidos)}")
+
+    actual = ejecutar(args.casos or list(CASOS), args.tamanos, args.repeticiones,
+                      args.semilla)
+    texto = json.dumps(actual, indent=2, ensure_ascii=False)
+    if args.json:
+        Path(args.json).write_text(texto, encoding="utf-8")
+    else:
+        print(texto)
+
+    if args.guardar_base:
+        Path(args.base or BASE_POR_DEFECTO).write_text(texto, encoding="utf-8")
+        return 0
+    if not args.base:
+        return 0
+
+    ruta_base = Path(args.base)
+    if not ruta_base.exists():
+        print(f"Sin línea base en {ruta_base}; use --guardar-base.", file=sys.stderr)
+        return 0
+    regresiones = comparar(actual, json.loads(ruta_base.read_text(encoding="utf-8")),
+                           args.umbral)
+    for r in regresiones:
+        print(f"REGRESIÓN {r}", file=sys.stderr)
+    if not regresiones:
+        print("Sin regresiones respecto a la línea base.", file=sys.stderr)
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,517 @@
+# contactos.py
+# Modelo y archivo de contactos (sin dependencias de Tkinter).
+#
+# Cada alta, cambio o baja queda además en '<archivo>.cambios' (una línea
+# JSON por evento, con secuencia y valores antes/después) para que otros
+# sistemas se sincronicen pidiendo solo los cambios desde su última secuencia:
+#
+#   python contactos.py --archivo archivo.txt --desde 1500 > delta.jsonl
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import instrumentacion
+from instrumentacion import medido
+
+try:
+    import fcntl                       # bloqueo de archivos en POSIX
+except ImportError:                    # Windows
+    fcntl = None
+    import msvcrt
+
+
+class Persona:
+    def __init__(self, nombre: str, telefono: str, correo: str) -> None:
+        self.nombre = nombre
+        self.telefono = telefono
+        self.correo = correo
+
+    def copia(self) -> "Persona":
+        return Persona(self.nombre, self.telefono, self.correo)
+
+
+# --------- Registro de cambios ---------
+
+class HistorialCompactado(Exception):
+    """Los cambios pedidos ya se descartaron: hay que releer el archivo completo."""
+
+
+@dataclass(slots=True)
+class Cambio:
+    seq: int
+    op: str                        # "crear", "actualizar" o "borrar"
+    antes: Optional[Persona]
+    despues: Optional[Persona]
+    fecha: str
+
+
+def _persona_json(p: Optional[Persona]):
+    return None if p is None else [p.nombre, p.telefono, p.correo]
+
+
+def _cambio(linea: bytes) -> Cambio:
+    d = json.loads(linea)
+    antes, despues = d["antes"], d["despues"]
+    return Cambio(d["seq"], d["op"], antes and Persona(*antes),
+                  despues and Persona(*despues), d["fecha"])
+
+
+@contextmanager
+def _bloqueo_archivo(ruta: Path):
+    """Bloqueo exclusivo entre procesos (e instancias) mientras dura el with."""
+    with open(ruta, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RegistroCambios:
+    """
+    Bitácora de solo-agregar en JSON Lines. La primera línea puede ser
+    {"base": N}: los eventos hasta N se descartaron al compactar. Se guarda
+    en memoria el desplazamiento de cada evento, así que pedir los cambios
+    desde una secuencia lee solo la cola del archivo.
+
+    Varias instancias o procesos pueden compartir el archivo: quien agrega o
+    compacta toma el bloqueo '<ruta>.lock', y toda operación pone antes el
+    índice al día con lo que escribieron los demás.
+    """
+    def __init__(self, ruta: Path, retencion: Optional[int] = None):
+        self.ruta = Path(ruta)
+        self.retencion = retencion           # eventos a conservar al compactar solo
+        self._ruta_bloqueo = self.ruta.with_name(self.ruta.name + ".lock")
+        self._candado = threading.RLock()
+        self._reiniciar()
+        self.actualizar()
+
+    def _reiniciar(self) -> None:
+        self.base = 0
+        self.ultima = 0
+        self._desplazamientos = array("Q")   # evento base+1+k empieza en [k]
+        self._fin = 0                        # fin de la última línea completa
+        self._archivo = None                 # (st_dev, st_ino) indexado
+
+    def _sincronizar(self, f, reparar: bool = False) -> None:
+        """
+        Indexa lo que se agregó a 'f' desde la última vez. Si el archivo es
+        otro (compactado) o se acortó, se indexa de nuevo. Solo quien tiene
+        el bloqueo (reparar=True) corta una última línea incompleta; un
+        lector la ignora porque puede ser una escritura en curso.
+        """
+        estado = os.fstat(f.fileno())
+        if (estado.st_dev, estado.st_ino) != self._archivo or estado.st_size < self._fin:
+            self._reiniciar()
+            self._archivo = (estado.st_dev, estado.st_ino)
+        if estado.st_size == self._fin:
+            return
+        f.seek(self._fin)
+        pos = self._fin
+        for linea in f:
+            if not linea.endswith(b"\n"):
+                if reparar:
+                    f.truncate(pos)          # escritura interrumpida: se descarta
+                break
+            if pos == 0 and linea.startswith(b'{"base"'):
+                self.base = self.ultima = json.loads(linea)["base"]
+            else:
+                self._desplazamientos.append(pos)
+                self.ultima += 1
+            pos += len(linea)
+        self._fin = pos
+
+    def actualizar(self) -> int:
+        """Pone el índice al día con el archivo y devuelve la última secuencia."""
+        with self._candado:
+            try:
+                with self.ruta.open("rb") as f:
+                    self._sincronizar(f)
+            except FileNotFoundError:
+                self._reiniciar()
+            return self.ultima
+
+    @contextmanager
+    def bloqueo(self):
+        """Exclusión entre hilos, instancias y procesos sobre la bitácora."""
+        with self._candado, _bloqueo_archivo(self._ruta_bloqueo):
+            yield
+
+    def registrar(self, op: str, antes: Optional[Persona], despues: Optional[Persona]) -> int:
+        with self.bloqueo():
+            return self._registrar(op, antes, despues)
+
+    def _registrar(self, op: str, antes: Optional[Persona], despues: Optional[Persona]) -> int:
+        # requiere el bloqueo del archivo
+        with self.ruta.open("a+b") as f:
+            self._sincronizar(f, reparar=True)
+            seq = self.ultima + 1
+            linea = json.dumps({"seq": seq, "op": op, "antes": _persona_json(antes),
+                                "despues": _persona_json(despues),
+                                "fecha": datetime.now().isoformat(timespec="seconds")},
+                               ensure_ascii=False).encode("utf-8") + b"\n"
+            f.write(linea)
+        self._desplazamientos.append(self._fin)
+        self._fin += len(linea)
+        self.ultima = seq
+        if self.retencion is not None and len(self._desplazamientos) > 2 * self.retencion:
+            self._compactar(self.retencion)
+        return seq
+
+    def leer_crudo(self, desde: int) -> bytes:
+        """Líneas JSON de los eventos con secuencia mayor que 'desde'."""
+        try:
+            f = self.ruta.open("rb")
+        except FileNotFoundError:
+            return b""
+        # Se lee del mismo archivo que se indexó, aunque otro proceso lo
+        # reemplace al compactar mientras tanto
+        with f, self._candado:
+            self._sincronizar(f)
+            if desde < self.base:
+                raise HistorialCompactado(
+                    f"Solo se conservan los cambios posteriores a la secuencia {self.base}.")
+            k = desde - self.base
+            if k >= len(self._desplazamientos):
+                return b""
+            f.seek(self._desplazamientos[k])
+            return f.read(self._fin - self._desplazamientos[k])
+
+    def desde(self, seq: int) -> List[Cambio]:
+        return [_cambio(l) for l in self.leer_crudo(seq).splitlines()]
+
+    def compactar(self, conservar: int) -> int:
+        """Deja solo los últimos 'conservar' eventos. Devuelve cuántos descartó."""
+        with self.bloqueo():
+            return self._compactar(conservar)
+
+    def _compactar(self, conservar: int) -> int:
+        # requiere el bloqueo del archivo
+        try:
+            f = self.ruta.open("rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            self._sincronizar(f)
+            descartar = max(0, len(self._desplazamientos) - conservar)
+            if descartar == 0:
+                return 0
+            inicio = (self._desplazamientos[descartar]
+                      if descartar < len(self._desplazamientos) else self._fin)
+            f.seek(inicio)
+            cola = f.read(self._fin - inicio)
+        temporal = self.ruta.with_name(self.ruta.name + ".tmp")
+        with temporal.open("wb") as f:
+            f.write(json.dumps({"base": self.base + descartar}).encode("utf-8") + b"\n")
+            f.write(cola)
+        os.replace(temporal, self.ruta)
+        self._reiniciar()
+        self.actualizar()                    # solo quedan los eventos conservados
+        return descartar
+
+
+def aplicar_cambios(contactos: Dict[str, Persona], cambios: Iterable[Cambio]) -> int:
+    """
+    Aplica un delta a una copia local indexada por teléfono (lado consumidor).
+    Devuelve la última secuencia aplicada (0 si no había cambios).
+    """
+    ultima = 0
+    for c in cambios:
+        if c.antes is not None:
+            contactos.pop(c.antes.telefono, None)
+        if c.despues is not None:
+            contactos[c.despues.telefono] = c.despues
+        ultima = c.seq
+    return ultima
+
+class ContactBook:
+    def __init__(self, filename: str = "archivo.txt", registrar_cambios: bool = True,
+                 retencion: Optional[int] = None) -> None:
+        self.filename = filename
+        # Las operaciones leen y reescriben el archivo completo; el candado
+        # evita que dos hilos de trabajo se pisen los cambios, y el bloqueo
+        # del archivo (el de la bitácora, si hay) hace lo mismo entre procesos.
+        self._lock = threading.RLock()
+        if not os.path.exists(self.filename):
+            open(self.filename, "w").close()
+        self.cambios = (RegistroCambios(Path(filename + ".cambios"), retencion)
+                        if registrar_cambios else None)
+
+    # --------- Transacciones ---------
+
+    @contextmanager
+    def _transaccion(self):
+        """
+        Leer, reescribir el archivo y registrar el evento sin que otro hilo o
+        proceso intervenga. Antes termina la escritura que un proceso haya
+        dejado a medias (ver _guardar_y_registrar).
+        """
+        with self._lock:
+            if self.cambios is None:
+                with _bloqueo_archivo(Path(self.filename + ".lock")):
+                    yield
+                return
+            with self.cambios.bloqueo():
+                self._recuperar(self.cambios.actualizar())
+                yield
+
+    def _pendiente(self, seq: int) -> Path:
+        return Path(f"{self.filename}.pendiente-{seq}")
+
+    def _recuperar(self, ultima: int) -> None:
+        # requiere el bloqueo; a lo sumo quedó el archivo de la última
+        # secuencia (evento registrado: se instala) o de la siguiente (no
+        # registrado: la operación no ocurrió)
+        confirmado = self._pendiente(ultima)
+        if ultima and confirmado.exists():
+            os.replace(confirmado, self.filename)
+        self._pendiente(ultima + 1).unlink(missing_ok=True)
+
+    def _guardar_y_registrar(self, contactos: list,
+                             eventos: List[Tuple[str, Optional[Persona], Optional[Persona]]]) -> None:
+        """
+        Reescribe el archivo y registra sus eventos como un solo paso
+        (requiere _transaccion). El archivo nuevo se escribe aparte, el
+        último evento en la bitácora es el punto de confirmación y recién
+        entonces se instala con os.replace: si el proceso muere en medio,
+        _recuperar lo completa o lo descarta y archivo y bitácora coinciden.
+        """
+        if self.cambios is None:
+            self._save_contacts(contactos)
+            return
+        pendiente = self._pendiente(self.cambios.ultima + len(eventos))
+        self._escribir(contactos, pendiente)
+        for op, antes, despues in eventos:
+            self.cambios._registrar(op, antes, despues)
+        os.replace(pendiente, self.filename)
+
+    @medido("contactos.cargar")
+    def _load_contacts(self) -> list:
+        contactos = []
+        with open(self.filename, "r", encoding="utf-8") as file:
+            if instrumentacion.activa():
+                instrumentacion.registrar_bytes("contactos.cargar",
+                                                leidos=os.fstat(file.fileno()).st_size)
+            for linea in file:
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    nombre, telefono, correo = linea.split(",")
+                    contactos.append(Persona(nombre, telefono, correo))
+                except ValueError:
+                    # si hay una línea mala la ignoramos
+                    continue
+        return contactos
+
+    def _save_contacts(self, contactos: list) -> None:
+        """Escribe en un temporal y lo instala con os.replace: nunca queda un archivo a medias."""
+        temporal = Path(self.filename + ".tmp")
+        self._escribir(contactos, temporal)
+        os.replace(temporal, self.filename)
+
+    @medido("contactos.guardar")
+    def _escribir(self, contactos: list, ruta: Path) -> None:
+        with open(ruta, "w", encoding="utf-8") as file:
+            for p in contactos:
+                file.write(f"{p.nombre},{p.telefono},{p.correo}\n")
+            if instrumentacion.activa():
+                instrumentacion.registrar_bytes("contactos.guardar", escritos=file.tell())
+            file.flush()
+            os.fsync(file.fileno())
+
+    def _validar_datos(self, nombre: str, telefono: str, correo: str, validar_duplicado=True) -> None:
+        if telefono and not telefono.isdigit():
+            raise ValueError("El teléfono debe contener solo números.")
+
+        if correo and not re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", correo):
+            raise ValueError("Correo mal digitado.")
+
+        if validar_duplicado and telefono:
+            contactos = self._load_contacts()
+            for p in contactos:
+                if p.telefono == telefono:
+                    raise ValueError("Ya existe un contacto con ese teléfono.")
+
+    # --------- CRUD ---------
+
+    def crear_contacto(self, nombre: str, telefono: str, correo: str) -> None:
+        with self._transaccion():
+            self._validar_datos(nombre, telefono, correo, validar_duplicado=True)
+            contactos = self._load_contacts()
+            nueva = Persona(nombre, telefono, correo)
+            contactos.append(nueva)
+            self._guardar_y_registrar(contactos, [("crear", None, nueva)])
+
+    def listar_contactos(self) -> list:
+        with self._lock:
+            return self._load_contacts()
+
+    def actualizar_contacto(self, telefono_original: str, nuevo_nombre: str, nuevo_telefono: str, nuevo_correo: str) -> None:
+        with self._transaccion():
+            contactos = self._load_contacts()
+            encontrado = False
+
+            # validar datos solo si se cambian
+            tel_validar = nuevo_telefono or ""
+            correo_validar = nuevo_correo or ""
+            if tel_validar or correo_validar:
+                # no queremos que dispare duplicado con el mismo teléfono original
+                self._validar_datos(nuevo_nombre, tel_validar, correo_validar, validar_duplicado=False)
+
+            for p in contactos:
+                if p.telefono == telefono_original:
+                    encontrado = True
+                    antes = p.copia()
+                    if nuevo_nombre:
+                        p.nombre = nuevo_nombre
+                    if nuevo_telefono:
+                        # verificar duplicado solo si cambia de teléfono
+                        if nuevo_telefono != telefono_original:
+                            self._validar_datos("", nuevo_telefono, "", validar_duplicado=True)
+                        p.telefono = nuevo_telefono
+                    if nuevo_correo:
+                        self._validar_datos("", "", nuevo_correo, validar_duplicado=False)
+                        p.correo = nuevo_correo
+                    break
+
+            if not encontrado:
+                raise ValueError("Contacto no encontrado.")
+
+            self._guardar_y_registrar(contactos, [("actualizar", antes, p)])
+
+    def borrar_contacto(self, telefono: str) -> None:
+        with self._transaccion():
+            contactos = self._load_contacts()
+            nuevos = [p for p in contactos if p.telefono != telefono]
+            if len(nuevos) == len(contactos):
+                raise ValueError("Contacto no encontrado.")
+            self._guardar_y_registrar(nuevos, [("borrar", p, None) for p in contactos
+                                               if p.telefono == telefono])
+
+    # --------- Sincronización ---------
+
+    def ultima_secuencia(self) -> int:
+        return self.cambios.actualizar() if self.cambios is not None else 0
+
+    def instantanea(self) -> Tuple[int, list]:
+        """Copia completa y la secuencia a la que corresponde (sincronización inicial)."""
+        with self._transaccion():
+            return self.ultima_secuencia(), self._load_contacts()
+
+    def cambios_desde(self, seq: int) -> List[Cambio]:
+        """
+        Cambios posteriores a 'seq', en orden. Lanza HistorialCompactado si
+        ya se descartaron y el consumidor debe volver a usar instantanea().
+        """
+        if self.cambios is None:
+            raise ValueError("Este ContactBook no registra cambios.")
+        with self._lock:
+            return self.cambios.desde(seq)
+
+    def compactar_cambios(self, conservar: int) -> int:
+        with self._lock:
+            return self.cambios.compactar(conservar) if self.cambios is not None else 0
+
+
+# --------- Benchmark y línea de comandos ---------
+
+def benchmark_sincronizacion(n: int = 1_000_000, ediciones: int = 10) -> Dict[str, float]:
+    """
+    Un consumidor sincronizado hasta la secuencia actual recibe 'ediciones'
+    cambios: compara releer el archivo completo contra pedir solo el delta.
+    """
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "archivo.txt")
+        with open(ruta, "w", encoding="utf-8") as f:
+            for i in range(n):
+                f.write(f"Contacto {i},{3_000_000_000 + i},contacto{i}@correo.com\n")
+        book = ContactBook(ruta)
+        seq, contactos = book.instantanea()
+        local = {p.telefono: p for p in contactos}
+
+        for k in range(ediciones):
+            if k % 3 == 0:
+                book.crear_contacto(f"Nuevo {k}", str(4_000_000_000 + k), f"nuevo{k}@correo.com")
+            elif k % 3 == 1:
+                book.actualizar_contacto(str(3_000_000_000 + k), f"Editado {k}", "", "")
+            else:
+                book.borrar_contacto(str(3_000_000_000 + k))
+
+        t0 = time.perf_counter()
+        completo = {p.telefono: p for p in book.listar_contactos()}
+        t_completo = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        delta = book.cambios.leer_crudo(seq)
+        aplicar_cambios(local, book.cambios_desde(seq))
+        t_delta = time.perf_counter() - t0
+
+        iguales = local.keys() == completo.keys() and all(
+            (a.nombre, a.correo) == (completo[t].nombre, completo[t].correo)
+            for t, a in local.items())
+        return {
+            "contactos": n,
+            "ediciones": ediciones,
+            "bytes_completo": os.path.getsize(ruta),
+            "bytes_delta": len(delta),
+            "segundos_completo": t_completo,
+            "segundos_delta": t_delta,
+            "copias_iguales": iguales,
+        }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Cambios de un ContactBook desde una secuencia (JSON Lines).")
+    parser.add_argument("--archivo", default="archivo.txt", help="archivo de contactos")
+    parser.add_argument("--desde", type=int, metavar="SEQ",
+                        help="imprime los cambios posteriores a SEQ")
+    parser.add_argument("--compactar", type=int, metavar="K",
+                        help="conserva solo los últimos K cambios")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="benchmark de sincronización con N contactos")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("contactos_sincronizacion", n=args.bench)
+        return
+
+    book = ContactBook(args.archivo)
+    if args.compactar is not None:
+        descartados = book.compactar_cambios(args.compactar)
+        print(f"{descartados} cambios descartados; base = {book.cambios.base}")
+    elif args.desde is not None:
+        try:
+            sys.stdout.buffer.write(book.cambios.leer_crudo(args.desde))
+        except HistorialCompactado as e:
+            parser.exit(2, f"{e}\n")
+    else:
+        ultima = book.ultima_secuencia()
+        print(f"última secuencia: {ultima} (base {book.cambios.base})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+# duplicados.py
+# Detección y fusión de contactos duplicados entre el archivo de ContactBook
+# (archivo.txt) y la agenda SQLite (agenda.db), sin dependencias de Tkinter.
+#
+#   python duplicados.py --archivo archivo.txt --agenda agenda.db --salida fusionados.csv
+#   python duplicados.py --bench 1000000 --procesos 8
+#
+# Etapas:
+#   1. Normalización de teléfono, correo y nombre.
+#   2. Bloqueo: solo se comparan registros que comparten teléfono, correo,
+#      o dominio de correo + prefijos del nombre (nunca todos contra todos).
+#   3. Puntaje difuso del nombre dentro de cada bloque (en varios procesos).
+#   4. Unión de los pares aceptados (union-find) y fusión de cada grupo.
+
+import argparse
+import csv
+import random
+import time
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+UMBRAL_CON_CLAVE = 0.6     # mismo teléfono o correo: basta un nombre parecido
+UMBRAL_SOLO_NOMBRE = 0.9   # solo dominio en común: el nombre debe ser casi igual…
+UMBRAL_CORREO = 0.9        # …y la parte local del correo también
+TAMANO_MAX_BLOQUE = 100    # bloques más grandes se omiten (clave poco selectiva)
+BLOQUES_POR_LOTE = 5000    # bloques que recibe cada tarea del pool
+
+
+# -------------------- MODELO --------------------
+
+@dataclass(slots=True)
+class Registro:
+    fuente: str            # "archivo" (ContactBook) o "agenda" (AgendaContactos)
+    id: object             # posición en archivo.txt o id de la agenda
+    nombre: str
+    telefono: str
+    correo: str
+
+
+@dataclass(slots=True)
+class RegistroFusionado:
+    nombre: str
+    telefono: str
+    correo: str
+    origenes: List[Tuple[str, object]] = field(default_factory=list)
+
+
+@dataclass
+class ResultadoDuplicados:
+    fusionados: List[RegistroFusionado]
+    grupos: List[List[int]]        # índices de los registros de cada grupo (>= 2)
+    bloques: int
+    bloques_omitidos: int
+    comparaciones: int
+
+
+# -------------------- NORMALIZACIÓN --------------------
+
+def normalizar_telefono(telefono: str) -> str:
+    """Solo dígitos; conserva los últimos 10 (quita indicativos como +57)."""
+    digitos = "".join(ch for ch in telefono if ch.isdigit())
+    return digitos[-10:]
+
+
+def normalizar_correo(correo: str) -> str:
+    """Minúsculas y sin etiqueta '+algo' en la parte local."""
+    correo = correo.strip().lower()
+    local, arroba, dominio = correo.rpartition("@")
+    if not arroba or not local:
+        return ""
+    return f"{local.split('+', 1)[0]}@{dominio}"
+
+
+def normalizar_nombre(nombre: str) -> str:
+    """Minúsculas, sin tildes ni signos y con un solo espacio entre palabras."""
+    texto = unicodedata.normalize("NFKD", nombre.lower())
+    texto = "".join(ch if ch.isalnum() else " " for ch in texto
+                    if not unicodedata.combining(ch))
+    return " ".join(texto.split())
+
+
+def _normalizar(registro: Registro) -> Tuple[str, str, str]:
+    return (normalizar_nombre(registro.nombre), normalizar_telefono(registro.telefono),
+            normalizar_correo(registro.correo))
+
+
+def _normalizar_lote(registros: Sequence[Registro]) -> List[Tuple[str, str, str]]:
+    return [_normalizar(r) for r in registros]
+
+
+# -------------------- BLOQUEO Y PUNTAJE --------------------
+
+def claves_bloqueo(nombre: str, telefono: str, correo: str) -> List[tuple]:
+    """Claves de los bloques a los que pertenece un registro normalizado."""
+    claves = []
+    if len(telefono) >= 7:
+        claves.append(("t", telefono))
+    if correo:
+        claves.append(("c", correo))
+        if nombre:
+            dominio = correo.rpartition("@")[2]
+            # prefijos ordenados: "Gómez Ana" y "Ana Gomez" caen en el mismo bloque
+            prefijos = "|".join(sorted(p[:3] for p in nombre.split()))
+            claves.append(("d", dominio, prefijos))
+    return claves
+
+
+def _parecido(a: str, b: str, minimo: float) -> float:
+    if a == b:
+        return 1.0
+    comparador = SequenceMatcher(None, a, b, autojunk=False)
+    if comparador.real_quick_ratio() < minimo or comparador.quick_ratio() < minimo:
+        return 0.0
+    return comparador.ratio()
+
+
+def similitud_nombres(a: str, b: str, minimo: float = UMBRAL_CON_CLAVE) -> float:
+    """
+    Similitud 0 – 1 entre nombres normalizados (difflib). Tolera que una de
+    las dos versiones tenga el nombre al final ("gomez ruiz ana"), pero no
+    que se intercambien los apellidos. Devuelve 0 si no alcanza 'minimo'.
+    """
+    variantes = [b]
+    palabras = b.split()
+    if len(palabras) > 1:
+        variantes += [" ".join(palabras[1:] + palabras[:1]),
+                      " ".join(palabras[-1:] + palabras[:-1])]
+    if a in variantes:
+        return 1.0
+    return max(_parecido(a, v, minimo) for v in variantes)
+
+
+def correos_compatibles(local_a: str, local_b: str) -> bool:
+    """
+    Partes locales que pueden ser de la misma persona: texto casi igual y
+    números finales compatibles ("ana.gomez85" con "ana.gomez8512", pero no
+    con "ana.gomez31", que suele ser un homónimo).
+    """
+    texto_a, texto_b = local_a.rstrip("0123456789"), local_b.rstrip("0123456789")
+    num_a, num_b = local_a[len(texto_a):], local_b[len(texto_b):]
+    if not (num_a.startswith(num_b) or num_b.startswith(num_a)):
+        return False
+    return _parecido(texto_a, texto_b, UMBRAL_CORREO) >= UMBRAL_CORREO
+
+
+def comparar_bloques(bloques: Sequence[Tuple[str, Sequence[Tuple[int, str, str]]]]
+                     ) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Compara todos los pares dentro de cada bloque. Cada bloque es
+    (tipo, [(índice, nombre normalizado, parte local del correo), …]).
+    Devuelve los pares aceptados y la cantidad de comparaciones hechas.
+    """
+    pares: List[Tuple[int, int]] = []
+    aceptados = set()            # un par aceptado por teléfono no se repite por correo
+    comparaciones = 0
+    for tipo, miembros in bloques:
+        solo_dominio = tipo == "d"
+        umbral = UMBRAL_SOLO_NOMBRE if solo_dominio else UMBRAL_CON_CLAVE
+        for k, (i, nombre_i, local_i) in enumerate(miembros):
+            for j, nombre_j, local_j in miembros[k + 1:]:
+                if (i, j) in aceptados:
+                    continue
+                comparaciones += 1
+                if similitud_nombres(nombre_i, nombre_j, umbral) < umbral:
+                    continue
+                if solo_dominio and not correos_compatibles(local_i, local_j):
+                    continue
+                aceptados.add((i, j))
+                pares.append((i, j))
+    return pares, comparaciones
+
+
+def _lotes(iterable: Iterable, tamano: int):
+    iterador = iter(iterable)
+    while True:
+        lote = list(islice(iterador, tamano))
+        if not lote:
+            return
+        yield lote
+
+
+# -------------------- FUSIÓN --------------------
+
+class _Conjuntos:
+    """Union-find con compresión de caminos."""
+    def __init__(self, n: int):
+        self.padre = list(range(n))
+
+    def raiz(self, i: int) -> int:
+        padre = self.padre
+        while padre[i] != i:
+            padre[i] = padre[padre[i]]
+            i = padre[i]
+        return i
+
+    def unir(self, i: int, j: int) -> None:
+        a, b = self.raiz(i), self.raiz(j)
+        if a != b:
+            self.padre[max(a, b)] = min(a, b)
+
+
+def _mas_comun(valores: Iterable[str]) -> str:
+    conteo = Counter(v for v in valores if v)
+    return conteo.most_common(1)[0][0] if conteo else ""
+
+
+def fusionar(registros: Sequence[Registro], normalizados: Sequence[Tuple[str, str, str]],
+             indices: Sequence[int]) -> RegistroFusionado:
+    """
+    Un registro por grupo: el nombre más completo (el más largo) y el
+    teléfono y correo normalizados más frecuentes.
+    """
+    return RegistroFusionado(
+        nombre=max((registros[i].nombre.strip() for i in indices), key=len),
+        telefono=_mas_comun(normalizados[i][1] for i in indices),
+        correo=_mas_comun(normalizados[i][2] for i in indices),
+        origenes=[(registros[i].fuente, registros[i].id) for i in indices],
+    )
+
+
+def deduplicar(registros: Sequence[Registro], procesos: Optional[int] = None
+               ) -> ResultadoDuplicados:
+    """
+    Agrupa los registros que representan a la misma persona y devuelve un
+    registro fusionado por persona (los únicos quedan tal cual, normalizados).
+    Con procesos=1 todo corre en el proceso actual.
+    """
+    pool = None
+    if procesos != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=procesos)
+    try:
+        if pool is None:
+            normalizados = _normalizar_lote(registros)
+        else:
+            normalizados = [n for lote in pool.map(_normalizar_lote,
+                                                   _lotes(registros, 50_000))
+                            for n in lote]
+
+        bloques: Dict[tuple, List[int]] = {}
+        for i, (nombre, telefono, correo) in enumerate(normalizados):
+            for clave in claves_bloqueo(nombre, telefono, correo):
+                bloques.setdefault(clave, []).append(i)
+
+        utiles, omitidos = [], 0
+        for clave, miembros in bloques.items():
+            if len(miembros) < 2:
+                continue
+            if len(miembros) > TAMANO_MAX_BLOQUE:
+                omitidos += 1
+                continue
+            utiles.append((clave[0], [(i, normalizados[i][0],
+                                       normalizados[i][2].rpartition("@")[0])
+                                      for i in miembros]))
+
+        if pool is None:
+            resultados = [comparar_bloques(utiles)]
+        else:
+            resultados = pool.map(comparar_bloques, _lotes(utiles, BLOQUES_POR_LOTE))
+
+        conjuntos = _Conjuntos(len(registros))
+        comparaciones = 0
+        for pares, hechas in resultados:
+            comparaciones += hechas
+            for i, j in pares:
+                conjuntos.unir(i, j)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    por_raiz: Dict[int, List[int]] = {}
+    for i in range(len(registros)):
+        por_raiz.setdefault(conjuntos.raiz(i), []).append(i)
+    grupos = list(por_raiz.values())
+    return ResultadoDuplicados(
+        fusionados=[fusionar(registros, normalizados, g) for g in grupos],
+        grupos=[g for g in grupos if len(g) > 1],
+        bloques=len(utiles),
+        bloques_omitidos=omitidos,
+        comparaciones=comparaciones,
+    )
+
+
+# -------------------- FUENTES --------------------
+
+def desde_contactbook(book) -> List[Registro]:
+    """Registros de un contactos.ContactBook (id = posición en el archivo)."""
+    return [Registro("archivo", i, p.nombre, p.telefono, p.correo)
+            for i, p in enumerate(book.listar_contactos())]
+
+
+def desde_agenda(agenda) -> List[Registro]:
+    """Registros de una agenda.AgendaContactos (id = id en la base)."""
+    return [Registro("agenda", c.id, f"{c.nombres} {c.apellidos}", c.telefono, c.correo)
+            for c in agenda.todos()]
+
+
+def escribir_fusionados(fusionados: Iterable[RegistroFusionado], ruta: Path) -> int:
+    total = 0
+    with Path(ruta).open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["nombre", "telefono", "correo", "origenes"])
+        for r in fusionados:
+            w.writerow([r.nombre, r.telefono, r.correo,
+                        ";".join(f"{fuente}:{id_}" for fuente, id_ in r.origenes)])
+            total += 1
+    return total
+
+
+# -------------------- DATOS SINTÉTICOS Y PRECISIÓN --------------------
+
+_NOMBRES = ["José", "María", "Ana", "Luis", "Carlos", "Andrés", "Sofía", "Valentina",
+            "Juan", "Camila", "Mateo", "Daniela", "Sebastián", "Laura", "Martín",
+            "Lucía", "Diego", "Paula", "Felipe", "Natalia", "Jorge", "Mónica",
+            "Ricardo", "Sara", "Tomás", "Isabel", "Manuel", "Elena", "Óscar", "Julia"]
+_APELLIDOS = ["Gómez", "Rodríguez", "Martínez", "López", "García", "Pérez", "Sánchez",
+              "Ramírez", "Torres", "Díaz", "Vargas", "Castro", "Rojas", "Moreno",
+              "Jiménez", "Muñoz", "Ortiz", "Herrera", "Suárez", "Romero", "Ríos",
+              "Mejía", "Cárdenas", "Valencia", "Quintero", "Ospina", "Arango",
+              "Londoño", "Giraldo", "Zapata", "Restrepo", "Cardona", "Salazar",
+              "Osorio", "Álvarez", "Rincón", "Patiño", "Benítez", "Villa", "Duque"]
+_DOMINIOS = ["gmail.com", "hotmail.com", "outlook.com", "yahoo.com", "empresa.co",
+             "universidad.edu.co", "correo.com", "live.com"]
+
+
+def _sin_tildes(texto: str) -> str:
+    return "".join(ch for ch in unicodedata.normalize("NFKD", texto)
+                   if not unicodedata.combining(ch))
+
+
+def _variar(rng: random.Random, nombre: str, telefono: str, correo: str,
+            telefono_nuevo: str) -> Tuple[str, str, str]:
+    """Copia del contacto con el formato alterado, como la escribiría otra persona."""
+    if rng.random() < 0.4:
+        nombre = _sin_tildes(nombre)
+    if rng.random() < 0.3:
+        partes = nombre.split()
+        nombre = " ".join(partes[1:] + partes[:1])          # "Apellidos Nombre"
+    if rng.random() < 0.2 and len(nombre) > 6:
+        k = rng.randrange(1, len(nombre) - 1)
+        nombre = nombre[:k] + nombre[k + 1:]                 # error de digitación
+    if rng.random() < 0.3:
+        nombre = nombre.upper()
+
+    cambio = rng.random()
+    if cambio < 0.15:
+        telefono = telefono_nuevo                            # cambió de número
+    elif cambio < 0.6:
+        telefono = rng.choice([f"+57 {telefono}",
+                               f"{telefono[:3]} {telefono[3:6]} {telefono[6:]}",
+                               f"({telefono[:3]}) {telefono[3:6]}-{telefono[6:]}"])
+
+    local, _, dominio = correo.partition("@")
+    cambio = rng.random()
+    if cambio < 0.15:
+        correo = f"{local}{rng.randrange(10, 99)}@{dominio}" # otra cuenta, mismo dominio
+    elif cambio < 0.45:
+        correo = rng.choice([correo.upper(), f"{local}+agenda@{dominio}", f" {correo} "])
+    return nombre, telefono, correo
+
+
+def generar_registros(n: int, tasa_duplicados: float = 0.3, semilla: int = 0
+                      ) -> Tuple[List[Registro], List[int]]:
+    """
+    n registros repartidos entre 'archivo' y 'agenda'; una fracción son copias
+    alteradas de otra persona. Devuelve también la persona real de cada
+    registro (para medir precisión).
+    """
+    rng = random.Random(semilla)
+    registros: List[Registro] = []
+    persona: List[int] = []
+    originales: List[Tuple[str, str, str]] = []
+    for i in range(n):
+        if originales and rng.random() < tasa_duplicados:
+            p = rng.randrange(len(originales))
+            nombre, telefono, correo = _variar(rng, *originales[p],
+                                               str(3_100_000_000 + rng.randrange(10 ** 8)))
+        else:
+            p = len(originales)
+            nombre = (f"{rng.choice(_NOMBRES)} {rng.choice(_APELLIDOS)} "
+                      f"{rng.choice(_APELLIDOS)}")
+            telefono = str(3_000_000_000 + p)
+            local = _sin_tildes(nombre).lower().replace(" ", ".")
+            correo = f"{local}{rng.randrange(1000)}@{rng.choice(_DOMINIOS)}"
+            originales.append((nombre, telefono, correo))
+        fuente = "archivo" if rng.random() < 0.5 else "agenda"
+        registros.append(Registro(fuente, i, nombre, telefono, correo))
+        persona.append(p)
+    return registros, persona
+
+
+def _pares(tamanos: Iterable[int]) -> int:
+    return sum(k * (k - 1) // 2 for k in tamanos)
+
+
+def informe_precision(grupos: Sequence[Sequence[int]], persona: Sequence[int]
+                      ) -> Dict[str, float]:
+    """Precisión, exhaustividad y F1 sobre pares de registros (verdad conocida)."""
+    predichos = _pares(len(g) for g in grupos)
+    correctos = _pares(c for g in grupos for c in Counter(persona[i] for i in g).values())
+    reales = _pares(Counter(persona).values())
+    precision = correctos / predichos if predichos else 1.0
+    exhaustividad = correctos / reales if reales else 1.0
+    f1 = (2 * precision * exhaustividad / (precision + exhaustividad)
+          if precision + exhaustividad else 0.0)
+    return {"pares_predichos": predichos, "pares_reales": reales,
+            "pares_correctos": correctos, "precision": precision,
+            "exhaustividad": exhaustividad, "f1": f1}
+
+
+def benchmark(n: int = 1_000_000, procesos: Optional[int] = None,
+              semilla: int = 0) -> Dict[str, float]:
+    registros, persona = generar_registros(n, semilla=semilla)
+    t0 = time.perf_counter()
+    resultado = deduplicar(registros, procesos)
+    segundos = time.perf_counter() - t0
+    informe = informe_precision(resultado.grupos, persona)
+    informe.update({
+        "registros": n,
+        "segundos": segundos,
+        "fusionados": len(resultado.fusionados),
+        "bloques": resultado.bloques,
+        "bloques_omitidos": resultado.bloques_omitidos,
+        "comparaciones": resultado.comparaciones,
+        "comparaciones_todos_contra_todos": n * (n - 1) // 2,
+    })
+    return informe
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Fusiona contactos duplicados de archivo.txt y la agenda.")
+    parser.add_argument("--archivo", help="archivo de ContactBook (p. ej. archivo.txt)")
+    parser.add_argument("--agenda", help="agenda SQLite (p. ej. agenda.db)")
+    parser.add_argument("--salida", default="fusionados.csv", help="CSV de resultado")
+    parser.add_argument("--procesos", type=int, help="procesos (1 = sin pool)")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="benchmark e informe de precisión con N registros sintéticos")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("duplicados", n=args.bench, procesos=args.procesos)
+        return
+    if not (args.archivo or args.agenda):
+        parser.error("indique --archivo y/o --agenda, o --bench N")
+
+    registros: List[Registro] = []
+    if args.archivo:
+        from contactos import ContactBook
+        registros += desde_contactbook(ContactBook(args.archivo))
+    if args.agenda:
+        from agenda import AgendaContactos
+        agenda = AgendaContactos(Path(args.agenda))
+        try:
+            registros += desde_agenda(agenda)
+        finally:
+            agenda.cerrar()
+
+    resultado = deduplicar(registros, args.procesos)
+    total = escribir_fusionados(resultado.fusionados, Path(args.salida))
+    print(f"{len(registros)} registros -> {total} contactos en {args.salida} "
+          f"({len(resultado.grupos)} grupos de duplicados)")
+
+
+if __name__ == "__main__":
+    main()
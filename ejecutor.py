@@ -0,0 +1,240 @@
+# ejecutor.py
+# Ejecuta operaciones de archivo y cálculo fuera del hilo de Tkinter y
+# devuelve los resultados al bucle de eventos con after().
+#
+# Uso típico desde una ventana:
+#
+#   self.ejecutor = EjecutorTareas(self)
+#   self.ejecutor.enviar(lector.leer_todo, clave="leer",
+#                        al_terminar=self._mostrar, al_fallar=self._error)
+#
+# - Las funciones corren en un pool de hilos (o de procesos con en_proceso=True).
+# - Los callbacks (al_terminar, al_fallar, al_progresar) siempre se ejecutan
+#   en el hilo de Tkinter, nunca en el hilo de trabajo.
+# - Dos envíos con la misma 'clave' mientras el primero sigue en curso se
+#   unen en una sola tarea (p. ej. doble clic en "Leer archivo"). La clave
+#   debe incluir los argumentos que distinguen una petición de otra.
+# - Con con_control=True la función recibe control=Control para informar
+#   progreso y consultar si se pidió cancelar. En el pool de procesos el
+#   control viaja al otro proceso (ControlProceso): usa una cola y un evento
+#   de multiprocessing.Manager, que se inicia la primera vez que hace falta.
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional
+
+if TYPE_CHECKING:                     # concurrent.futures se carga al crear el pool
+    from concurrent.futures import Future
+
+
+INTERVALO_MS = 20        # frecuencia con que el hilo de Tk revisa resultados
+
+
+class Cancelada(Exception):
+    """La tarea se canceló antes de terminar."""
+
+
+class Control:
+    """Canal entre la función de trabajo y la interfaz."""
+    def __init__(self, tarea: "Tarea"):
+        self._tarea = tarea
+
+    @property
+    def cancelada(self) -> bool:
+        return self._tarea._evento_cancelar.is_set()
+
+    def verificar(self) -> None:
+        """Lanza Cancelada si se pidió cancelar la tarea."""
+        if self.cancelada:
+            raise Cancelada()
+
+    def progreso(self, fraccion: float, mensaje: str = "") -> None:
+        self._tarea._ejecutor._cola.put(("progreso", self._tarea, (fraccion, mensaje)))
+
+
+class ControlProceso:
+    """Igual que Control, pero se puede enviar a un proceso de trabajo (pickle)."""
+    def __init__(self, id_tarea: int, evento_cancelar, cola_progreso):
+        self._id = id_tarea
+        self._evento = evento_cancelar        # proxies de multiprocessing.Manager
+        self._cola = cola_progreso
+
+    @property
+    def cancelada(self) -> bool:
+        return self._evento.is_set()
+
+    def verificar(self) -> None:
+        """Lanza Cancelada si se pidió cancelar la tarea."""
+        if self.cancelada:
+            raise Cancelada()
+
+    def progreso(self, fraccion: float, mensaje: str = "") -> None:
+        self._cola.put((self._id, fraccion, mensaje))
+
+
+class Tarea:
+    def __init__(self, ejecutor: "EjecutorTareas", clave: Optional[Hashable],
+                 al_terminar, al_fallar, al_progresar):
+        self._ejecutor = ejecutor
+        self.clave = clave
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.al_progresar = al_progresar
+        self._evento_cancelar = threading.Event()
+        self._evento_proceso = None           # evento del Manager (en_proceso + con_control)
+        self.futuro: Optional["Future"] = None
+
+    @property
+    def terminada(self) -> bool:
+        return self.futuro is not None and self.futuro.done()
+
+    def cancelar(self) -> None:
+        """Pide cancelar: no empieza si está en cola, o se detiene en el próximo verificar()."""
+        self._evento_cancelar.set()
+        if self._evento_proceso is not None:
+            self._evento_proceso.set()
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+
+class EjecutorTareas:
+    def __init__(self, raiz, hilos: int = 4, intervalo_ms: int = INTERVALO_MS):
+        self.raiz = raiz                      # cualquier widget de Tk (usa after)
+        self.intervalo_ms = intervalo_ms
+        self._max_hilos = hilos
+        self._hilos = None                    # se crea al primer envío
+        self._procesos = None                 # se crea al primer en_proceso=True
+        self._manager = None                  # se crea al primer en_proceso + con_control
+        self._progreso_procesos = None        # cola del Manager: (id, fracción, mensaje)
+        self._con_control_en_proceso: Dict[int, Tarea] = {}
+        self._cola: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._en_curso: Dict[Hashable, Tarea] = {}
+        self._pendientes = 0
+        self._id_after = None
+
+    def enviar(self, funcion: Callable, *args, clave: Optional[Hashable] = None,
+               al_terminar: Optional[Callable[[Any], None]] = None,
+               al_fallar: Optional[Callable[[BaseException], None]] = None,
+               al_progresar: Optional[Callable[[float, str], None]] = None,
+               con_control: bool = False, en_proceso: bool = False, **kwargs) -> Tarea:
+        """Programa funcion(*args, **kwargs) en segundo plano y devuelve su Tarea."""
+        previa = self._en_curso.get(clave) if clave is not None else None
+        if previa is not None and not previa._evento_cancelar.is_set():
+            return previa                     # petición repetida: se une a la que corre
+
+        tarea = Tarea(self, clave, al_terminar, al_fallar, al_progresar)
+        if con_control and en_proceso:
+            kwargs["control"] = self._control_proceso(tarea)
+        elif con_control:
+            kwargs["control"] = Control(tarea)
+
+        if en_proceso:
+            if self._procesos is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self._procesos = ProcessPoolExecutor()
+            tarea.futuro = self._procesos.submit(funcion, *args, **kwargs)
+        else:
+            if self._hilos is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._hilos = ThreadPoolExecutor(max_workers=self._max_hilos,
+                                                 thread_name_prefix="tarea")
+            tarea.futuro = self._hilos.submit(self._correr, tarea, funcion, args, kwargs)
+        tarea.futuro.add_done_callback(lambda f: self._cola.put(("fin", tarea, f)))
+
+        if clave is not None:
+            self._en_curso[clave] = tarea
+        self._pendientes += 1
+        self._programar()
+        return tarea
+
+    def _control_proceso(self, tarea: Tarea) -> ControlProceso:
+        if self._manager is None:
+            import multiprocessing
+            self._manager = multiprocessing.Manager()
+            self._progreso_procesos = self._manager.Queue()
+        tarea._evento_proceso = self._manager.Event()
+        self._con_control_en_proceso[id(tarea)] = tarea
+        return ControlProceso(id(tarea), tarea._evento_proceso, self._progreso_procesos)
+
+    @staticmethod
+    def _correr(tarea: Tarea, funcion: Callable, args, kwargs):
+        if tarea._evento_cancelar.is_set():
+            raise Cancelada()
+        return funcion(*args, **kwargs)
+
+    # ---- hilo de Tk ----
+    def _programar(self) -> None:
+        if self._id_after is None:
+            self._id_after = self.raiz.after(self.intervalo_ms, self._bombear)
+
+    def _bombear(self) -> None:
+        """Entrega en el hilo de Tk los mensajes que dejaron los hilos de trabajo."""
+        self._id_after = None
+        # El avance de los procesos se lee antes que los finales: así llega
+        # completo aunque la tarea haya terminado desde la última revisión.
+        while self._con_control_en_proceso:
+            try:
+                id_tarea, fraccion, mensaje = self._progreso_procesos.get_nowait()
+            except queue.Empty:
+                break
+            tarea = self._con_control_en_proceso.get(id_tarea)
+            if tarea is not None and tarea.al_progresar and not tarea._evento_cancelar.is_set():
+                tarea.al_progresar(fraccion, mensaje)
+        while True:
+            try:
+                tipo, tarea, dato = self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "progreso":
+                if tarea.al_progresar and not tarea._evento_cancelar.is_set():
+                    tarea.al_progresar(*dato)
+                continue
+            self._pendientes -= 1
+            self._con_control_en_proceso.pop(id(tarea), None)
+            if tarea.clave is not None and self._en_curso.get(tarea.clave) is tarea:
+                del self._en_curso[tarea.clave]
+            self._entregar(tarea, dato)
+        if self._pendientes > 0:
+            self._programar()
+
+    @staticmethod
+    def _entregar(tarea: Tarea, futuro: "Future") -> None:
+        if futuro.cancelled() or tarea._evento_cancelar.is_set():
+            return
+        error = futuro.exception()
+        if isinstance(error, Cancelada):
+            return
+        if error is not None:
+            if tarea.al_fallar:
+                tarea.al_fallar(error)
+            return
+        if tarea.al_terminar:
+            tarea.al_terminar(futuro.result())
+
+    def en_curso(self, clave: Hashable) -> bool:
+        return clave in self._en_curso
+
+    def cerrar(self, cancelar: bool = True) -> None:
+        """
+        Libera los pools (llamar al cerrar la ventana). Con cancelar=False las
+        tareas pendientes terminan antes de que salga el intérprete, útil
+        para escrituras que no deben perderse.
+        """
+        if cancelar:
+            for tarea in list(self._en_curso.values()):
+                tarea.cancelar()
+        if self._id_after is not None:
+            try:
+                self.raiz.after_cancel(self._id_after)
+            except Exception:
+                pass
+            self._id_after = None
+        if self._hilos is not None:
+            self._hilos.shutdown(wait=False, cancel_futures=cancelar)
+        if self._procesos is not None:
+            self._procesos.shutdown(wait=False, cancel_futures=cancelar)
+        if self._manager is not None and cancelar:
+            # con cancelar=False los procesos aún pueden usar la cola; el
+            # Manager se detiene solo al salir el intérprete
+            self._manager.shutdown()
+            self._manager = None
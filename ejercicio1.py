@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import statistics
+from pathlib import Path
+
+from notas import acumular_archivo, convertir_nota, detectar_delimitador, resumir_notas
 
 class VentanaNotas:
     def __init__(self, root):
@@ -30,18 +32,21 @@ class VentanaNotas:
         btn_frame = ttk.Frame(cont)
         btn_frame.grid(row=5, column=0, columnspan=2, pady=(8,8))
         ttk.Button(btn_frame, text="Calcular", command=self.calcular).grid(row=0, column=0, padx=(0,6))
-        ttk.Button(btn_frame, text="Limpiar", command=self.limpiar).grid(row=0, column=1)
+        ttk.Button(btn_frame, text="Limpiar", command=self.limpiar).grid(row=0, column=1, padx=(0,6))
+        ttk.Button(btn_frame, text="Cargar archivo…", command=self.cargar_archivo).grid(row=0, column=2)
 
         # ====== RESULTADOS ======
         self.lbl_prom = ttk.Label(cont, text="Promedio = ")
         self.lbl_std  = ttk.Label(cont, text="Desviación estándar = ")
         self.lbl_max  = ttk.Label(cont, text="Valor mayor = ")
         self.lbl_min  = ttk.Label(cont, text="Valor menor = ")
+        self.lbl_med  = ttk.Label(cont, text="Mediana = ")
 
         self.lbl_prom.grid(row=6, column=0, columnspan=2, sticky="w", pady=(4,0))
         self.lbl_std.grid (row=7, column=0, columnspan=2, sticky="w")
         self.lbl_max.grid (row=8, column=0, columnspan=2, sticky="w")
         self.lbl_min.grid (row=9, column=0, columnspan=2, sticky="w")
+        self.lbl_med.grid (row=10, column=0, columnspan=2, sticky="w")
 
         cont.columnconfigure(1, weight=1)
 
@@ -56,42 +61,62 @@ class VentanaNotas:
         """Leer y validar que las 5 notas (entre 0.0 y 5.0)."""
         notas = []
         for e in self.entradas:
-            txt = e.get().strip().replace(",", ".")
+            txt = e.get().strip()
             if txt == "":
                 raise ValueError("Debe ingresar las 5 notas.")
-            try:
-                val = float(txt)
-            except ValueError:
-                raise ValueError("Todas las notas deben ser números.")
-            if not (0.0 <= val <= 5.0):
-                raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
-            notas.append(val)
+            notas.append(convertir_nota(txt))
         return notas
 
+    def _mostrar(self, resumen):
+        self.lbl_prom.config(text=f"Promedio = {self._fmt(resumen.promedio)}")
+        self.lbl_std.config (text=f"Desviación estándar = {self._fmt(resumen.desviacion)}")
+        self.lbl_max.config (text=f"Valor mayor = {self._fmt(resumen.mayor)}")
+        self.lbl_min.config (text=f"Valor menor = {self._fmt(resumen.menor)}")
+        self.lbl_med.config (text=f"Mediana = {self._fmt(resumen.mediana)}")
+
     # ---- acciones ----
     def calcular(self):
         try:
             notas = self._leer_notas()
-
-            prom = sum(notas) / len(notas)
-            if self.USE_SAMPLE_STD and len(notas) > 1:
-                desv = statistics.stdev(notas)
-            else:
-                desv = statistics.pstdev(notas)
-
-            mayor = max(notas)
-            menor = min(notas)
-
-            self.lbl_prom.config(text=f"Promedio = {self._fmt(prom)}")
-            self.lbl_std.config (text=f"Desviación estándar = {self._fmt(desv)}")
-            self.lbl_max.config (text=f"Valor mayor = {self._fmt(mayor)}")
-            self.lbl_min.config (text=f"Valor menor = {self._fmt(menor)}")
+            self._mostrar(resumir_notas(notas, muestral=self.USE_SAMPLE_STD))
 
         except ValueError as ex:
             messagebox.showerror("Error", str(ex))
         except Exception:
             messagebox.showerror("Error", "Verifique que todas las notas sean validas.")
 
+    def _mostrar_acumulado(self, acc):
+        self.lbl_prom.config(text=f"Promedio = {self._fmt(acc.promedio)}")
+        self.lbl_std.config (text=f"Desviación estándar = {self._fmt(acc.desviacion(self.USE_SAMPLE_STD))}")
+        self.lbl_max.config (text=f"Valor mayor = {self._fmt(acc.mayor)}")
+        self.lbl_min.config (text=f"Valor menor = {self._fmt(acc.menor)}")
+        self.lbl_med.config (text="Mediana = (no se calcula al leer un archivo)")
+
+    def cargar_archivo(self):
+        """Resume un archivo de notas (una por línea o una columna de CSV) sin cargarlo en memoria."""
+        from tkinter import filedialog, simpledialog  # se cargan solo al abrir el diálogo
+
+        ruta = filedialog.askopenfilename(
+            title="Selecciona un archivo de notas",
+            filetypes=[("Archivos de notas", "*.txt;*.csv;*.*")]
+        )
+        if not ruta:
+            return
+        columna = simpledialog.askstring(
+            "Columna", "Columna del CSV (nombre o número desde 0).\n"
+                       "Deje vacío si el archivo tiene una nota por línea:",
+            parent=self.root)
+        if columna is None:
+            return  # canceló
+        columna = columna.strip() or None
+        try:
+            delimitador = detectar_delimitador(Path(ruta)) if columna else ","
+            self._mostrar_acumulado(acumular_archivo(Path(ruta), columna, delimitador))
+        except ValueError as ex:
+            messagebox.showerror("Error", str(ex))
+        except OSError as ex:
+            messagebox.showerror("Error", f"No se pudo leer el archivo:\n{ex}")
+
     def limpiar(self):
         for e in self.entradas:
             e.delete(0, tk.END)
@@ -99,6 +124,7 @@ class VentanaNotas:
         self.lbl_std.config (text="Desviación estándar = ")
         self.lbl_max.config (text="Valor mayor = ")
         self.lbl_min.config (text="Valor menor = ")
+        self.lbl_med.config (text="Mediana = ")
 
 # ====== main ======
 if __name__ == "__main__":
@@ -1,46 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from abc import ABC, abstractmethod
-from math import pi
-
-# ================== MODELO (POO) ==================
-
-class FiguraGeometrica(ABC):
-    @abstractmethod
-    def volumen(self) -> float: ...
-    @abstractmethod
-    def superficie(self) -> float: ...
-
-class Cilindro(FiguraGeometrica):
-    def __init__(self, radio: float, altura: float):
-        self.radio = radio
-        self.altura = altura
-    def volumen(self) -> float:
-        return pi * (self.radio ** 2) * self.altura
-    def superficie(self) -> float:
-        return 2 * pi * self.radio * (self.radio + self.altura)
-
-class Esfera(FiguraGeometrica):
-    def __init__(self, radio: float):
-        self.radio = radio
-    def volumen(self) -> float:
-        return (4.0 / 3.0) * pi * (self.radio ** 3)
-    def superficie(self) -> float:
-        return 4 * pi * (self.radio ** 2)
-
-class Piramide(FiguraGeometrica):
-    """Pirámide de base cuadrada (base = lado, apotema = slant height)."""
-    def __init__(self, base: float, altura: float, apotema: float):
-        self.base = base
-        self.altura = altura
-        self.apotema = apotema
-    def volumen(self) -> float:
-        return (1.0 / 3.0) * (self.base ** 2) * self.altura
-    def superficie(self) -> float:
-        area_base = self.base ** 2
-        perimetro = 4 * self.base
-        area_lateral = 0.5 * perimetro * self.apotema
-        return area_base + area_lateral
+
+from figuras import Cilindro, Esfera, Piramide, convertir_dimension
 
 # ================== VISTA / CONTROL (Tkinter) ==================
 
@@ -62,16 +23,7 @@ class AppFiguras:
 
     # ---------- Helpers ----------
     def _leer_float(self, entry: ttk.Entry, nombre: str) -> float:
-        txt = entry.get().strip().replace(",", ".")
-        if not txt:
-            raise ValueError(f"Ingrese {nombre}.")
-        try:
-            val = float(txt)
-        except ValueError:
-            raise ValueError(f"{nombre} debe ser numérico.")
-        if val <= 0:
-            raise ValueError(f"{nombre} debe ser mayor que 0.")
-        return val
+        return convertir_dimension(entry.get(), nombre)
 
     def _f(self, x: float) -> str:
         return f"{x:.2f}".replace(".", ",")
@@ -0,0 +1,16 @@
+# fechas.py
+# Conversión de fechas dd/mm/aaaa compartida por los modelos (sin dependencias).
+
+from datetime import date, datetime
+from typing import Optional
+
+
+def parsear_fecha(cadena: str) -> Optional[date]:
+    """
+    Intenta convertir 'dd/mm/aaaa' en un objeto date.
+    Devuelve None si el formato es inválido.
+    """
+    try:
+        return datetime.strptime(cadena.strip(), "%d/%m/%Y").date()
+    except ValueError:
+        return None
@@ -0,0 +1,403 @@
+# figuras.py
+# Modelo de figuras geométricas y cálculo por lotes (sin dependencias de Tkinter).
+
+import argparse
+import csv
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import nullcontext
+from itertools import islice
+from math import isfinite, nan, pi
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from opcionales import numpy as _numpy   # NumPy se importa al primer uso
+
+
+# ================== MODELO (POO) ==================
+
+# Registro de figuras concretas: nombre en minúsculas -> clase
+FIGURAS: Dict[str, Type["FiguraGeometrica"]] = {}
+
+
+class FiguraGeometrica(ABC):
+    """
+    Cada subclase declara CAMPOS (sus dimensiones, en orden) y las fórmulas
+    como métodos estáticos. Las fórmulas solo usan operaciones aritméticas,
+    así que funcionan igual con números sueltos o con arreglos de NumPy.
+    """
+    CAMPOS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.CAMPOS:
+            FIGURAS[cls.__name__.lower()] = cls
+
+    @abstractmethod
+    def volumen(self) -> float: ...
+    @abstractmethod
+    def superficie(self) -> float: ...
+
+class Cilindro(FiguraGeometrica):
+    CAMPOS = ("radio", "altura")
+    def __init__(self, radio: float, altura: float):
+        self.radio = radio
+        self.altura = altura
+    @staticmethod
+    def formula_volumen(radio, altura):
+        return pi * (radio ** 2) * altura
+    @staticmethod
+    def formula_superficie(radio, altura):
+        return 2 * pi * radio * (radio + altura)
+    def volumen(self) -> float:
+        return self.formula_volumen(self.radio, self.altura)
+    def superficie(self) -> float:
+        return self.formula_superficie(self.radio, self.altura)
+
+class Esfera(FiguraGeometrica):
+    CAMPOS = ("radio",)
+    def __init__(self, radio: float):
+        self.radio = radio
+    @staticmethod
+    def formula_volumen(radio):
+        return (4.0 / 3.0) * pi * (radio ** 3)
+    @staticmethod
+    def formula_superficie(radio):
+        return 4 * pi * (radio ** 2)
+    def volumen(self) -> float:
+        return self.formula_volumen(self.radio)
+    def superficie(self) -> float:
+        return self.formula_superficie(self.radio)
+
+class Piramide(FiguraGeometrica):
+    """Pirámide de base cuadrada (base = lado, apotema = slant height)."""
+    CAMPOS = ("base", "altura", "apotema")
+    def __init__(self, base: float, altura: float, apotema: float):
+        self.base = base
+        self.altura = altura
+        self.apotema = apotema
+    @staticmethod
+    def formula_volumen(base, altura, apotema):
+        return (1.0 / 3.0) * (base ** 2) * altura
+    @staticmethod
+    def formula_superficie(base, altura, apotema):
+        area_base = base ** 2
+        perimetro = 4 * base
+        area_lateral = 0.5 * perimetro * apotema
+        return area_base + area_lateral
+    def volumen(self) -> float:
+        return self.formula_volumen(self.base, self.altura, self.apotema)
+    def superficie(self) -> float:
+        return self.formula_superficie(self.base, self.altura, self.apotema)
+
+
+# ================== CÁLCULO POR LOTES ==================
+
+def obtener_figura(tipo: str) -> Type[FiguraGeometrica]:
+    try:
+        return FIGURAS[tipo.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Figura desconocida: '{tipo}'. "
+                         f"Opciones: {', '.join(sorted(FIGURAS))}.")
+
+
+def calcular_lote(tipo: str, columnas: Dict[str, Sequence[float]]):
+    """
+    Calcula volúmenes y superficies de muchas figuras del mismo tipo en una
+    sola llamada. 'columnas' trae un arreglo por dimensión (ver CAMPOS).
+
+    Con NumPy devuelve dos arreglos (cálculo vectorizado); sin NumPy,
+    dos listas.
+    """
+    cls = obtener_figura(tipo)
+    faltantes = [c for c in cls.CAMPOS if c not in columnas]
+    if faltantes:
+        raise ValueError(f"Faltan dimensiones para {tipo}: {', '.join(faltantes)}.")
+
+    np = _numpy()
+    if np is not None:
+        datos = [np.asarray(columnas[c], dtype=float) for c in cls.CAMPOS]
+        return cls.formula_volumen(*datos), cls.formula_superficie(*datos)
+
+    datos = [[float(v) for v in columnas[c]] for c in cls.CAMPOS]
+    return (list(map(cls.formula_volumen, *datos)),
+            list(map(cls.formula_superficie, *datos)))
+
+
+def convertir_dimension(txt: str, nombre: str) -> float:
+    """Convierte texto ("2,5" o "2.5") en dimensión validada (mayor que 0)."""
+    txt = txt.strip().replace(",", ".")
+    if not txt:
+        raise ValueError(f"Ingrese {nombre}.")
+    try:
+        val = float(txt)
+    except ValueError:
+        raise ValueError(f"{nombre} debe ser numérico.")
+    if not isfinite(val):
+        raise ValueError(f"{nombre} debe ser un número finito.")
+    if val <= 0:
+        raise ValueError(f"{nombre} debe ser mayor que 0.")
+    return val
+
+
+def procesar_csv(entrada: Path, salida: Path, tipo: str,
+                 delimitador: str = ",", encoding: str = "utf-8") -> int:
+    """
+    Lee un CSV con una columna por dimensión de 'tipo' y escribe el mismo
+    CSV con las columnas 'volumen' y 'superficie'. Devuelve las filas escritas.
+    """
+    cls = obtener_figura(tipo)
+    with Path(entrada).open("r", encoding=encoding, newline="") as f:
+        lector = csv.DictReader(f, delimiter=delimitador)
+        faltantes = [c for c in cls.CAMPOS if c not in (lector.fieldnames or [])]
+        if faltantes:
+            raise ValueError(f"Faltan columnas: {', '.join(faltantes)}.")
+        campos_entrada = list(lector.fieldnames)
+        filas = list(lector)
+
+    columnas: Dict[str, List[float]] = {c: [] for c in cls.CAMPOS}
+    for num, fila in enumerate(filas, start=2):
+        for c in cls.CAMPOS:
+            try:
+                columnas[c].append(convertir_dimension(fila[c] or "", c))
+            except ValueError as ex:
+                raise ValueError(f"Línea {num}: {ex}")
+
+    volumenes, superficies = calcular_lote(tipo, columnas)
+
+    with Path(salida).open("w", encoding=encoding, newline="") as f:
+        w = csv.writer(f, delimiter=delimitador)
+        w.writerow(campos_entrada + ["volumen", "superficie"])
+        for fila, v, s in zip(filas, volumenes, superficies):
+            w.writerow([fila[c] for c in campos_entrada] + [f"{v:.6f}", f"{s:.6f}"])
+    return len(filas)
+
+
+# ================== ARCHIVOS MIXTOS (PIPELINE) ==================
+
+TAMANO_BLOQUE = 50_000
+
+
+def validar_dimensiones(tipo: str, columnas: Dict[str, Sequence[str]]
+                        ) -> Tuple[Dict[str, List[float]], List[Optional[str]]]:
+    """
+    Valida en bloque las dimensiones (texto) de muchas figuras del mismo tipo.
+
+    Devuelve las columnas convertidas a float y una lista con el primer error
+    de cada fila (None si la fila es válida). A diferencia de
+    convertir_dimension, nunca lanza excepciones por valores inválidos.
+    """
+    cls = obtener_figura(tipo)
+    np = _numpy()
+    n = len(columnas[cls.CAMPOS[0]]) if cls.CAMPOS else 0
+    errores: List[Optional[str]] = [None] * n
+    valores: Dict[str, List[float]] = {}
+
+    for c in cls.CAMPOS:
+        col: List[float] = []
+        for i, txt in enumerate(columnas[c]):
+            txt = txt.strip().replace(",", ".")
+            try:
+                col.append(float(txt))
+            except ValueError:
+                col.append(nan)
+                if errores[i] is None:
+                    errores[i] = f"Ingrese {c}." if not txt else f"{c} debe ser numérico."
+        valores[c] = col
+
+        # Rango en bloque: 'nan'/'inf' se convierten sin error, así que se
+        # rechazan antes de exigir dimensiones estrictamente positivas
+        if np is not None:
+            arr = np.asarray(col)
+            no_finitos = np.flatnonzero(~np.isfinite(arr)).tolist()
+            malos = np.flatnonzero(arr <= 0).tolist()
+        else:
+            no_finitos = [i for i, v in enumerate(col) if not isfinite(v)]
+            malos = [i for i, v in enumerate(col) if v <= 0]
+        for i in no_finitos:
+            if errores[i] is None:
+                errores[i] = f"{c} debe ser un número finito."
+        for i in malos:
+            if errores[i] is None:
+                errores[i] = f"{c} debe ser mayor que 0."
+    return valores, errores
+
+
+def procesar_bloque(filas: Sequence[Sequence[str]], primera_linea: int = 1
+                    ) -> List[Tuple[int, str, str, str, str]]:
+    """
+    Procesa un bloque de filas mixtas (tipo, dimensiones…). Particiona por
+    tipo, valida y calcula cada partición con calcular_lote, y devuelve las
+    filas de salida (linea, tipo, volumen, superficie, error) en el orden
+    de entrada. Las filas en blanco se omiten.
+    """
+    salida: List[Optional[Tuple[int, str, str, str, str]]] = [None] * len(filas)
+    particiones: Dict[str, List[int]] = {}
+    for i, fila in enumerate(filas):
+        if not any(celda.strip() for celda in fila):
+            continue                       # línea en blanco
+        tipo = fila[0].strip().lower()
+        linea = primera_linea + i
+        cls = FIGURAS.get(tipo)
+        dims = len(fila) - 1
+        while dims > 0 and not fila[dims].strip():
+            dims -= 1                      # celdas vacías al final (encabezado ancho)
+        if cls is None:
+            salida[i] = (linea, tipo, "", "", f"Figura desconocida: '{tipo}'.")
+        elif dims != len(cls.CAMPOS):
+            salida[i] = (linea, tipo, "", "",
+                         f"{tipo} requiere {len(cls.CAMPOS)} dimensiones "
+                         f"({', '.join(cls.CAMPOS)}).")
+        else:
+            particiones.setdefault(tipo, []).append(i)
+
+    for tipo, indices in particiones.items():
+        cls = FIGURAS[tipo]
+        texto = {c: [filas[i][k + 1] for i in indices] for k, c in enumerate(cls.CAMPOS)}
+        valores, errores = validar_dimensiones(tipo, texto)
+
+        validos = [j for j, e in enumerate(errores) if e is None]
+        columnas = {c: [valores[c][j] for j in validos] for c in cls.CAMPOS}
+        volumenes, superficies = calcular_lote(tipo, columnas)
+        for j, v, s in zip(validos, volumenes, superficies):
+            i = indices[j]
+            salida[i] = (primera_linea + i, tipo, f"{v:.6f}", f"{s:.6f}", "")
+        for j, e in enumerate(errores):
+            if e is not None:
+                i = indices[j]
+                salida[i] = (primera_linea + i, tipo, "", "", e)
+    return [fila for fila in salida if fila is not None]
+
+
+def procesar_csv_mixto(entrada: Path, salida: Path, procesos: Optional[int] = None,
+                       tamano_bloque: int = TAMANO_BLOQUE, delimitador: str = ",",
+                       encoding: str = "utf-8") -> Tuple[int, int]:
+    """
+    Procesa un CSV heterogéneo con filas 'tipo,dim1[,dim2…]' (encabezado
+    opcional si la primera celda es 'tipo'). Los bloques se evalúan en un
+    pool de procesos (con procesos=1, en este mismo proceso); como máximo
+    hay dos bloques por proceso en vuelo, así que la memoria no depende del
+    tamaño del archivo. Los resultados se escriben en el orden de entrada.
+    Devuelve (filas, filas_con_error).
+    """
+    if procesos == 1:
+        pool = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=procesos)
+
+    total = errores = 0
+    with Path(entrada).open("r", encoding=encoding, newline="") as fin, \
+            Path(salida).open("w", encoding=encoding, newline="") as fout, \
+            pool if pool is not None else nullcontext():
+        lector = csv.reader(fin, delimiter=delimitador)
+        w = csv.writer(fout, delimiter=delimitador)
+        w.writerow(["linea", "tipo", "volumen", "superficie", "error"])
+
+        linea = 1
+        pendientes: List[List[str]] = []
+        primera = next(lector, None)
+        if primera and primera[0].strip().lower() == "tipo":
+            linea = 2
+        elif primera is not None:
+            pendientes.append(primera)
+
+        en_vuelo: deque = deque()
+        limite = 2 * (procesos or os.cpu_count() or 1)
+
+        def escribir(filas) -> None:
+            nonlocal total, errores
+            for fila in filas:
+                w.writerow(fila)
+                total += 1
+                if fila[4]:
+                    errores += 1
+
+        while True:
+            bloque = pendientes + list(islice(lector, tamano_bloque - len(pendientes)))
+            pendientes = []
+            if not bloque:
+                break
+            if pool is None:
+                escribir(procesar_bloque(bloque, linea))
+            else:
+                en_vuelo.append(pool.submit(procesar_bloque, bloque, linea))
+            linea += len(bloque)
+            if len(en_vuelo) >= limite:
+                escribir(en_vuelo.popleft().result())
+        while en_vuelo:
+            escribir(en_vuelo.popleft().result())
+    return total, errores
+
+
+# ================== BENCHMARK ==================
+
+def generar_dimensiones(tipo: str, n: int, semilla: int = 0) -> Dict[str, List[float]]:
+    """Dimensiones sintéticas reproducibles (0.1 – 100 cm)."""
+    rng = random.Random(semilla)
+    return {c: [round(rng.uniform(0.1, 100.0), 2) for _ in range(n)]
+            for c in obtener_figura(tipo).CAMPOS}
+
+
+def benchmark(n: int = 1_000_000, semilla: int = 0) -> Dict[str, float]:
+    """Compara un objeto por fila contra calcular_lote para cada figura."""
+    np = _numpy()
+    tiempos: Dict[str, float] = {}
+    for tipo, cls in FIGURAS.items():
+        columnas = generar_dimensiones(tipo, n, semilla)
+        datos = [columnas[c] for c in cls.CAMPOS]
+
+        t0 = time.perf_counter()
+        for dims in zip(*datos):
+            fig = cls(*dims)
+            fig.volumen()
+            fig.superficie()
+        tiempos[f"{tipo}_objetos"] = time.perf_counter() - t0
+
+        if np is not None:
+            columnas = {c: np.asarray(v) for c, v in columnas.items()}
+        t0 = time.perf_counter()
+        calcular_lote(tipo, columnas)
+        tiempos[f"{tipo}_lote"] = time.perf_counter() - t0
+    return tiempos
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Volumen y superficie por lotes.")
+    parser.add_argument("entrada", nargs="?",
+                        help="CSV con una columna por dimensión, o filas "
+                             "'tipo,dim1[,dim2…]' si no se indica --tipo")
+    parser.add_argument("salida", nargs="?", help="CSV de resultados")
+    parser.add_argument("--tipo", choices=sorted(FIGURAS),
+                        help="figura del archivo (sin --tipo: archivo mixto)")
+    parser.add_argument("--delimitador", default=",")
+    parser.add_argument("--procesos", type=int, help="procesos para archivos mixtos")
+    parser.add_argument("--bloque", type=int, default=TAMANO_BLOQUE,
+                        help="filas por bloque en archivos mixtos")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="ejecutar benchmark con N figuras por tipo")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("figuras_lote", n=args.bench)
+        return
+    if not (args.entrada and args.salida):
+        parser.error("indique entrada y salida, o --bench N")
+
+    if args.tipo is None:
+        filas, errores = procesar_csv_mixto(Path(args.entrada), Path(args.salida),
+                                            args.procesos, args.bloque, args.delimitador)
+        print(f"{filas} filas escritas en {args.salida} ({errores} con error)")
+        return
+
+    filas = procesar_csv(Path(args.entrada), Path(args.salida), args.tipo,
+                         args.delimitador)
+    print(f"{filas} filas escritas en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# hotel.py
+# Modelo del hotel: habitaciones, huéspedes y fechas (sin dependencias de Tkinter).
+
+from dataclasses import dataclass
+from typing import Optional, List, Tuple
+from datetime import date
+
+from fechas import parsear_fecha   # noqa: F401  (se sigue exponiendo desde hotel)
+from instrumentacion import medido
+
+
+# -------------------- MODELO --------------------
+
+@dataclass
+class Habitacion:
+    numero: int
+    precio_dia: int
+    disponible: bool = True
+    nombre: str = ""
+    apellidos: str = ""
+    documento: str = ""
+    fecha_ingreso: Optional[date] = None
+
+    def ocupar(self, nombre: str, apellidos: str, documento: str, fecha_ingreso: date) -> None:
+        self.disponible = False
+        self.nombre = nombre
+        self.apellidos = apellidos
+        self.documento = documento
+        self.fecha_ingreso = fecha_ingreso
+
+    def liberar(self) -> None:
+        self.disponible = True
+        self.nombre = ""
+        self.apellidos = ""
+        self.documento = ""
+        self.fecha_ingreso = None
+
+    @medido("hotel.calcular_estadia")
+    def calcular_estadia(self, fecha_salida: date) -> Tuple[int, int]:
+        """
+        Devuelve (días de alojamiento, total a pagar).
+        Lanza ValueError si la salida no es posterior al ingreso.
+        """
+        if self.fecha_ingreso is None:
+            raise ValueError("La habitación no está ocupada.")
+        if fecha_salida <= self.fecha_ingreso:
+            raise ValueError("La fecha de salida debe ser mayor que la fecha de ingreso.")
+        dias = (fecha_salida - self.fecha_ingreso).days
+        return dias, dias * self.precio_dia
+
+
+class Hotel:
+    def __init__(self, cantidad: int = 10):
+        self.habitaciones: List[Habitacion] = []
+        # Primera mitad: 120000, segunda mitad: 160000 (1-5 y 6-10 por defecto)
+        for i in range(1, cantidad + 1):
+            precio = 120_000 if i <= cantidad // 2 else 160_000
+            self.habitaciones.append(Habitacion(numero=i, precio_dia=precio))
+
+    @medido("hotel.obtener_habitacion")
+    def obtener_habitacion(self, numero: int) -> Optional[Habitacion]:
+        for h in self.habitaciones:
+            if h.numero == numero:
+                return h
+        return None
@@ -0,0 +1,269 @@
+# instrumentacion.py
+# Instrumentación opcional de las operaciones críticas del modelo:
+# conteo de llamadas, histograma de latencias y bytes leídos/escritos.
+#
+# Desactivada por defecto: los decoradores solo agregan una comprobación
+# de un booleano. Se activa con activar() o con variables de entorno
+# (ver configurar_desde_entorno):
+#
+#   INSTRUMENTACION=1                 activa las métricas
+#   INSTRUMENTACION_PUERTO=8765       sirve JSON en http://127.0.0.1:8765/metricas
+#   INSTRUMENTACION_VOLCADO=m.json    vuelca las métricas al salir
+#   INSTRUMENTACION_PERFIL=contactos.cargar
+#                                     cProfile + tracemalloc en la próxima llamada
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# Límites superiores (segundos) de las cubetas del histograma; la última es +inf
+CUBETAS_LATENCIA = (0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+CARPETA_PERFILES = Path("perfiles")
+
+_activa = False
+_lock = threading.Lock()
+_metricas: Dict[str, "Metrica"] = {}
+_perfil_pendiente: Optional[str] = None
+_servidor = None
+
+
+class Metrica:
+    __slots__ = ("llamadas", "errores", "total_s", "max_s", "histograma",
+                 "bytes_leidos", "bytes_escritos")
+
+    def __init__(self):
+        self.llamadas = 0
+        self.errores = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.histograma = [0] * (len(CUBETAS_LATENCIA) + 1)
+        self.bytes_leidos = 0
+        self.bytes_escritos = 0
+
+    def como_dict(self) -> Dict:
+        etiquetas = [f"<={c}s" for c in CUBETAS_LATENCIA] + ["+inf"]
+        return {
+            "llamadas": self.llamadas,
+            "errores": self.errores,
+            "total_s": self.total_s,
+            "promedio_s": self.total_s / self.llamadas if self.llamadas else 0.0,
+            "max_s": self.max_s,
+            "histograma": dict(zip(etiquetas, self.histograma)),
+            "bytes_leidos": self.bytes_leidos,
+            "bytes_escritos": self.bytes_escritos,
+        }
+
+
+def _metrica(nombre: str) -> Metrica:
+    m = _metricas.get(nombre)
+    if m is None:
+        m = _metricas.setdefault(nombre, Metrica())
+    return m
+
+
+def _registrar(nombre: str, segundos: float, error: bool) -> None:
+    i = 0
+    while i < len(CUBETAS_LATENCIA) and segundos > CUBETAS_LATENCIA[i]:
+        i += 1
+    with _lock:
+        m = _metrica(nombre)
+        m.llamadas += 1
+        m.errores += error
+        m.total_s += segundos
+        if segundos > m.max_s:
+            m.max_s = segundos
+        m.histograma[i] += 1
+
+
+# -------------------- CONTROL --------------------
+
+def activa() -> bool:
+    return _activa
+
+
+def activar(puerto: Optional[int] = None) -> None:
+    """Activa las métricas y, si se indica, el endpoint HTTP local."""
+    global _activa
+    _activa = True
+    if puerto is not None:
+        servir_metricas(puerto)
+
+
+def desactivar() -> None:
+    global _activa
+    _activa = False
+
+
+def reiniciar() -> None:
+    with _lock:
+        _metricas.clear()
+
+
+def capturar_perfil(operacion: str) -> None:
+    """La próxima llamada a 'operacion' se ejecuta con cProfile y tracemalloc."""
+    global _perfil_pendiente
+    _perfil_pendiente = operacion
+
+
+def configurar_desde_entorno() -> None:
+    """Aplica las variables INSTRUMENTACION* descritas al inicio del módulo."""
+    if os.environ.get("INSTRUMENTACION") == "1":
+        puerto = os.environ.get("INSTRUMENTACION_PUERTO")
+        activar(int(puerto) if puerto else None)
+    volcado = os.environ.get("INSTRUMENTACION_VOLCADO")
+    if volcado:
+        atexit.register(volcar_json, Path(volcado))
+    perfil = os.environ.get("INSTRUMENTACION_PERFIL")
+    if perfil:
+        capturar_perfil(perfil)
+
+
+# -------------------- MEDICIÓN --------------------
+
+def medido(nombre: str):
+    """Decorador: mide latencia y llamadas de la función bajo 'nombre'."""
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if not _activa and _perfil_pendiente is None:
+                return funcion(*args, **kwargs)
+            with medir(nombre):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+class _Nulo:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULO = _Nulo()
+
+
+def medir(nombre: str):
+    """Context manager equivalente a @medido para bloques de código."""
+    if _perfil_pendiente == nombre:
+        return _perfilar(nombre)
+    if not _activa:
+        return _NULO
+    return _medicion(nombre)
+
+
+@contextmanager
+def _medicion(nombre: str):
+    t0 = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        _registrar(nombre, time.perf_counter() - t0, error)
+
+
+def registrar_bytes(nombre: str, leidos: int = 0, escritos: int = 0) -> None:
+    if not _activa:
+        return
+    with _lock:
+        m = _metrica(nombre)
+        m.bytes_leidos += leidos
+        m.bytes_escritos += escritos
+
+
+# -------------------- PERFILES --------------------
+
+@contextmanager
+def perfilar(nombre: str):
+    """
+    Ejecuta el bloque con cProfile y tracemalloc. Guarda en CARPETA_PERFILES
+    '<nombre>-<marca>.prof' (abrir con pstats o snakeviz) y '<nombre>-<marca>.txt'
+    con las líneas que más memoria asignaron.
+    """
+    import cProfile
+    import tracemalloc
+
+    CARPETA_PERFILES.mkdir(parents=True, exist_ok=True)
+    marca = time.strftime("%Y%m%d-%H%M%S")
+    perfil = cProfile.Profile()
+    ya_trazando = tracemalloc.is_tracing()
+    if not ya_trazando:
+        tracemalloc.start()
+    perfil.enable()
+    try:
+        yield
+    finally:
+        perfil.disable()
+        captura = tracemalloc.take_snapshot()
+        actual, pico = tracemalloc.get_traced_memory()
+        if not ya_trazando:
+            tracemalloc.stop()
+        perfil.dump_stats(str(CARPETA_PERFILES / f"{nombre}-{marca}.prof"))
+        lineas = [f"memoria actual: {actual} B, pico: {pico} B", ""]
+        lineas += [str(s) for s in captura.statistics("lineno")[:25]]
+        (CARPETA_PERFILES / f"{nombre}-{marca}.txt").write_text("\n".join(lineas),
+                                                                encoding="utf-8")
+
+
+@contextmanager
+def _perfilar(nombre: str):
+    global _perfil_pendiente
+    _perfil_pendiente = None          # una sola acción
+    with perfilar(nombre):
+        if _activa:
+            with _medicion(nombre):
+                yield
+        else:
+            yield
+
+
+# -------------------- EXPORTACIÓN --------------------
+
+def volcar() -> Dict[str, Dict]:
+    """Copia de todas las métricas como diccionarios."""
+    with _lock:
+        return {nombre: m.como_dict() for nombre, m in sorted(_metricas.items())}
+
+
+def volcar_json(ruta: Path) -> None:
+    Path(ruta).write_text(json.dumps(volcar(), indent=2, ensure_ascii=False),
+                          encoding="utf-8")
+
+
+def servir_metricas(puerto: int = 8765, host: str = "127.0.0.1"):
+    """Sirve las métricas en JSON en http://host:puerto/metricas (hilo de fondo)."""
+    global _servidor
+    if _servidor is not None:
+        return _servidor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Manejador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metricas":
+                self.send_error(404)
+                return
+            cuerpo = json.dumps(volcar(), ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(cuerpo)))
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, *args):
+            pass
+
+    _servidor = ThreadingHTTPServer((host, puerto), Manejador)
+    threading.Thread(target=_servidor.serve_forever, daemon=True).start()
+    return _servidor
+
@@ -0,0 +1,329 @@
+# lector.py
+# Lectura de archivos de texto y de carpetas completas (sin dependencias de Tkinter).
+
+import argparse
+import codecs
+import io
+import mmap
+import os
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import instrumentacion
+from instrumentacion import medido
+
+
+DEFAULT_TEXT = "\n".join(f"Línea {i}" for i in range(1, 11)) + "\n"
+TAMANO_BLOQUE = 1 << 20      # caracteres por lectura cuando se informa progreso
+
+
+def asegurar_archivo(ruta: Path, encoding: str = "utf-8") -> None:
+    """Crea un archivo de ejemplo si no existe."""
+    if not ruta.exists():
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        ruta.write_text(DEFAULT_TEXT, encoding=encoding)
+
+
+class LeerArchivo:
+    """
+    Clase análoga al ejemplo Java:
+    - FileInputStream  -> apertura binaria ('rb')
+    - BufferedReader   -> io.BufferedReader sobre el binario
+    - InputStreamReader-> io.TextIOWrapper para decodificar a texto
+    """
+    def __init__(self, ruta: Path, encoding: str = "utf-8"):
+        self.ruta = Path(ruta)
+        self.encoding = encoding
+
+    @medido("lector.leer_todo")
+    def leer_todo(self, control=None) -> str:
+        """
+        Lee el archivo completo. Con 'control' (ver ejecutor.Control) lee por
+        bloques, informa el avance y se detiene si se pide cancelar.
+        """
+        with self.ruta.open("rb") as raw:               # FileInputStream
+            tamano = os.fstat(raw.fileno()).st_size
+            if instrumentacion.activa():
+                instrumentacion.registrar_bytes("lector.leer_todo", leidos=tamano)
+            buffered = io.BufferedReader(raw)           # BufferedReader
+            text = io.TextIOWrapper(                    # InputStreamReader
+                buffered, encoding=self.encoding, errors="replace", newline=None
+            )
+            try:
+                if control is None:
+                    return text.read()
+                partes = []
+                while True:
+                    control.verificar()
+                    bloque = text.read(TAMANO_BLOQUE)
+                    if not bloque:
+                        return "".join(partes)
+                    partes.append(bloque)
+                    control.progreso(raw.tell() / tamano if tamano else 1.0)
+            finally:
+                # Evita cierre doble de 'raw' en algunos entornos
+                text.detach()
+
+
+# -------------------- LECTURA DE CARPETAS --------------------
+
+BLOQUE_INDICE = 1 << 20      # bytes entre puntos de control del índice de líneas
+UMBRAL_MMAP = 4 << 20        # archivos más grandes se leen con mmap
+MUESTRA_ENCODING = 64 << 10  # bytes usados para detectar el encoding
+
+
+def detectar_encoding(muestra: bytes) -> str:
+    """BOM, luego UTF-8 estricto; si no decodifica, cp1252 (Windows en español)."""
+    if muestra.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if muestra.startswith(codecs.BOM_UTF16_LE):
+        return "utf-16-le"
+    if muestra.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16-be"
+    try:
+        muestra.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start < len(muestra) - 3:       # un carácter cortado al final no cuenta
+            return "cp1252"
+    return "utf-8"
+
+
+def _salto(encoding: str) -> bytes:
+    return "\n".encode(encoding.replace("-sig", ""))
+
+
+@dataclass(slots=True)
+class ResumenArchivo:
+    """
+    Tamaño, líneas y encoding de un archivo, con un índice disperso de
+    líneas: cada ~BLOQUE_INDICE bytes guarda (desplazamiento, número de línea)
+    del inicio de una línea, para llegar a cualquier línea sin releer todo.
+    """
+    ruta: Path
+    tamano: int = 0
+    lineas: int = 0
+    encoding: str = "utf-8"
+    error: str = ""
+    desplazamientos: array = field(default_factory=lambda: array("Q", [0]))
+    numeros: array = field(default_factory=lambda: array("Q", [0]))
+
+    def leer_linea(self, numero: int) -> str:
+        """Texto de la línea 'numero' (desde 0) sin el salto final."""
+        return self.leer_lineas(numero, 1)[0]
+
+    def leer_lineas(self, desde: int, cantidad: int) -> List[str]:
+        """
+        Hasta 'cantidad' líneas a partir de 'desde' (desde 0), sin el salto
+        final. Empieza a leer en el punto de control anterior a 'desde', así
+        que una página cuesta a lo sumo BLOQUE_INDICE bytes más que su texto.
+        """
+        if not 0 <= desde < self.lineas:
+            raise IndexError(f"{self.ruta.name} tiene {self.lineas} líneas.")
+        hasta = min(desde + cantidad, self.lineas)
+        k = bisect_right(self.numeros, desde) - 1
+        numero = self.numeros[k]
+        salto = _salto(self.encoding)
+        codec = "utf-8" if self.encoding == "utf-8-sig" else self.encoding
+        lineas: List[str] = []
+        pendiente = b""
+        with self.ruta.open("rb") as f:
+            f.seek(self.desplazamientos[k])
+            while numero < hasta:
+                bloque = f.read(BLOQUE_INDICE)
+                partes = (pendiente + bloque).split(salto)
+                pendiente = partes.pop()             # línea cortada por el bloque
+                if not bloque:
+                    partes.append(pendiente)         # última línea sin salto final
+                for parte in partes[max(0, desde - numero):hasta - numero]:
+                    lineas.append(parte.decode(codec, errors="replace")
+                                  .lstrip("\ufeff").rstrip("\r"))
+                numero += len(partes)
+                if not bloque:
+                    break
+        return lineas
+
+
+def _contar(datos, salto: bytes, inicio: int, fin: int) -> int:
+    if isinstance(datos, bytes):
+        return datos.count(salto, inicio, fin)
+    return datos[inicio:fin].count(salto)       # mmap no tiene count()
+
+
+def resumir_archivo(ruta: Path) -> ResumenArchivo:
+    """Lee un archivo (mmap si es grande, una lectura si es pequeño) y lo indexa."""
+    resumen = ResumenArchivo(Path(ruta))
+    try:
+        with resumen.ruta.open("rb") as f:
+            tamano = os.fstat(f.fileno()).st_size
+            if tamano >= UMBRAL_MMAP:
+                datos = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                datos = f.read()
+            try:
+                resumen.tamano = tamano
+                resumen.encoding = detectar_encoding(datos[:MUESTRA_ENCODING])
+                salto = _salto(resumen.encoding)
+                pos = linea = 0
+                while pos < tamano:
+                    corte = datos.find(salto, pos + BLOQUE_INDICE)
+                    if corte < 0:
+                        linea += _contar(datos, salto, pos, tamano)
+                        break
+                    corte += len(salto)
+                    linea += _contar(datos, salto, pos, corte)
+                    pos = corte
+                    if pos < tamano:
+                        resumen.desplazamientos.append(pos)
+                        resumen.numeros.append(linea)
+                if tamano and datos[tamano - len(salto):tamano] != salto:
+                    linea += 1                      # última línea sin salto final
+                resumen.lineas = linea
+            finally:
+                if isinstance(datos, mmap.mmap):
+                    datos.close()
+        if instrumentacion.activa():
+            instrumentacion.registrar_bytes("lector.resumir_archivo", leidos=resumen.tamano)
+    except OSError as e:
+        resumen.error = str(e)
+    return resumen
+
+
+class IndiceArchivos:
+    """Índice combinado de líneas de varios archivos (numeración global desde 0)."""
+    def __init__(self, archivos: List[ResumenArchivo]):
+        self.archivos = archivos
+        self._inicios = array("Q")           # primera línea global de cada archivo
+        total = 0
+        for a in archivos:
+            self._inicios.append(total)
+            total += a.lineas
+        self.total_lineas = total
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(a.tamano for a in self.archivos)
+
+    def ubicar(self, linea_global: int) -> Tuple[ResumenArchivo, int]:
+        """(archivo, línea dentro del archivo) de una línea global."""
+        if not 0 <= linea_global < self.total_lineas:
+            raise IndexError(f"Hay {self.total_lineas} líneas en total.")
+        i = bisect_right(self._inicios, linea_global) - 1
+        while self.archivos[i].lineas == 0:     # archivos vacíos comparten inicio
+            i += 1
+        return self.archivos[i], linea_global - self._inicios[i]
+
+    def leer_linea(self, linea_global: int) -> str:
+        archivo, numero = self.ubicar(linea_global)
+        return archivo.leer_linea(numero)
+
+    def encodings(self) -> Dict[str, int]:
+        return dict(Counter(a.encoding for a in self.archivos if not a.error))
+
+    def texto_resumen(self) -> str:
+        errores = sum(1 for a in self.archivos if a.error)
+        encodings = ", ".join(f"{e}: {n}" for e, n in sorted(self.encodings().items()))
+        return (f"{len(self.archivos)} archivos | {self.total_lineas:,} líneas | "
+                f"{self.total_bytes / 1e6:,.1f} MB | {encodings or '-'}"
+                + (f" | {errores} con error" if errores else ""))
+
+
+@medido("lector.indexar_carpeta")
+def indexar_carpeta(carpeta: Path, patron: str = "*", recursivo: bool = False,
+                    hilos: int = 8, control=None) -> IndiceArchivos:
+    """
+    Lee e indexa todos los archivos de 'carpeta' que cumplan 'patron' con un
+    pool de 'hilos' hilos (la lectura de disco libera el GIL). Con 'control'
+    (ver ejecutor.Control) informa avance y se puede cancelar.
+    """
+    carpeta = Path(carpeta)
+    candidatos = carpeta.rglob(patron) if recursivo else carpeta.glob(patron)
+    rutas = sorted(r for r in candidatos if r.is_file())
+    archivos: List[ResumenArchivo] = []
+    from concurrent.futures import ThreadPoolExecutor   # solo si se indexa una carpeta
+
+    pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="lector")
+    try:
+        for resumen in pool.map(resumir_archivo, rutas):
+            archivos.append(resumen)
+            if control is not None:
+                control.verificar()
+                control.progreso(len(archivos) / len(rutas), resumen.ruta.name)
+    finally:
+        pool.shutdown(cancel_futures=True)
+    return IndiceArchivos(archivos)
+
+
+# -------------------- BENCHMARK Y CLI --------------------
+
+def generar_carpeta(carpeta: Path, pequenos: int = 2000, kb_pequeno: int = 8,
+                    grandes: int = 2, mb_grande: int = 64) -> None:
+    """Muchos archivos pequeños y unos pocos grandes de líneas de log."""
+    carpeta.mkdir(parents=True, exist_ok=True)
+    linea = "2025-01-01 12:00:00 INFO acción registrada en el módulo de lectura\n"
+    bloque = linea * (1024 * kb_pequeno // len(linea.encode("utf-8")) + 1)
+    for i in range(pequenos):
+        (carpeta / f"pequeno_{i:05d}.log").write_text(bloque, encoding="utf-8")
+    grande = linea * ((1 << 20) // len(linea.encode("utf-8")))
+    for i in range(grandes):
+        with (carpeta / f"grande_{i}.log").open("w", encoding="utf-8") as f:
+            for _ in range(mb_grande):
+                f.write(grande)
+
+
+def benchmark_carpeta(pequenos: int = 2000, grandes: int = 2, mb_grande: int = 64,
+                      hilos: Sequence[int] = (1, 8)) -> Dict[str, float]:
+    """MB/s de indexar_carpeta con distinto número de hilos (caché de disco caliente)."""
+    import tempfile
+    resultados: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        carpeta = Path(tmp)
+        generar_carpeta(carpeta / "pequenos", pequenos=pequenos, grandes=0)
+        generar_carpeta(carpeta / "grandes", pequenos=0, grandes=grandes, mb_grande=mb_grande)
+        for nombre in ("pequenos", "grandes"):
+            indexar_carpeta(carpeta / nombre)                 # calienta el caché
+            for n in hilos:
+                t0 = time.perf_counter()
+                indice = indexar_carpeta(carpeta / nombre, hilos=n)
+                seg = time.perf_counter() - t0
+                resultados[f"{nombre}_{n}_hilos_mb_s"] = indice.total_bytes / 1e6 / seg
+    return resultados
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Lee e indexa una carpeta de archivos de texto.")
+    parser.add_argument("carpeta", nargs="?", help="carpeta a indexar")
+    parser.add_argument("--patron", default="*", help="patrón de archivos (p. ej. '*.log')")
+    parser.add_argument("--recursivo", action="store_true", help="incluir subcarpetas")
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--linea", type=int, metavar="N",
+                        help="mostrar la línea global N del índice combinado")
+    parser.add_argument("--bench", action="store_true", help="benchmark de lectura en MB/s")
+    parser.add_argument("--mb-grande", type=int, default=64,
+                        help="tamaño de cada archivo grande en --bench")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("lector_carpeta", mb_grande=args.mb_grande)
+        return
+    if not args.carpeta:
+        parser.error("indique una carpeta o --bench")
+
+    indice = indexar_carpeta(Path(args.carpeta), args.patron, args.recursivo, args.hilos)
+    if args.linea is not None:
+        archivo, numero = indice.ubicar(args.linea)
+        print(f"{archivo.ruta}:{numero + 1}: {archivo.leer_linea(numero)}")
+        return
+    for a in indice.archivos:
+        estado = f"ERROR {a.error}" if a.error else f"{a.lineas:>10,} líneas  {a.encoding}"
+        print(f"{a.tamano:>14,} B  {estado}  {a.ruta}")
+    print(indice.texto_resumen())
+
+
+if __name__ == "__main__":
+    main()
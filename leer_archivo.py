@@ -1,45 +1,16 @@
 # leer_archivo_gui.py
 # GUI con Tkinter para leer archivos de texto (versión OOP y equivalente al ejemplo de Java).
 
-import io
 import sys
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, messagebox
 from pathlib import Path
 
+import instrumentacion
+from ejecutor import EjecutorTareas
+from lector import DEFAULT_TEXT, LeerArchivo, asegurar_archivo, indexar_carpeta
 
-DEFAULT_TEXT = "\n".join(f"Línea {i}" for i in range(1, 11)) + "\n"
-
-
-def asegurar_archivo(ruta: Path, encoding: str = "utf-8") -> None:
-    """Crea un archivo de ejemplo si no existe."""
-    if not ruta.exists():
-        ruta.parent.mkdir(parents=True, exist_ok=True)
-        ruta.write_text(DEFAULT_TEXT, encoding=encoding)
-
-
-class LeerArchivo:
-    """
-    Clase análoga al ejemplo Java:
-    - FileInputStream  -> apertura binaria ('rb')
-    - BufferedReader   -> io.BufferedReader sobre el binario
-    - InputStreamReader-> io.TextIOWrapper para decodificar a texto
-    """
-    def __init__(self, ruta: Path, encoding: str = "utf-8"):
-        self.ruta = Path(ruta)
-        self.encoding = encoding
-
-    def leer_todo(self) -> str:
-        with self.ruta.open("rb") as raw:               # FileInputStream
-            buffered = io.BufferedReader(raw)           # BufferedReader
-            text = io.TextIOWrapper(                    # InputStreamReader
-                buffered, encoding=self.encoding, errors="replace", newline=None
-            )
-            try:
-                return text.read()
-            finally:
-                # Evita cierre doble de 'raw' en algunos entornos
-                text.detach()
+PAGINA_LINEAS = 2000     # líneas que se agregan al llegar al final de un archivo de carpeta
 
 
 class App(tk.Tk):
@@ -53,6 +24,14 @@ class App(tk.Tk):
         self.default_path = Path("prueba.txt")
         asegurar_archivo(self.default_path)
 
+        # La lectura corre en un hilo de trabajo; la ventana sigue respondiendo
+        self.ejecutor = EjecutorTareas(self)
+        self.lectura = None
+        self.indice = None                    # IndiceArchivos de la carpeta abierta
+        self.paginado = None                  # ResumenArchivo que se muestra por páginas
+        self.siguiente_linea = 0
+        self.protocol("WM_DELETE_WINDOW", self.cerrar)
+
         self._build_ui()
 
     def _build_ui(self):
@@ -66,8 +45,12 @@ class App(tk.Tk):
                    command=self.leer_por_defecto).pack(side=tk.LEFT, padx=(0, 8))
         ttk.Button(top, text="Abrir archivo…",
                    command=self.abrir_archivo).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(top, text="Abrir carpeta…",
+                   command=self.abrir_carpeta).pack(side=tk.LEFT, padx=(0, 8))
         ttk.Button(top, text="Limpiar",
                    command=self.limpiar).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(top, text="Cancelar",
+                   command=self.cancelar_lectura).pack(side=tk.LEFT, padx=(0, 8))
 
         ttk.Label(top, text="Encoding:").pack(side=tk.LEFT, padx=(16, 4))
         ttk.Entry(top, textvariable=self.encoding_var, width=12).pack(side=tk.LEFT)
@@ -76,18 +59,23 @@ class App(tk.Tk):
         mid = ttk.Frame(self, padding=(10, 0, 10, 10))
         mid.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+        # Lista de archivos de la carpeta abierta (vacía en modo un solo archivo)
+        self.lista = tk.Listbox(mid, width=34, exportselection=False)
+        self.lista.bind("<<ListboxSelect>>", self._seleccionar_archivo)
+        self.lista.grid(row=0, column=0, sticky="ns", padx=(0, 8))
+
         self.text = tk.Text(mid, wrap="none", undo=True)
         self.text.configure(font=("Consolas", 11))
 
-        yscroll = ttk.Scrollbar(mid, orient="vertical", command=self.text.yview)
+        self.yscroll = yscroll = ttk.Scrollbar(mid, orient="vertical", command=self.text.yview)
         xscroll = ttk.Scrollbar(mid, orient="horizontal", command=self.text.xview)
-        self.text.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        self.text.configure(yscrollcommand=self._al_desplazar, xscrollcommand=xscroll.set)
 
-        self.text.grid(row=0, column=0, sticky="nsew")
-        yscroll.grid(row=0, column=1, sticky="ns")
-        xscroll.grid(row=1, column=0, sticky="ew")
+        self.text.grid(row=0, column=1, sticky="nsew")
+        yscroll.grid(row=0, column=2, sticky="ns")
+        xscroll.grid(row=1, column=1, sticky="ew")
 
-        mid.columnconfigure(0, weight=1)
+        mid.columnconfigure(1, weight=1)
         mid.rowconfigure(0, weight=1)
 
         # Barra de estado
@@ -99,6 +87,8 @@ class App(tk.Tk):
         self._leer_y_mostrar(self.default_path)
 
     def abrir_archivo(self):
+        from tkinter import filedialog  # se carga solo al abrir el diálogo
+
         ruta = filedialog.askopenfilename(
             title="Selecciona un archivo de texto",
             filetypes=[("Archivos de texto", "*.txt;*.log;*.md;*.csv;*.json;*.py;*.java;*.*")],
@@ -108,30 +98,127 @@ class App(tk.Tk):
             return
         self._leer_y_mostrar(Path(ruta))
 
+    def abrir_carpeta(self):
+        from tkinter import filedialog  # se carga solo al abrir el diálogo
+
+        carpeta = filedialog.askdirectory(title="Selecciona una carpeta de archivos",
+                                          initialdir=str(Path.cwd()))
+        if not carpeta:
+            return
+        self.cancelar_lectura()
+        self.status.set(f"Indexando: {carpeta}…")
+        self.lectura = self.ejecutor.enviar(
+            indexar_carpeta, Path(carpeta), clave=("carpeta", carpeta), con_control=True,
+            al_terminar=self._mostrar_carpeta,
+            al_fallar=lambda error: self._mostrar_error(Path(carpeta), error),
+            al_progresar=lambda fraccion, nombre: self.status.set(
+                f"Indexando: {carpeta}… {fraccion:.0%} ({nombre})"),
+        )
+
+    def _mostrar_carpeta(self, indice):
+        self.lectura = None
+        self.indice = indice
+        self.lista.delete(0, tk.END)
+        for a in indice.archivos:
+            detalle = "error" if a.error else f"{a.lineas:,} líneas, {a.encoding}"
+            self.lista.insert(tk.END, f"{a.ruta.name} ({detalle})")
+        self.status.set(indice.texto_resumen())
+
+    def _seleccionar_archivo(self, _evento=None):
+        seleccion = self.lista.curselection()
+        if not seleccion or self.indice is None:
+            return
+        archivo = self.indice.archivos[seleccion[0]]
+        if archivo.error:
+            messagebox.showerror("Error", f"No se pudo leer:\n{archivo.ruta}\n{archivo.error}")
+            return
+        self.encoding_var.set(archivo.encoding)
+        # Con el índice disperso del archivo se muestra por páginas: solo se
+        # lee lo que el usuario alcanza a ver, aunque el archivo sea enorme
+        self.cancelar_lectura()
+        self.text.delete("1.0", tk.END)
+        self.paginado, self.siguiente_linea = archivo, 0
+        self._cargar_pagina()
+
+    def _cargar_pagina(self):
+        archivo, desde = self.paginado, self.siguiente_linea
+        if archivo is None or desde >= archivo.lineas:
+            return
+        self.lectura = self.ejecutor.enviar(
+            archivo.leer_lineas, desde, PAGINA_LINEAS, clave=("pagina", archivo.ruta, desde),
+            al_terminar=lambda lineas: self._agregar_pagina(archivo, desde, lineas),
+            al_fallar=lambda error: self._mostrar_error(archivo.ruta, error),
+        )
+
+    def _agregar_pagina(self, archivo, desde: int, lineas):
+        self.lectura = None
+        if archivo is not self.paginado or desde != self.siguiente_linea:
+            return                            # se eligió otro archivo mientras tanto
+        self.text.insert(tk.END, "".join(f"{linea}\n" for linea in lineas))
+        self.siguiente_linea = desde + len(lineas)
+        mas = " (baje para ver más)" if self.siguiente_linea < archivo.lineas else ""
+        self.status.set(f"{archivo.ruta.name}: {self.siguiente_linea:,} de "
+                        f"{archivo.lineas:,} líneas{mas}")
+
+    def _al_desplazar(self, primero, ultimo):
+        self.yscroll.set(primero, ultimo)
+        if float(ultimo) >= 1.0 and self.paginado is not None and self.lectura is None:
+            self._cargar_pagina()             # se llegó al final de lo cargado
+
     def limpiar(self):
+        self.cancelar_lectura()
+        self.paginado = None
         self.text.delete("1.0", tk.END)
         self.status.set("Limpio.")
 
+    def cancelar_lectura(self):
+        if self.lectura is not None and not self.lectura.terminada:
+            self.lectura.cancelar()
+            self.status.set("Lectura cancelada.")
+        self.lectura = None
+
+    def cerrar(self):
+        self.ejecutor.cerrar()
+        self.destroy()
+
     def _leer_y_mostrar(self, ruta: Path):
-        try:
-            lector = LeerArchivo(ruta, encoding=self.encoding_var.get().strip() or "utf-8")
-            contenido = lector.leer_todo()
-            # Normalizamos fin de línea para evitar sobrescritura visual por '\r'
-            contenido = contenido.replace("\r\n", "\n").replace("\r", "\n")
-            self.text.delete("1.0", tk.END)
-            self.text.insert("1.0", contenido)
-            self.status.set(f"Leído: {ruta.resolve()}")
-        except FileNotFoundError:
+        self.paginado = None
+        encoding = self.encoding_var.get().strip() or "utf-8"
+        clave = ("leer", ruta.resolve(), encoding)
+        if self.lectura is not None and self.lectura.clave != clave:
+            self.cancelar_lectura()           # se pidió otro archivo
+        lector = LeerArchivo(ruta, encoding=encoding)
+        self.status.set(f"Leyendo: {ruta.resolve()}…")
+        self.lectura = self.ejecutor.enviar(
+            lector.leer_todo, clave=clave, con_control=True,
+            al_terminar=lambda contenido: self._mostrar(ruta, contenido),
+            al_fallar=lambda error: self._mostrar_error(ruta, error),
+            al_progresar=lambda fraccion, _: self.status.set(
+                f"Leyendo: {ruta.resolve()}… {fraccion:.0%}"),
+        )
+
+    def _mostrar(self, ruta: Path, contenido: str):
+        self.lectura = None
+        # Normalizamos fin de línea para evitar sobrescritura visual por '\r'
+        contenido = contenido.replace("\r\n", "\n").replace("\r", "\n")
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", contenido)
+        self.status.set(f"Leído: {ruta.resolve()}")
+
+    def _mostrar_error(self, ruta: Path, error: BaseException):
+        self.lectura = None
+        if isinstance(error, FileNotFoundError):
             messagebox.showerror("Error", f"No se encontró el archivo:\n{ruta}")
             self.status.set("Error: archivo no encontrado.")
-        except PermissionError:
+        elif isinstance(error, PermissionError):
             messagebox.showerror("Error", f"Permiso denegado al leer:\n{ruta}")
             self.status.set("Error: permiso denegado.")
-        except Exception as e:
-            messagebox.showerror("Error", f"Ocurrió un error inesperado:\n{e}")
+        else:
+            messagebox.showerror("Error", f"Ocurrió un error inesperado:\n{error}")
             self.status.set("Error inesperado.")
 
 if __name__ == "__main__":
+    instrumentacion.configurar_desde_entorno()
     App().mainloop()
 
 
@@ -0,0 +1,520 @@
+# nomina.py
+# Modelo de la nómina de empleados (sin dependencias de Tkinter).
+#
+# Además del reporte Nomina.txt, cada corrida puede guardarse como instantánea
+# inmutable de un período (ver HistorialNomina) y compararse contra otras:
+#
+#   python nomina.py --historial historial_nomina --comparar 2025-03 2025-04
+#   python nomina.py --historial historial_nomina --tendencia
+
+import argparse
+import json
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import instrumentacion
+from instrumentacion import medido
+from opcionales import numpy as _numpy   # NumPy se importa al primer uso
+
+
+@dataclass
+class Empleado:
+    nombre: str
+    apellidos: str
+    cargo: str
+    genero: str
+    salario_dia: float
+    dias_trabajados: int
+    otros_ingresos: float
+    pagos_salud: float
+    aporte_pension: float
+    id: Optional[int] = None       # estable entre períodos (ver HistorialNomina.asignar_ids)
+
+    def salario_mensual(self) -> float:
+        """
+        Salario mensual = (días trabajados * sueldo por día)
+                          + otros ingresos
+                          - pagos por salud
+                          - aporte pensiones
+        """
+        return (self.dias_trabajados * self.salario_dia) + \
+               self.otros_ingresos - self.pagos_salud - self.aporte_pension
+
+
+@medido("nomina.total")
+def total_nomina(empleados: Iterable[Empleado]) -> float:
+    return sum(emp.salario_mensual() for emp in empleados)
+
+
+@medido("nomina.escribir")
+def escribir_nomina(empleados: Iterable[Empleado], ruta_archivo: str) -> float:
+    """Escribe el reporte de nómina en 'ruta_archivo' y devuelve el total."""
+    total_nomina = 0.0
+    with open(ruta_archivo, "w", encoding="utf-8") as f:
+        f.write("NÓMINA DE EMPLEADOS\n")
+        f.write("===================\n\n")
+
+        for i, emp in enumerate(empleados, start=1):
+            salario = emp.salario_mensual()
+            total_nomina += salario
+            f.write(f"Empleado {i}:\n")
+            f.write(f"  Nombre: {emp.nombre}\n")
+            f.write(f"  Apellidos: {emp.apellidos}\n")
+            f.write(f"  Cargo: {emp.cargo}\n")
+            f.write(f"  Género: {emp.genero}\n")
+            f.write(f"  Salario por día: {emp.salario_dia:.2f}\n")
+            f.write(f"  Días trabajados: {emp.dias_trabajados}\n")
+            f.write(f"  Otros ingresos: {emp.otros_ingresos:.2f}\n")
+            f.write(f"  Pagos por salud: {emp.pagos_salud:.2f}\n")
+            f.write(f"  Aporte pensiones: {emp.aporte_pension:.2f}\n")
+            f.write(f"  Salario mensual: {salario:.2f}\n")
+            f.write("\n")
+
+        f.write("===================\n")
+        f.write(f"TOTAL NÓMINA: {total_nomina:.2f}\n")
+        if instrumentacion.activa():
+            instrumentacion.registrar_bytes("nomina.escribir", escritos=f.tell())
+    return total_nomina
+
+
+# ================== HISTORIAL DE PERÍODOS ==================
+#
+# Una instantánea 'nomina-AAAA-MM.col' por período:
+#
+#   MAGIA | largo del encabezado (uint32) | encabezado JSON | columnas
+#
+# Las filas van ordenadas por id de empleado. Las columnas numéricas quedan
+# sin comprimir y alineadas a 8 bytes para leerlas con mmap sin copiar (el
+# dinero en centavos, int64); cargo y género se codifican con diccionario
+# (uint8) y nombres/apellidos van en un bloque zlib que solo se descomprime
+# si se piden los empleados.
+
+MAGIA = b"NOMCOL1\n"
+_COLUMNAS = [("id", "I"), ("salario_dia", "q"), ("otros_ingresos", "q"),
+             ("pagos_salud", "q"), ("aporte_pension", "q"),
+             ("dias_trabajados", "B"), ("cargo", "B"), ("genero", "B")]
+_SEPARADOR = "\x1f"
+MAX_DIAS = 255                # la columna dias_trabajados es uint8
+
+
+def _alinear(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _centavos(valor: float) -> int:
+    return round(valor * 100)
+
+
+def validar_periodo(periodo: str) -> str:
+    """Normaliza 'AAAA-MM' (p. ej. '2025-3' -> '2025-03')."""
+    try:
+        return f"{datetime.strptime(periodo.strip(), '%Y-%m'):%Y-%m}"
+    except ValueError:
+        raise ValueError(f"Período inválido: {periodo!r} (use AAAA-MM).")
+
+
+@medido("nomina.guardar_periodo")
+def guardar_periodo(ruta: Path, periodo: str, empleados: Sequence[Empleado]) -> None:
+    """Escribe la instantánea de un período. Nunca reemplaza una existente."""
+    ruta = Path(ruta)
+    if ruta.exists():
+        raise FileExistsError(f"El período {periodo} ya está guardado y no se modifica.")
+    filas = sorted(empleados, key=lambda e: e.id if e.id is not None else -1)
+    ids = [e.id for e in filas]
+    if None in ids:
+        raise ValueError("Todos los empleados necesitan id (ver HistorialNomina.asignar_ids).")
+    if len(set(ids)) != len(ids):
+        raise ValueError("Hay ids de empleado repetidos.")
+    for e in filas:
+        if not 0 <= e.dias_trabajados <= MAX_DIAS:
+            raise ValueError(f"Días trabajados de {e.nombre} {e.apellidos} fuera de rango "
+                             f"(0 – {MAX_DIAS}): {e.dias_trabajados}.")
+
+    cargos = sorted({e.cargo for e in filas})
+    generos = sorted({e.genero for e in filas})
+    codigo_cargo = {c: k for k, c in enumerate(cargos)}
+    codigo_genero = {g: k for k, g in enumerate(generos)}
+    valores = {
+        "id": ids,
+        "salario_dia": [_centavos(e.salario_dia) for e in filas],
+        "otros_ingresos": [_centavos(e.otros_ingresos) for e in filas],
+        "pagos_salud": [_centavos(e.pagos_salud) for e in filas],
+        "aporte_pension": [_centavos(e.aporte_pension) for e in filas],
+        "dias_trabajados": [e.dias_trabajados for e in filas],
+        "cargo": [codigo_cargo[e.cargo] for e in filas],
+        "genero": [codigo_genero[e.genero] for e in filas],
+    }
+
+    cuerpo = bytearray()
+    columnas = {}
+    for nombre, codigo in _COLUMNAS:
+        cuerpo += bytes(_alinear(len(cuerpo)) - len(cuerpo))
+        columnas[nombre] = [codigo, len(cuerpo)]
+        cuerpo += array(codigo, valores[nombre]).tobytes()
+    textos = zlib.compress(_SEPARADOR.join(
+        f"{e.nombre}{_SEPARADOR}{e.apellidos}" for e in filas).encode("utf-8"))
+    encabezado = json.dumps({
+        "periodo": periodo, "filas": len(filas), "max_id": max(ids, default=0),
+        "orden": sys.byteorder, "cargos": cargos, "generos": generos,
+        "columnas": columnas, "textos": [len(cuerpo), len(textos)],
+        "creado": datetime.now().isoformat(timespec="seconds"),
+    }, ensure_ascii=False).encode("utf-8")
+
+    inicio = len(MAGIA) + 4 + len(encabezado)
+    temporal = ruta.with_name(ruta.name + ".tmp")
+    with temporal.open("wb") as f:
+        f.write(MAGIA + len(encabezado).to_bytes(4, "little") + encabezado)
+        f.write(bytes(_alinear(inicio) - inicio))
+        f.write(cuerpo)
+        f.write(textos)
+        if instrumentacion.activa():
+            instrumentacion.registrar_bytes("nomina.guardar_periodo", escritos=f.tell())
+    os.chmod(temporal, 0o444)              # instantánea de solo lectura
+    os.replace(temporal, ruta)
+
+
+class PeriodoNomina:
+    """
+    Instantánea de un período abierta con mmap. Con NumPy las columnas son
+    arreglos sobre el mapa (sin copia); sin NumPy, memoryview tipados.
+    """
+    def __init__(self, ruta: Path):
+        self.ruta = Path(ruta)
+        with self.ruta.open("rb") as f:
+            if f.read(len(MAGIA)) != MAGIA:
+                raise ValueError(f"{self.ruta} no es una instantánea de nómina.")
+            largo = int.from_bytes(f.read(4), "little")
+            self.encabezado = json.loads(f.read(largo))
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.encabezado["orden"] != sys.byteorder:
+            raise ValueError(f"{self.ruta} se escribió en una máquina {self.encabezado['orden']}-endian.")
+        self.periodo: str = self.encabezado["periodo"]
+        self.filas: int = self.encabezado["filas"]
+        self._datos = _alinear(len(MAGIA) + 4 + largo)
+
+    def columna(self, nombre: str):
+        codigo, desplazamiento = self.encabezado["columnas"][nombre]
+        inicio = self._datos + desplazamiento
+        np = _numpy()
+        if np is not None:
+            return np.frombuffer(self._mapa, dtype=codigo, count=self.filas, offset=inicio)
+        fin = inicio + self.filas * array(codigo).itemsize
+        return memoryview(self._mapa)[inicio:fin].cast(codigo)
+
+    def salario_mensual(self):
+        """Salario mensual de cada fila, en centavos (mismo orden que 'id')."""
+        dias = self.columna("dias_trabajados")
+        dia, otros = self.columna("salario_dia"), self.columna("otros_ingresos")
+        salud, pension = self.columna("pagos_salud"), self.columna("aporte_pension")
+        np = _numpy()
+        if np is not None:
+            return dias.astype(np.int64) * dia + otros - salud - pension
+        return [d * s + o - a - p for d, s, o, a, p in zip(dias, dia, otros, salud, pension)]
+
+    def total(self) -> float:
+        salarios = self.salario_mensual()
+        if _numpy() is not None:
+            return int(salarios.sum()) / 100     # suma vectorizada en int64
+        return sum(salarios) / 100
+
+    def nombres(self) -> List[str]:
+        """'Nombre Apellidos' de cada fila (descomprime el bloque de textos)."""
+        partes = self._textos()
+        return [f"{partes[k]} {partes[k + 1]}" for k in range(0, len(partes), 2)]
+
+    def _textos(self) -> List[str]:
+        if self.filas == 0:
+            return []
+        inicio, largo = self.encabezado["textos"]
+        inicio += self._datos
+        return zlib.decompress(self._mapa[inicio:inicio + largo]).decode("utf-8").split(_SEPARADOR)
+
+    def empleados(self) -> List[Empleado]:
+        """Reconstruye los empleados (para seguir editando el período siguiente)."""
+        partes = self._textos()
+        cargos, generos = self.encabezado["cargos"], self.encabezado["generos"]
+        columnas = [self.columna(n) for n, _ in _COLUMNAS]
+        return [Empleado(nombre=partes[2 * k], apellidos=partes[2 * k + 1],
+                         cargo=cargos[cargo], genero=generos[genero],
+                         salario_dia=int(dia) / 100, dias_trabajados=int(dias),
+                         otros_ingresos=int(otros) / 100, pagos_salud=int(salud) / 100,
+                         aporte_pension=int(pension) / 100, id=int(id_))
+                for k, (id_, dia, otros, salud, pension, dias, cargo, genero)
+                in enumerate(zip(*columnas))]
+
+
+@dataclass
+class DiferenciaNomina:
+    """Comparación de dos períodos, alineada por id de empleado (montos en centavos)."""
+    desde: str
+    hasta: str
+    ids: Sequence[int]          # empleados presentes en ambos períodos
+    antes: Sequence[int]        # salario mensual en 'desde'
+    despues: Sequence[int]      # salario mensual en 'hasta'
+    cambio: Sequence[int]       # despues - antes
+    altas: Sequence[int]        # ids que solo están en 'hasta'
+    bajas: Sequence[int]        # ids que solo están en 'desde'
+    total_desde: float
+    total_hasta: float
+
+    def mayores(self, k: int = 100) -> List[Tuple[int, float, float, float]]:
+        """Los k mayores cambios en valor absoluto: (id, antes, después, cambio)."""
+        np = _numpy()
+        if np is not None:
+            distintos = np.flatnonzero(self.cambio)
+            orden = distintos[np.argsort(-np.abs(self.cambio[distintos]), kind="stable")[:k]]
+        else:
+            orden = sorted((i for i, c in enumerate(self.cambio) if c),
+                           key=lambda i: -abs(self.cambio[i]))[:k]
+        return [(int(self.ids[i]), int(self.antes[i]) / 100, int(self.despues[i]) / 100,
+                 int(self.cambio[i]) / 100) for i in orden]
+
+    def texto_resumen(self) -> str:
+        np = _numpy()
+        if np is not None:
+            con_cambio = int(np.count_nonzero(self.cambio))
+        else:
+            con_cambio = sum(1 for c in self.cambio if c)
+        variacion = self.total_hasta - self.total_desde
+        return (f"{self.desde} → {self.hasta}: {len(self.ids):,} empleados en ambos, "
+                f"{con_cambio:,} con cambio de salario, {len(self.altas):,} altas, "
+                f"{len(self.bajas):,} bajas | total {self.total_desde:,.2f} → "
+                f"{self.total_hasta:,.2f} ({variacion:+,.2f})")
+
+
+def comparar_periodos(a: PeriodoNomina, b: PeriodoNomina) -> DiferenciaNomina:
+    ids_a, ids_b = a.columna("id"), b.columna("id")
+    sal_a, sal_b = a.salario_mensual(), b.salario_mensual()
+    np = _numpy()
+    if np is not None:
+        ids, ia, ib = np.intersect1d(ids_a, ids_b, assume_unique=True, return_indices=True)
+        antes, despues = sal_a[ia], sal_b[ib]
+        return DiferenciaNomina(
+            a.periodo, b.periodo, ids, antes, despues, despues - antes,
+            np.setdiff1d(ids_b, ids_a, assume_unique=True),
+            np.setdiff1d(ids_a, ids_b, assume_unique=True),
+            int(sal_a.sum()) / 100, int(sal_b.sum()) / 100)
+
+    posicion = {i: k for k, i in enumerate(ids_b)}
+    ids, antes, despues, bajas = [], [], [], []
+    for i, s in zip(ids_a, sal_a):
+        k = posicion.pop(i, None)
+        if k is None:
+            bajas.append(i)
+        else:
+            ids.append(i)
+            antes.append(s)
+            despues.append(sal_b[k])
+    return DiferenciaNomina(a.periodo, b.periodo, ids, antes, despues,
+                            [d - s for s, d in zip(antes, despues)], sorted(posicion), bajas,
+                            sum(sal_a) / 100, sum(sal_b) / 100)
+
+
+def _clave_persona(nombre: str, apellidos: str) -> Tuple[str, str]:
+    return " ".join(nombre.split()).casefold(), " ".join(apellidos.split()).casefold()
+
+
+class HistorialNomina:
+    """Carpeta con una instantánea inmutable 'nomina-AAAA-MM.col' por período."""
+
+    def __init__(self, carpeta: Path):
+        self.carpeta = Path(carpeta)
+        self.carpeta.mkdir(parents=True, exist_ok=True)
+        self._abiertos: Dict[str, PeriodoNomina] = {}
+
+    def ruta(self, periodo: str) -> Path:
+        return self.carpeta / f"nomina-{validar_periodo(periodo)}.col"
+
+    def periodos(self) -> List[str]:
+        return sorted(r.stem[len("nomina-"):] for r in self.carpeta.glob("nomina-*.col"))
+
+    def abrir(self, periodo: str) -> PeriodoNomina:
+        periodo = validar_periodo(periodo)
+        if periodo not in self._abiertos:
+            ruta = self.ruta(periodo)
+            if not ruta.exists():
+                raise ValueError(f"No hay nómina guardada para {periodo}.")
+            self._abiertos[periodo] = PeriodoNomina(ruta)
+        return self._abiertos[periodo]
+
+    def asignar_ids(self, empleados: Iterable[Empleado]) -> None:
+        """
+        Completa el id de los empleados que no lo tienen. Primero se busca
+        por nombre y apellidos en el último período guardado (el mismo
+        empleado ingresado en otra sesión conserva su id); si no aparece,
+        recibe uno nuevo. Los que ya tienen id lo conservan.
+        """
+        empleados = list(empleados)
+        periodos = self.periodos()
+        usados = {e.id for e in empleados if e.id is not None}
+        previos: Dict[Tuple[str, str], List[int]] = {}
+        if periodos and any(e.id is None for e in empleados):
+            ultimo = self.abrir(periodos[-1])
+            partes = ultimo._textos()
+            for k, id_ in enumerate(ultimo.columna("id")):
+                if int(id_) not in usados:
+                    clave = _clave_persona(partes[2 * k], partes[2 * k + 1])
+                    previos.setdefault(clave, []).append(int(id_))
+        siguiente = max([self.abrir(p).encabezado["max_id"] for p in periodos]
+                        + list(usados), default=0) + 1
+        for e in empleados:
+            if e.id is not None:
+                continue
+            candidatos = previos.get(_clave_persona(e.nombre, e.apellidos))
+            if candidatos:
+                e.id = candidatos.pop(0)
+            else:
+                e.id = siguiente
+                siguiente += 1
+
+    def guardar(self, periodo: str, empleados: Sequence[Empleado]) -> PeriodoNomina:
+        periodo = validar_periodo(periodo)
+        guardar_periodo(self.ruta(periodo), periodo, empleados)
+        return self.abrir(periodo)
+
+    def cargar(self, periodo: str) -> List[Empleado]:
+        return self.abrir(periodo).empleados()
+
+    @medido("nomina.comparar")
+    def comparar(self, desde: str, hasta: str) -> DiferenciaNomina:
+        return comparar_periodos(self.abrir(desde), self.abrir(hasta))
+
+    def nombres(self, periodo: str, ids: Iterable[int]) -> Dict[int, str]:
+        p = self.abrir(periodo)
+        todos = dict(zip((int(i) for i in p.columna("id")), p.nombres()))
+        return {i: todos.get(i, "") for i in ids}
+
+    @medido("nomina.tendencia")
+    def tendencia(self, periodos: Optional[Sequence[str]] = None) -> List[Tuple[str, float]]:
+        """Costo total de cada período, en orden."""
+        return [(p, self.abrir(p).total()) for p in (periodos or self.periodos())]
+
+
+# ================== BENCHMARK Y LÍNEA DE COMANDOS ==================
+
+def _salarios_reporte(ruta: Path) -> Dict[str, float]:
+    """Salario mensual por 'Nombre Apellidos' leyendo un Nomina.txt (la forma anterior)."""
+    salarios, nombre = {}, ""
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.strip()
+            if linea.startswith("Nombre:"):
+                nombre = linea[8:]
+            elif linea.startswith("Apellidos:"):
+                nombre += " " + linea[11:]
+            elif linea.startswith("Salario mensual:"):
+                salarios[nombre] = float(linea[17:])
+    return salarios
+
+
+def benchmark_historial(periodos: int = 24, empleados: int = 100_000,
+                        semilla: int = 0) -> Dict[str, float]:
+    """
+    'periodos' meses de 'empleados' personas con rotación (2 % bajas y altas)
+    y aumentos (10 %) cada mes. Compara dos meses y la tendencia completa con
+    las instantáneas contra releer dos reportes Nomina.txt.
+    """
+    import random
+    import tempfile
+    import time
+
+    rng = random.Random(semilla)
+    cargos, generos = ["Directivo", "Estratégico", "Operativo"], ["Masculino", "Femenino"]
+
+    def nuevo(i: int) -> Empleado:
+        return Empleado(f"Nombre{i}", f"Apellido{i}", rng.choice(cargos), rng.choice(generos),
+                        round(rng.uniform(40_000, 400_000), 2), rng.randint(1, 31),
+                        round(rng.uniform(0, 500_000), 2), round(rng.uniform(0, 200_000), 2),
+                        round(rng.uniform(0, 200_000), 2))
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        historial = HistorialNomina(Path(carpeta))
+        plantilla = [nuevo(i) for i in range(empleados)]
+        meses = [f"{2024 + m // 12}-{m % 12 + 1:02d}" for m in range(periodos)]
+        t_guardar = 0.0
+        for m, mes in enumerate(meses):
+            if m:
+                rotacion = empleados // 50
+                for _ in range(rotacion):
+                    plantilla.pop(rng.randrange(len(plantilla)))
+                plantilla += [nuevo(empleados + m * rotacion + k) for k in range(rotacion)]
+                for e in rng.sample(plantilla, empleados // 10):
+                    e.salario_dia = round(e.salario_dia * rng.uniform(1.01, 1.1), 2)
+                for e in plantilla:
+                    e.dias_trabajados = rng.randint(1, 31)
+            historial.asignar_ids(plantilla)
+            t0 = time.perf_counter()
+            historial.guardar(mes, plantilla)
+            t_guardar += time.perf_counter() - t0
+            if m == periodos - 2:
+                escribir_nomina(plantilla, os.path.join(carpeta, "anterior.txt"))
+        escribir_nomina(plantilla, os.path.join(carpeta, "ultimo.txt"))
+        historial._abiertos.clear()          # medir desde archivos sin abrir
+        _numpy()                             # la importación perezosa no cuenta
+
+        t0 = time.perf_counter()
+        diferencia = historial.comparar(meses[-2], meses[-1])
+        t_comparar = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        historial.tendencia()
+        t_tendencia = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        anterior = _salarios_reporte(Path(carpeta, "anterior.txt"))
+        ultimo = _salarios_reporte(Path(carpeta, "ultimo.txt"))
+        cambios_texto = {n: s - anterior[n] for n, s in ultimo.items() if n in anterior}
+        t_texto = time.perf_counter() - t0
+
+        return {
+            "periodos": periodos,
+            "empleados": empleados,
+            "bytes_instantanea": historial.ruta(meses[-1]).stat().st_size,
+            "bytes_reporte_txt": os.path.getsize(os.path.join(carpeta, "ultimo.txt")),
+            "segundos_guardar_por_periodo": t_guardar / periodos,
+            "segundos_comparar_2_periodos": t_comparar,
+            "segundos_tendencia_todos": t_tendencia,
+            "segundos_comparar_reportes_txt": t_texto,
+            "empleados_comparados": len(diferencia.ids),
+            "coincide_con_txt": len(cambios_texto) == len(diferencia.ids),
+        }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Historial de períodos de nómina.")
+    parser.add_argument("--historial", default="historial_nomina", help="carpeta del historial")
+    parser.add_argument("--comparar", nargs=2, metavar=("DESDE", "HASTA"),
+                        help="cambio de salario por empleado entre dos períodos AAAA-MM")
+    parser.add_argument("--tendencia", action="store_true", help="costo total por período")
+    parser.add_argument("--bench", type=int, nargs=2, metavar=("PERIODOS", "EMPLEADOS"),
+                        help="benchmark con datos sintéticos (p. ej. 24 100000)")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        ejecutar_informe("nomina_historial", periodos=args.bench[0], empleados=args.bench[1])
+        return
+
+    historial = HistorialNomina(Path(args.historial))
+    if args.comparar:
+        diferencia = historial.comparar(*args.comparar)
+        print(diferencia.texto_resumen())
+        mayores = diferencia.mayores(20)
+        nombres = historial.nombres(diferencia.hasta, [m[0] for m in mayores])
+        for id_, antes, despues, cambio in mayores:
+            print(f"{id_:>8} {nombres[id_]:<30} {antes:>14,.2f} → {despues:>14,.2f} ({cambio:+,.2f})")
+    elif args.tendencia:
+        for periodo, total in historial.tendencia():
+            print(f"{periodo}  {total:>20,.2f}")
+    else:
+        print(", ".join(historial.periodos()) or "Sin períodos guardados.")
+
+
+if __name__ == "__main__":
+    main()
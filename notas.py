@@ -0,0 +1,674 @@
+# notas.py
+# Motor de estadísticas para notas en escala 0.0 – 5.0 (sin dependencias de Tkinter).
+
+import argparse
+import csv
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from opcionales import numpy as _numpy   # NumPy se importa al primer uso
+
+
+NOTA_MIN = 0.0
+NOTA_MAX = 5.0
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+# -------------------- VALIDACIÓN --------------------
+
+def convertir_nota(valor: Union[str, float]) -> float:
+    """
+    Convierte un texto ('3,5' o '3.5') o número en nota validada.
+    Lanza ValueError si no es numérica o está fuera de 0.0 – 5.0.
+    """
+    if isinstance(valor, str):
+        valor = valor.strip().replace(",", ".")
+    try:
+        val = float(valor)
+    except (TypeError, ValueError):
+        raise ValueError("Todas las notas deben ser números.")
+    if not (NOTA_MIN <= val <= NOTA_MAX):
+        raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+    return val
+
+
+# -------------------- RESUMEN --------------------
+
+@dataclass
+class ResumenNotas:
+    cantidad: int
+    promedio: float
+    desviacion: float
+    mayor: float
+    menor: float
+    mediana: float
+    percentiles: Dict[int, float] = field(default_factory=dict)
+
+
+def _percentil(ordenadas: Sequence[float], p: float) -> float:
+    """Percentil con interpolación lineal (mismo criterio que numpy por defecto)."""
+    pos = (len(ordenadas) - 1) * p / 100.0
+    bajo = int(math.floor(pos))
+    alto = min(bajo + 1, len(ordenadas) - 1)
+    return ordenadas[bajo] + (ordenadas[alto] - ordenadas[bajo]) * (pos - bajo)
+
+
+def _resumir_numpy(arr, muestral: bool, percentiles: Sequence[int]) -> ResumenNotas:
+    np = _numpy()
+    n = int(arr.size)
+    menor = float(arr.min())
+    mayor = float(arr.max())
+    if menor < NOTA_MIN or mayor > NOTA_MAX or np.isnan(menor) or np.isnan(mayor):
+        raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+    ddof = 1 if muestral and n > 1 else 0
+    qs = [50] + list(percentiles)
+    valores = np.percentile(arr, qs)
+    return ResumenNotas(
+        cantidad=n,
+        promedio=float(arr.mean()),
+        desviacion=float(arr.std(ddof=ddof)),
+        mayor=mayor,
+        menor=menor,
+        mediana=float(valores[0]),
+        percentiles={int(p): float(v) for p, v in zip(qs[1:], valores[1:])},
+    )
+
+
+def _como_numeros(notas: Iterable) -> Iterator[float]:
+    # Los números pasan directo; el resto (textos como '3,5', None...) se
+    # valida con convertir_nota para que el error salga en español.
+    for x in notas:
+        yield float(x) if isinstance(x, (int, float)) else convertir_nota(x)
+
+
+def _resumir_python(notas: Iterable[float], muestral: bool,
+                    percentiles: Sequence[int]) -> ResumenNotas:
+    # Una sola pasada (Welford) para promedio, M2, mayor y menor
+    n = 0
+    media = 0.0
+    m2 = 0.0
+    menor = math.inf
+    mayor = -math.inf
+    vistos: List[float] = []
+    for x in _como_numeros(notas):
+        if not (NOTA_MIN <= x <= NOTA_MAX):
+            raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+        n += 1
+        delta = x - media
+        media += delta / n
+        m2 += delta * (x - media)
+        if x < menor:
+            menor = x
+        if x > mayor:
+            mayor = x
+        vistos.append(x)
+
+    if n == 0:
+        raise ValueError("No hay notas para resumir.")
+
+    var = m2 / (n - 1) if muestral and n > 1 else m2 / n
+    vistos.sort()
+    return ResumenNotas(
+        cantidad=n,
+        promedio=media,
+        desviacion=math.sqrt(var),
+        mayor=mayor,
+        menor=menor,
+        mediana=_percentil(vistos, 50),
+        percentiles={int(p): _percentil(vistos, p) for p in percentiles},
+    )
+
+
+def resumir_notas(notas, muestral: bool = True,
+                  percentiles: Sequence[int] = PERCENTILES) -> ResumenNotas:
+    """
+    Calcula promedio, desviación (muestral o poblacional), mayor, menor,
+    mediana y percentiles de cualquier cantidad de notas.
+
+    Acepta listas, iterables o arreglos de NumPy. Con NumPy instalado el
+    cálculo es vectorizado; sin él se hace en una sola pasada (Welford).
+    """
+    np = _numpy()
+    if np is not None:
+        if isinstance(notas, np.ndarray) and notas.dtype.kind in "USO":
+            arr = np.fromiter(_como_numeros(notas.ravel()), dtype=float)
+        elif isinstance(notas, np.ndarray):
+            arr = notas.astype(float, copy=False).ravel()
+        elif isinstance(notas, (list, tuple)):
+            try:
+                arr = np.asarray(notas, dtype=float)
+            except (TypeError, ValueError):
+                arr = np.fromiter(_como_numeros(notas), dtype=float)
+        else:
+            arr = np.fromiter(_como_numeros(notas), dtype=float)
+        if arr.size == 0:
+            raise ValueError("No hay notas para resumir.")
+        return _resumir_numpy(arr, muestral, percentiles)
+    return _resumir_python(notas, muestral, percentiles)
+
+
+# -------------------- LECTURA DE ARCHIVOS --------------------
+
+def iterar_notas(ruta: Path, columna: Optional[Union[str, int]] = None,
+                 delimitador: str = ",", encoding: str = "utf-8") -> Iterator[float]:
+    """
+    Recorre las notas de un archivo sin cargarlo completo en memoria.
+    - Sin 'columna': una nota por línea (se ignoran líneas vacías).
+    - Con 'columna': CSV; nombre de columna (con encabezado) o índice numérico.
+    """
+    with Path(ruta).open("r", encoding=encoding, newline="") as f:
+        if columna is None:
+            filas = ((num, linea) for num, linea in enumerate(f, start=1))
+        else:
+            lector = csv.reader(f, delimiter=delimitador)
+            if isinstance(columna, str) and not columna.isdigit():
+                encabezado = next(lector, [])
+                try:
+                    idx = [c.strip() for c in encabezado].index(columna)
+                except ValueError:
+                    raise ValueError(f"No existe la columna '{columna}'.")
+                inicio = 2
+            else:
+                idx = int(columna)
+                inicio = 1
+            filas = ((num, fila[idx] if idx < len(fila) else "")
+                     for num, fila in enumerate(lector, start=inicio))
+
+        for num, txt in filas:
+            if not txt.strip():
+                continue
+            try:
+                yield convertir_nota(txt)
+            except ValueError as ex:
+                raise ValueError(f"Línea {num}: {ex}")
+
+
+def detectar_delimitador(ruta: Path, encoding: str = "utf-8") -> str:
+    """Delimitador de un CSV (',', ';', tabulador o '|') según su comienzo; ',' si no se sabe."""
+    with Path(ruta).open("r", encoding=encoding, newline="") as f:
+        muestra = f.read(4096)
+    try:
+        return csv.Sniffer().sniff(muestra, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+
+def leer_notas(ruta: Path, columna: Optional[Union[str, int]] = None,
+               delimitador: str = ",", encoding: str = "utf-8") -> List[float]:
+    """Lee todas las notas de un archivo (ver iterar_notas)."""
+    return list(iterar_notas(ruta, columna, delimitador, encoding))
+
+
+# -------------------- ACUMULADOR EN LÍNEA --------------------
+
+@dataclass
+class AcumuladorNotas:
+    """
+    Estadísticas en línea (cantidad, media, M2, menor, mayor).
+
+    Las notas se ingieren como flujo y los acumuladores parciales se pueden
+    combinar con la fórmula paralela de Chan et al., de modo que varios
+    archivos se resumen por separado (incluso en otros procesos) y luego
+    se unen sin volver a leerlos.
+    """
+    cantidad: int = 0
+    media: float = 0.0
+    m2: float = 0.0
+    menor: float = math.inf
+    mayor: float = -math.inf
+
+    def agregar(self, valor: Union[str, float]) -> None:
+        """Agrega una nota (texto o número) validada como en VentanaNotas."""
+        x = convertir_nota(valor)
+        self.cantidad += 1
+        delta = x - self.media
+        self.media += delta / self.cantidad
+        self.m2 += delta * (x - self.media)
+        if x < self.menor:
+            self.menor = x
+        if x > self.mayor:
+            self.mayor = x
+
+    def agregar_varios(self, valores) -> None:
+        """Agrega un lote de notas; los arreglos de NumPy se resumen vectorizados."""
+        np = _numpy()
+        if np is not None and isinstance(valores, np.ndarray) and valores.dtype.kind in "USO":
+            valores = valores.ravel().tolist()    # textos ('3,5'): se validan uno a uno
+        if np is not None and isinstance(valores, np.ndarray):
+            arr = valores.astype(float, copy=False).ravel()
+            if arr.size == 0:
+                return
+            parcial = AcumuladorNotas(
+                cantidad=int(arr.size),
+                media=float(arr.mean()),
+                menor=float(arr.min()),
+                mayor=float(arr.max()),
+            )
+            if (parcial.menor < NOTA_MIN or parcial.mayor > NOTA_MAX
+                    or np.isnan(parcial.media)):
+                raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+            parcial.m2 = float(((arr - parcial.media) ** 2).sum())
+            self.combinar(parcial)
+            return
+
+        n, media, m2 = self.cantidad, self.media, self.m2
+        menor, mayor = self.menor, self.mayor
+        for x in valores:
+            if isinstance(x, (int, float)):
+                x = float(x)
+                if not (NOTA_MIN <= x <= NOTA_MAX):
+                    raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+            else:
+                x = convertir_nota(x)
+            n += 1
+            delta = x - media
+            media += delta / n
+            m2 += delta * (x - media)
+            if x < menor:
+                menor = x
+            if x > mayor:
+                mayor = x
+        self.cantidad, self.media, self.m2 = n, media, m2
+        self.menor, self.mayor = menor, mayor
+
+    def combinar(self, otro: "AcumuladorNotas") -> "AcumuladorNotas":
+        """Une otro acumulador parcial a este (Chan et al.) y lo devuelve."""
+        if otro.cantidad == 0:
+            return self
+        if self.cantidad == 0:
+            self.cantidad, self.media, self.m2 = otro.cantidad, otro.media, otro.m2
+            self.menor, self.mayor = otro.menor, otro.mayor
+            return self
+        n = self.cantidad + otro.cantidad
+        delta = otro.media - self.media
+        self.media += delta * otro.cantidad / n
+        self.m2 += otro.m2 + delta * delta * self.cantidad * otro.cantidad / n
+        self.cantidad = n
+        self.menor = min(self.menor, otro.menor)
+        self.mayor = max(self.mayor, otro.mayor)
+        return self
+
+    @property
+    def promedio(self) -> float:
+        if self.cantidad == 0:
+            raise ValueError("No hay notas para resumir.")
+        return self.media
+
+    def desviacion(self, muestral: bool = True) -> float:
+        """Desviación muestral (si hay más de una nota) o poblacional."""
+        if self.cantidad == 0:
+            raise ValueError("No hay notas para resumir.")
+        if muestral and self.cantidad > 1:
+            return math.sqrt(self.m2 / (self.cantidad - 1))
+        return math.sqrt(self.m2 / self.cantidad)
+
+
+def acumular_archivo(ruta: Path, columna: Optional[Union[str, int]] = None,
+                     delimitador: str = ",", encoding: str = "utf-8") -> AcumuladorNotas:
+    """Resume un archivo en un acumulador parcial, leyéndolo como flujo."""
+    acc = AcumuladorNotas()
+    try:
+        acc.agregar_varios(iterar_notas(ruta, columna, delimitador, encoding))
+    except ValueError as ex:
+        raise ValueError(f"{ruta}: {ex}")
+    return acc
+
+
+def resumir_archivos(rutas: Sequence[Path], columna: Optional[Union[str, int]] = None,
+                     delimitador: str = ",", encoding: str = "utf-8",
+                     procesos: Optional[int] = None) -> AcumuladorNotas:
+    """
+    Resume varios archivos en paralelo (un proceso por archivo) y combina
+    los resultados parciales en un único acumulador.
+    """
+    total = AcumuladorNotas()
+    if len(rutas) <= 1 or procesos == 1:
+        for ruta in rutas:
+            total.combinar(acumular_archivo(ruta, columna, delimitador, encoding))
+        return total
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        parciales = pool.map(acumular_archivo, rutas, repeat(columna),
+                             repeat(delimitador), repeat(encoding))
+        for parcial in parciales:
+            total.combinar(parcial)
+    return total
+
+
+# -------------------- ESTADÍSTICAS POR GRUPO --------------------
+
+CAMPOS_GRUPO = ("curso", "estudiante")
+RESOLUCION_SKETCH = 0.1                                     # ancho de cubeta del sketch
+CUBETAS_SKETCH = int(round(NOTA_MAX / RESOLUCION_SKETCH)) + 1  # 0.0, 0.1, …, 5.0
+
+
+def _pasos_histograma(ancho: float) -> Tuple[int, int]:
+    """Cubetas del sketch por intervalo y cantidad de intervalos para 'ancho'."""
+    paso = round(ancho / RESOLUCION_SKETCH) if ancho > 0 else 0
+    if paso < 1 or abs(paso * RESOLUCION_SKETCH - ancho) > 1e-9:
+        raise ValueError(f"El ancho del histograma debe ser un múltiplo positivo de "
+                         f"{RESOLUCION_SKETCH} (se recibió {ancho}).")
+    return paso, int(round((NOTA_MAX - NOTA_MIN) / ancho))
+
+
+_CEROS_SKETCH = array("I", [0] * CUBETAS_SKETCH)
+
+
+def leer_registros(ruta: Path, delimitador: str = ",",
+                   encoding: str = "utf-8") -> Iterator[Tuple[str, str, float]]:
+    """
+    Recorre un CSV con encabezado 'curso,estudiante,nota' y devuelve
+    tuplas (curso, estudiante, nota) validadas.
+    """
+    with Path(ruta).open("r", encoding=encoding, newline="") as f:
+        lector = csv.DictReader(f, delimiter=delimitador)
+        faltantes = {"curso", "estudiante", "nota"} - set(lector.fieldnames or [])
+        if faltantes:
+            raise ValueError(f"Faltan columnas: {', '.join(sorted(faltantes))}.")
+        for num, fila in enumerate(lector, start=2):
+            try:
+                nota = convertir_nota(fila["nota"] or "")
+            except ValueError as ex:
+                raise ValueError(f"Línea {num}: {ex}")
+            yield fila["curso"].strip(), fila["estudiante"].strip(), nota
+
+
+class EstadisticasPorGrupo:
+    """
+    Promedio, desviación, menor, mayor, histograma y cuantiles por grupo.
+
+    El estado se guarda en arreglos columnares (una posición por grupo) y
+    cada grupo usa un sketch de tamaño fijo: un conteo por cubeta de 0.1 en
+    la escala 0.0 – 5.0. La memoria depende solo de la cantidad de grupos,
+    no de la cantidad de registros. Con notas de un decimal los cuantiles
+    son exactos; en otro caso el error es como máximo media cubeta (0.05).
+    """
+
+    def __init__(self, por: Sequence[str] = ("curso",)):
+        por = tuple(por)
+        if not por or any(c not in CAMPOS_GRUPO for c in por):
+            raise ValueError("Agrupe por 'curso', 'estudiante' o ambos.")
+        self.por = por
+        self._posiciones = tuple(CAMPOS_GRUPO.index(c) for c in por)
+        self._indices: Dict[Tuple[str, ...], int] = {}
+        self._cantidad = array("q")
+        self._media = array("d")
+        self._m2 = array("d")
+        self._menor = array("d")
+        self._mayor = array("d")
+        self._conteos = array("I")
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def _indice(self, grupo: Tuple[str, ...]) -> int:
+        i = self._indices.get(grupo)
+        if i is None:
+            i = len(self._indices)
+            self._indices[grupo] = i
+            self._cantidad.append(0)
+            self._media.append(0.0)
+            self._m2.append(0.0)
+            self._menor.append(math.inf)
+            self._mayor.append(-math.inf)
+            self._conteos.extend(_CEROS_SKETCH)
+        return i
+
+    def agregar(self, curso: str, estudiante: str, nota: float) -> None:
+        self.agregar_registros(((curso, estudiante, nota),))
+
+    def agregar_registros(self, registros: Iterable[Tuple[str, str, float]]) -> None:
+        """Ingiere registros (curso, estudiante, nota); la nota puede venir como texto."""
+        posiciones = self._posiciones
+        cantidad, media, m2 = self._cantidad, self._media, self._m2
+        menor, mayor, conteos = self._menor, self._mayor, self._conteos
+        for registro in registros:
+            x = registro[2]
+            if isinstance(x, (int, float)):
+                x = float(x)
+                if not (NOTA_MIN <= x <= NOTA_MAX):
+                    raise ValueError("Las notas deben estar entre 0.0 y 5.0.")
+            else:
+                x = convertir_nota(x)                 # '4,0' o texto inválido
+            i = self._indice(tuple(registro[p] for p in posiciones))
+            n = cantidad[i] + 1
+            cantidad[i] = n
+            delta = x - media[i]
+            media[i] += delta / n
+            m2[i] += delta * (x - media[i])
+            if x < menor[i]:
+                menor[i] = x
+            if x > mayor[i]:
+                mayor[i] = x
+            conteos[i * CUBETAS_SKETCH + int(round(x / RESOLUCION_SKETCH))] += 1
+
+    def combinar(self, otro: "EstadisticasPorGrupo") -> "EstadisticasPorGrupo":
+        """Une otro resultado parcial agrupado por los mismos campos."""
+        if otro.por != self.por:
+            raise ValueError("Solo se combinan resultados con la misma agrupación.")
+        for grupo, j in otro._indices.items():
+            i = self._indice(grupo)
+            parcial = AcumuladorNotas(self._cantidad[i], self._media[i], self._m2[i],
+                                      self._menor[i], self._mayor[i])
+            parcial.combinar(otro.acumulador(grupo))
+            self._cantidad[i], self._media[i], self._m2[i] = \
+                parcial.cantidad, parcial.media, parcial.m2
+            self._menor[i], self._mayor[i] = parcial.menor, parcial.mayor
+            a, b = i * CUBETAS_SKETCH, j * CUBETAS_SKETCH
+            for k in range(CUBETAS_SKETCH):
+                self._conteos[a + k] += otro._conteos[b + k]
+        return self
+
+    # ---- consultas ----
+    def grupos(self) -> List[Tuple[str, ...]]:
+        return list(self._indices)
+
+    def acumulador(self, grupo: Tuple[str, ...]) -> AcumuladorNotas:
+        i = self._indices[tuple(grupo)]
+        return AcumuladorNotas(self._cantidad[i], self._media[i], self._m2[i],
+                               self._menor[i], self._mayor[i])
+
+    def cuantil(self, grupo: Tuple[str, ...], p: float) -> float:
+        """Cuantil aproximado (p entre 0 y 100) a partir del sketch."""
+        i = self._indices[tuple(grupo)]
+        base = i * CUBETAS_SKETCH
+        conteos = self._conteos[base:base + CUBETAS_SKETCH]
+        pos = (self._cantidad[i] - 1) * p / 100.0
+        bajo = int(math.floor(pos))
+
+        def valor(rango: int) -> float:
+            acumulado = 0
+            for k, c in enumerate(conteos):
+                acumulado += c
+                if acumulado > rango:
+                    return k * RESOLUCION_SKETCH
+            return NOTA_MAX
+
+        v_bajo = valor(bajo)
+        if pos == bajo:
+            return v_bajo
+        return v_bajo + (valor(bajo + 1) - v_bajo) * (pos - bajo)
+
+    def histograma(self, grupo: Tuple[str, ...], ancho: float = 0.5) -> List[int]:
+        """Conteos por intervalos [0.0, ancho), …, [5.0 - ancho, 5.0]."""
+        paso, cubetas = _pasos_histograma(ancho)
+        i = self._indices[tuple(grupo)]
+        base = i * CUBETAS_SKETCH
+        resultado = [0] * cubetas
+        for k in range(CUBETAS_SKETCH):
+            resultado[min(k // paso, cubetas - 1)] += self._conteos[base + k]
+        return resultado
+
+    def exportar_csv(self, destino, muestral: bool = True,
+                     percentiles: Sequence[int] = (25, 50, 75),
+                     ancho_histograma: float = 0.5) -> None:
+        """Escribe una fila por grupo en 'destino' (ruta o archivo abierto)."""
+        _, cubetas = _pasos_histograma(ancho_histograma)
+        encabezado = list(self.por) + ["cantidad", "promedio", "desviacion",
+                                       "menor", "mayor"]
+        encabezado += [f"p{p}" for p in percentiles]
+        encabezado += [f"h{k * ancho_histograma:.1f}" for k in range(cubetas)]
+
+        def escribir(f) -> None:
+            w = csv.writer(f)
+            w.writerow(encabezado)
+            for grupo in self._indices:
+                acc = self.acumulador(grupo)
+                fila = list(grupo) + [acc.cantidad, f"{acc.promedio:.4f}",
+                                      f"{acc.desviacion(muestral):.4f}",
+                                      f"{acc.menor:.2f}", f"{acc.mayor:.2f}"]
+                fila += [f"{self.cuantil(grupo, p):.2f}" for p in percentiles]
+                fila += self.histograma(grupo, ancho_histograma)
+                w.writerow(fila)
+
+        if hasattr(destino, "write"):
+            escribir(destino)
+        else:
+            with Path(destino).open("w", encoding="utf-8", newline="") as f:
+                escribir(f)
+
+
+# -------------------- BENCHMARK --------------------
+
+def _resumen_statistics(notas: List[float], muestral: bool = True) -> Tuple[float, ...]:
+    """Ruta original de VentanaNotas: cuatro pasadas con el módulo statistics."""
+    prom = sum(notas) / len(notas)
+    if muestral and len(notas) > 1:
+        desv = statistics.stdev(notas)
+    else:
+        desv = statistics.pstdev(notas)
+    return prom, desv, max(notas), min(notas)
+
+
+def generar_notas(n: int, semilla: int = 0) -> List[float]:
+    """Notas sintéticas reproducibles con un decimal."""
+    rng = random.Random(semilla)
+    return [round(rng.uniform(NOTA_MIN, NOTA_MAX), 1) for _ in range(n)]
+
+
+def benchmark(n: int = 10_000_000, semilla: int = 0) -> Dict[str, float]:
+    """Compara la ruta 'statistics' contra el motor (Welford y NumPy)."""
+    notas = generar_notas(n, semilla)
+    tiempos: Dict[str, float] = {}
+
+    t0 = time.perf_counter()
+    _resumen_statistics(notas)
+    tiempos["statistics"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    _resumir_python(notas, True, PERCENTILES)
+    tiempos["welford"] = time.perf_counter() - t0
+
+    np = _numpy()
+    if np is not None:
+        arr = np.asarray(notas, dtype=float)
+        t0 = time.perf_counter()
+        resumir_notas(arr)
+        tiempos["numpy"] = time.perf_counter() - t0
+
+    return tiempos
+
+
+def generar_registros(grupos: int, por_grupo: int = 3,
+                      semilla: int = 0) -> Iterator[Tuple[str, str, float]]:
+    """Registros sintéticos (curso, estudiante, nota) para 'grupos' estudiantes."""
+    rng = random.Random(semilla)
+    for k in range(por_grupo):
+        for g in range(grupos):
+            yield f"C{g % 50:02d}", f"E{g:07d}", round(rng.uniform(NOTA_MIN, NOTA_MAX), 1)
+
+
+def benchmark_grupos(grupos: int = 1_000_000, por_grupo: int = 3,
+                     semilla: int = 0) -> Dict[str, float]:
+    """Agrupa grupos × por_grupo registros por (curso, estudiante) y exporta a CSV."""
+    est = EstadisticasPorGrupo(por=("curso", "estudiante"))
+    tiempos: Dict[str, float] = {}
+
+    t0 = time.perf_counter()
+    est.agregar_registros(generar_registros(grupos, por_grupo, semilla))
+    tiempos["agrupar"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with open(os.devnull, "w", newline="") as f:
+        est.exportar_csv(f)
+    tiempos["exportar"] = time.perf_counter() - t0
+    return tiempos
+
+
+def _fmt(x: float) -> str:
+    return f"{x:.2f}".replace(".", ",")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Estadísticas de notas (0.0 – 5.0).")
+    parser.add_argument("archivos", nargs="*",
+                        help="archivos de notas (una por línea o CSV)")
+    parser.add_argument("--columna", help="columna del CSV (nombre o índice)")
+    parser.add_argument("--delimitador", default=",")
+    parser.add_argument("--poblacional", action="store_true",
+                        help="usar desviación poblacional en vez de muestral")
+    parser.add_argument("--procesos", type=int,
+                        help="procesos para resumir varios archivos en paralelo")
+    parser.add_argument("--por", metavar="CAMPOS",
+                        help="agrupar registros curso,estudiante,nota por "
+                             "'curso', 'estudiante' o 'curso,estudiante'")
+    parser.add_argument("--salida", help="CSV de salida para --por (por defecto stdout)")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="ejecutar benchmark con N notas sintéticas")
+    parser.add_argument("--bench-grupos", type=int, metavar="N",
+                        help="ejecutar benchmark agrupado con N grupos")
+    args = parser.parse_args(argv)
+
+    if args.bench or args.bench_grupos:
+        from benchmarks import ejecutar_informe   # mismo informe que benchmarks.py --informe
+        if args.bench:
+            ejecutar_informe("notas_resumen", n=args.bench)
+        else:
+            ejecutar_informe("notas_grupos", grupos=args.bench_grupos)
+        return
+    if not args.archivos:
+        parser.error("indique uno o más archivos o --bench N")
+
+    if args.por:
+        est = EstadisticasPorGrupo(por=[c.strip() for c in args.por.split(",")])
+        for archivo in args.archivos:
+            est.agregar_registros(leer_registros(Path(archivo), args.delimitador))
+        est.exportar_csv(args.salida or sys.stdout, muestral=not args.poblacional)
+        return
+
+    if len(args.archivos) > 1:
+        # Varios archivos: flujo + combinación de parciales (sin mediana)
+        acc = resumir_archivos([Path(a) for a in args.archivos], args.columna,
+                               args.delimitador, procesos=args.procesos)
+        print(f"Cantidad = {acc.cantidad}")
+        print(f"Promedio = {_fmt(acc.promedio)}")
+        print(f"Desviación estándar = {_fmt(acc.desviacion(not args.poblacional))}")
+        print(f"Valor mayor = {_fmt(acc.mayor)}")
+        print(f"Valor menor = {_fmt(acc.menor)}")
+        return
+
+    notas = leer_notas(Path(args.archivos[0]), args.columna, args.delimitador)
+    r = resumir_notas(notas, muestral=not args.poblacional)
+    print(f"Cantidad = {r.cantidad}")
+    print(f"Promedio = {_fmt(r.promedio)}")
+    print(f"Desviación estándar = {_fmt(r.desviacion)}")
+    print(f"Valor mayor = {_fmt(r.mayor)}")
+    print(f"Valor menor = {_fmt(r.menor)}")
+    print(f"Mediana = {_fmt(r.mediana)}")
+    for p, v in r.percentiles.items():
+        print(f"Percentil {p} = {_fmt(v)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# opcionales.py
+# Dependencias opcionales que se importan la primera vez que hacen falta,
+# para que los modelos arranquen rápido y funcionen aunque no estén instaladas.
+
+_np = False   # False = aún no se intentó importar; None = no está instalado
+
+
+def numpy():
+    """Devuelve el módulo numpy (opcional: pip install numpy) o None si no está."""
+    global _np
+    if _np is False:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = None
+    return _np
@@ -0,0 +1,160 @@
+# test_ejecutor.py
+# Avance, cancelación, unión por clave y latencia del bucle de EjecutorTareas
+# en el pool de hilos y en el de procesos. Un bucle de after() falso
+# reemplaza a Tk (no hace falta pantalla).
+#
+#   python -m unittest test_ejecutor        (o python -m pytest test_ejecutor.py)
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from ejecutor import Cancelada, EjecutorTareas
+from lector import LeerArchivo
+
+LIMITE_S = 20
+LATENCIA_MAX_S = 0.25     # peor espera aceptable entre dos tics del bucle
+
+
+class RaizFalsa:
+    """Imita after()/after_cancel() de un widget de Tk."""
+    def __init__(self):
+        self._programados = []
+
+    def after(self, _ms, funcion):
+        self._programados.append(funcion)
+        return len(self._programados)
+
+    def after_cancel(self, _id):
+        pass
+
+    def procesar_hasta(self, condicion) -> None:
+        limite = time.monotonic() + LIMITE_S
+        while not condicion():
+            if time.monotonic() > limite:
+                raise AssertionError("la tarea no terminó a tiempo")
+            programados, self._programados = self._programados, []
+            for funcion in programados:
+                funcion()
+            time.sleep(0.01)
+
+
+# Funciones de nivel de módulo: el pool de procesos las recibe por pickle
+
+def contar_con_avance(pasos, control):
+    for k in range(1, pasos + 1):
+        control.verificar()
+        control.progreso(k / pasos, f"paso {k}")
+    return pasos
+
+
+def esperar_cancelacion(control):
+    control.progreso(0.0, "iniciada")
+    limite = time.monotonic() + LIMITE_S
+    while time.monotonic() < limite:
+        control.verificar()
+        time.sleep(0.01)
+    return "no se canceló"
+
+
+def esperar_evento(evento, llamadas):
+    llamadas.append(1)
+    evento.wait(LIMITE_S)
+    return len(llamadas)
+
+
+class PruebaEjecutor(unittest.TestCase):
+    def setUp(self):
+        self.raiz = RaizFalsa()
+        self.ejecutor = EjecutorTareas(self.raiz)
+
+    def tearDown(self):
+        self.ejecutor.cerrar()
+
+    def test_avance(self):
+        for en_proceso in (False, True):
+            with self.subTest(en_proceso=en_proceso):
+                avances, resultados = [], []
+                self.ejecutor.enviar(
+                    contar_con_avance, 5, con_control=True, en_proceso=en_proceso,
+                    al_progresar=lambda f, m: avances.append((f, m)),
+                    al_terminar=resultados.append, al_fallar=self.fail)
+                self.raiz.procesar_hasta(lambda: resultados)
+                self.assertEqual(resultados, [5])
+                self.assertEqual(avances, [(k / 5, f"paso {k}") for k in range(1, 6)])
+
+    def test_cancelacion(self):
+        for en_proceso in (False, True):
+            with self.subTest(en_proceso=en_proceso):
+                avances, entregas = [], []
+                tarea = self.ejecutor.enviar(
+                    esperar_cancelacion, con_control=True, en_proceso=en_proceso,
+                    al_progresar=lambda f, m: avances.append(m),
+                    al_terminar=entregas.append, al_fallar=entregas.append)
+                self.raiz.procesar_hasta(lambda: avances)     # ya está corriendo
+                inicio = time.monotonic()
+                tarea.cancelar()
+                self.raiz.procesar_hasta(lambda: tarea.terminada)
+                self.assertLess(time.monotonic() - inicio, LIMITE_S / 2)
+                self.assertIsInstance(tarea.futuro.exception(), Cancelada)
+                self.raiz.procesar_hasta(lambda: not self.ejecutor._pendientes)
+                self.assertEqual(entregas, [])                # sin callbacks tras cancelar
+
+    def test_une_por_clave(self):
+        evento, llamadas, resultados = threading.Event(), [], []
+        primera = self.ejecutor.enviar(esperar_evento, evento, llamadas, clave="leer",
+                                       al_terminar=resultados.append)
+        segunda = self.ejecutor.enviar(esperar_evento, evento, llamadas, clave="leer",
+                                       al_terminar=resultados.append)
+        otra = self.ejecutor.enviar(esperar_evento, evento, llamadas, clave="otra")
+        self.assertIs(segunda, primera)               # doble clic: una sola tarea
+        self.assertIsNot(otra, primera)
+        self.assertTrue(self.ejecutor.en_curso("leer"))
+
+        evento.set()
+        self.raiz.procesar_hasta(lambda: not self.ejecutor._pendientes)
+        self.assertEqual(len(llamadas), 2)           # "leer" y "otra"
+        self.assertEqual(len(resultados), 1)
+        self.assertFalse(self.ejecutor.en_curso("leer"))
+
+        # terminada o cancelada, la clave admite una tarea nueva
+        tercera = self.ejecutor.enviar(esperar_evento, evento, llamadas, clave="leer")
+        self.assertIsNot(tercera, primera)
+        bloqueo = threading.Event()
+        cuarta = self.ejecutor.enviar(esperar_evento, bloqueo, llamadas, clave="lenta")
+        cuarta.cancelar()
+        quinta = self.ejecutor.enviar(esperar_evento, evento, llamadas, clave="lenta")
+        self.assertIsNot(quinta, cuarta)
+        bloqueo.set()
+        self.raiz.procesar_hasta(lambda: not self.ejecutor._pendientes)
+
+    def test_latencia_durante_lectura(self):
+        # Mientras un hilo lee un archivo grande, los tics de after() del hilo
+        # de la interfaz no deben esperar más de LATENCIA_MAX_S.
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = Path(tmp) / "grande.txt"
+            with ruta.open("w", encoding="utf-8") as f:
+                for i in range(400_000):
+                    f.write(f"{i} línea de prueba con tildes: acción, niño, lectura\n")
+            tics, resultado = [], []
+
+            def tic():
+                tics.append(time.monotonic())
+                if not resultado:
+                    self.raiz.after(10, tic)
+
+            self.raiz.after(10, tic)
+            self.ejecutor.enviar(LeerArchivo(ruta).leer_todo, con_control=True,
+                                 al_terminar=resultado.append, al_fallar=self.fail)
+            self.raiz.procesar_hasta(lambda: resultado)
+
+        self.assertEqual(resultado[0].count("\n"), 400_000)
+        self.assertGreater(len(tics), 2)
+        retraso = max(b - a for a, b in zip(tics, tics[1:]))
+        self.assertLess(retraso, LATENCIA_MAX_S)
+
+
+if __name__ == "__main__":
+    unittest.main()